@@ -0,0 +1,720 @@
+"""Backends holding the data of the in-process redis server."""
+
+import fnmatch
+import inspect
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Protocol, Sequence, Set, Tuple, Union
+
+from pytest_redis.resp import ErrorReply, ReplyType, SimpleString
+
+OK = SimpleString("OK")
+
+INPROC_REDIS_VERSION = "7.0.0"
+"""
+Redis version, which commands the in-process server mimics, reported by INFO.
+"""
+
+WRONGTYPE = "WRONGTYPE Operation against a key holding the wrong kind of value"
+NOT_INTEGER = "ERR value is not an integer or out of range"
+NOT_FLOAT = "ERR value is not a valid float"
+SYNTAX_ERROR = "ERR syntax error"
+
+
+class BackendType(Protocol):
+    """Backend executing data commands of the in-process redis server.
+
+    Connection commands (AUTH, SELECT, CLIENT, MULTI, EXEC, WATCH, QUIT)
+    are handled by the server itself, all the others are passed to the backend.
+    Backend is used by the server's thread only.
+    """
+
+    databases: int
+
+    def execute(self, db: int, command: List[bytes]) -> ReplyType:
+        """Execute command on the database, raising ErrorReply if it fails.
+
+        :param db: number of the database selected by the client
+        :param command: command's name and its arguments
+        :returns: command's reply
+        """
+
+    def key_version(self, db: int, key: bytes) -> int:
+        """Return number, which changes each time the key gets modified, for WATCH."""
+
+
+class SortedSet(Dict[bytes, float]):
+    """Sorted set's members with their scores."""
+
+    def ranked(self) -> List[Tuple[bytes, float]]:
+        """Return members with their scores, ordered by the score, then by the member."""
+        return sorted(self.items(), key=lambda item: (item[1], item[0]))
+
+
+ValueType = Union[bytes, Dict[bytes, bytes], List[bytes], Set[bytes], SortedSet]
+
+TYPE_NAMES: Tuple[Tuple[type, str], ...] = (
+    (bytes, "string"),
+    (SortedSet, "zset"),
+    (dict, "hash"),
+    (list, "list"),
+    (set, "set"),
+)
+
+
+def type_name(value: ValueType) -> str:
+    """Return redis type name of the value."""
+    for value_type, name in TYPE_NAMES:
+        if isinstance(value, value_type):
+            return name
+    raise TypeError(f"Unknown value type: {type(value)}")
+
+
+def to_int(arg: bytes) -> int:
+    """Parse integer argument, the way redis does."""
+    try:
+        return int(arg)
+    except ValueError as error:
+        raise ErrorReply(NOT_INTEGER) from error
+
+
+def to_float(arg: bytes) -> float:
+    """Parse float argument, the way redis does, including inf and -inf."""
+    try:
+        return float(arg)
+    except ValueError as error:
+        raise ErrorReply(NOT_FLOAT) from error
+
+
+def format_float(value: float) -> bytes:
+    """Format float the way redis replies with it, e.g. 1 rather than 1.0."""
+    return f"{value:.17g}".encode()
+
+
+class Database:
+    """Keys of a single database, along with their expiry times."""
+
+    def __init__(self) -> None:
+        """Initialize empty Database."""
+        self.data: Dict[bytes, ValueType] = {}
+        self.expires: Dict[bytes, float] = {}
+
+
+class DictBackend:
+    """Backend keeping the data in python dictionaries, supporting the common command subset.
+
+    Each command is a ``cmd_<name>`` method, taking the database number
+    and the command's arguments. Subclass it to add more commands.
+    Keys' expiry is checked lazily, whenever the key is accessed.
+    """
+
+    def __init__(self, databases: int = 16) -> None:
+        """Initialize DictBackend.
+
+        :param databases: number of databases
+        """
+        self.databases = databases
+        self.dbs = [Database() for _ in range(databases)]
+        self.changes = 0
+        self.versions: Dict[Tuple[int, bytes], int] = {}
+        self.flushed = [0] * databases
+        self.stats: Dict[str, int] = {
+            "total_commands_processed": 0,
+            "keyspace_hits": 0,
+            "keyspace_misses": 0,
+            "expired_keys": 0,
+            "evicted_keys": 0,
+            "total_error_replies": 0,
+        }
+        self.command_stats: Dict[str, List[int]] = {}
+        self.config: Dict[bytes, bytes] = {b"maxmemory": b"0", b"notify-keyspace-events": b""}
+        self._signatures: Dict[str, inspect.Signature] = {}
+
+    def execute(self, db: int, command: List[bytes]) -> ReplyType:
+        """Execute command on the database, raising ErrorReply if it fails."""
+        name = command[0].decode(errors="replace").lower()
+        method: Optional[Callable[..., ReplyType]] = getattr(self, f"cmd_{name}", None)
+        if method is None:
+            self.stats["total_error_replies"] += 1
+            raise ErrorReply(f"ERR unknown command '{name}'")
+        if name not in self._signatures:
+            self._signatures[name] = inspect.signature(method)
+        try:
+            self._signatures[name].bind(db, *command[1:])
+        except TypeError as error:
+            self.stats["total_error_replies"] += 1
+            raise ErrorReply(f"ERR wrong number of arguments for '{name}' command") from error
+        started_at = time.perf_counter()
+        try:
+            return method(db, *command[1:])
+        except ErrorReply:
+            self.stats["total_error_replies"] += 1
+            raise
+        finally:
+            stats = self.command_stats.setdefault(name, [0, 0])
+            stats[0] += 1
+            stats[1] += int((time.perf_counter() - started_at) * 1_000_000)
+            self.stats["total_commands_processed"] += 1
+
+    def key_version(self, db: int, key: bytes) -> int:
+        """Return number, which changes each time the key gets modified, for WATCH."""
+        return max(self.versions.get((db, key), 0), self.flushed[db])
+
+    def touch(self, db: int, key: bytes) -> None:
+        """Mark the key as modified, invalidating transactions WATCHing it."""
+        self.changes += 1
+        self.versions[(db, key)] = self.changes
+
+    def lookup(self, db: int, key: bytes) -> Optional[ValueType]:
+        """Return the key's value, or None if there's no such key, or it has expired."""
+        database = self.dbs[db]
+        expires_at = database.expires.get(key)
+        if expires_at is not None and expires_at <= time.time():
+            del database.data[key]
+            del database.expires[key]
+            self.stats["expired_keys"] += 1
+            self.touch(db, key)
+        return database.data.get(key)
+
+    def read(self, db: int, key: bytes, kind: type) -> Optional[Any]:
+        """Return the key's value of the given type, counting keyspace hits and misses."""
+        value = self.lookup(db, key)
+        self.stats["keyspace_hits" if value is not None else "keyspace_misses"] += 1
+        if value is not None and type(value) is not kind:
+            raise ErrorReply(WRONGTYPE)
+        return value
+
+    def write(self, db: int, key: bytes, kind: Callable[[], ValueType]) -> Any:
+        """Return the key's value of the given type to modify, creating it if needed."""
+        value = self.lookup(db, key)
+        if value is None:
+            value = self.dbs[db].data[key] = kind()
+        elif type(value) is not kind:
+            raise ErrorReply(WRONGTYPE)
+        self.touch(db, key)
+        return value
+
+    def store(self, db: int, key: bytes, value: ValueType, keep_ttl: bool = False) -> None:
+        """Set the key's value, replacing the old one along with its expiry time."""
+        database = self.dbs[db]
+        database.data[key] = value
+        if not keep_ttl:
+            database.expires.pop(key, None)
+        self.touch(db, key)
+
+    def delete(self, db: int, key: bytes) -> bool:
+        """Delete the key, returning True if it existed."""
+        if self.lookup(db, key) is None:
+            return False
+        database = self.dbs[db]
+        del database.data[key]
+        database.expires.pop(key, None)
+        self.touch(db, key)
+        return True
+
+    def prune(self, db: int, key: bytes) -> None:
+        """Delete the key if its collection got empty, the way redis does."""
+        if not self.dbs[db].data.get(key, True):
+            self.delete(db, key)
+
+    def live_keys(self, db: int) -> List[bytes]:
+        """Return keys of the database, which haven't expired yet."""
+        return [key for key in list(self.dbs[db].data) if self.lookup(db, key) is not None]
+
+    # server and keyspace commands
+
+    def cmd_ping(self, db: int, message: Optional[bytes] = None) -> ReplyType:
+        """PING [message]."""
+        return SimpleString("PONG") if message is None else message
+
+    def cmd_echo(self, db: int, message: bytes) -> ReplyType:
+        """ECHO message."""
+        return message
+
+    def cmd_time(self, db: int) -> ReplyType:
+        """TIME."""
+        now = time.time()
+        return [str(int(now)).encode(), str(int(now % 1 * 1_000_000)).encode()]
+
+    def cmd_dbsize(self, db: int) -> ReplyType:
+        """DBSIZE."""
+        return len(self.live_keys(db))
+
+    def cmd_flushdb(self, db: int, *mode: bytes) -> ReplyType:
+        """FLUSHDB [ASYNC|SYNC]."""
+        self.dbs[db] = Database()
+        self.versions = {key: version for key, version in self.versions.items() if key[0] != db}
+        self.changes += 1
+        self.flushed[db] = self.changes
+        return OK
+
+    def cmd_flushall(self, db: int, *mode: bytes) -> ReplyType:
+        """FLUSHALL [ASYNC|SYNC]."""
+        for index in range(self.databases):
+            self.cmd_flushdb(index)
+        return OK
+
+    def cmd_config(self, db: int, subcommand: bytes, *args: bytes) -> ReplyType:
+        """CONFIG GET parameter, CONFIG SET parameter value, CONFIG RESETSTAT."""
+        subcommand = subcommand.lower()
+        if subcommand == b"get" and len(args) == 1:
+            return [
+                item
+                for name, value in self.config.items()
+                if fnmatch.fnmatchcase(name, args[0].lower())
+                for item in (name, value)
+            ]
+        if subcommand == b"set" and len(args) == 2:
+            self.config[args[0].lower()] = args[1]
+            return OK
+        if subcommand == b"resetstat" and not args:
+            self.stats = dict.fromkeys(self.stats, 0)
+            self.command_stats.clear()
+            return OK
+        raise ErrorReply(f"ERR unknown subcommand or wrong number of arguments for {subcommand!r}")
+
+    def cmd_slowlog(self, db: int, subcommand: bytes, *args: bytes) -> ReplyType:
+        """SLOWLOG GET|LEN|RESET, in-process server logs no slow commands."""
+        subcommand = subcommand.lower()
+        if subcommand == b"get":
+            return []
+        if subcommand == b"len":
+            return 0
+        if subcommand == b"reset":
+            return OK
+        raise ErrorReply(f"ERR unknown subcommand {subcommand!r}")
+
+    def cmd_info(self, db: int, *sections: bytes) -> ReplyType:
+        """INFO [section ...], with server, memory, stats, commandstats and keyspace sections."""
+        requested = {section.lower().decode() for section in sections} or {"default"}
+        everything = bool(requested & {"all", "everything", "default"})
+        lines: List[str] = []
+        for section, fields in self.info_sections(everything or "commandstats" in requested):
+            if everything or section.lower() in requested:
+                lines.append(f"# {section}")
+                lines.extend(f"{name}:{value}" for name, value in fields.items())
+                lines.append("")
+        return "\r\n".join(lines).encode()
+
+    def info_sections(self, commandstats: bool) -> List[Tuple[str, Dict[str, Any]]]:
+        """Return INFO sections, with their fields."""
+        sections: List[Tuple[str, Dict[str, Any]]] = [
+            ("Server", {"redis_version": INPROC_REDIS_VERSION, "redis_mode": "standalone"}),
+            ("Memory", {"used_memory": self.used_memory()}),
+            ("Stats", self.stats),
+        ]
+        if commandstats:
+            sections.append(
+                (
+                    "Commandstats",
+                    {
+                        f"cmdstat_{name}": f"calls={calls},usec={usec},"
+                        f"usec_per_call={usec / calls:.2f}"
+                        for name, (calls, usec) in sorted(self.command_stats.items())
+                    },
+                )
+            )
+        keyspace = {}
+        for index in range(self.databases):
+            if keys := self.live_keys(index):
+                expires = len(self.dbs[index].expires)
+                keyspace[f"db{index}"] = f"keys={len(keys)},expires={expires},avg_ttl=0"
+        sections.append(("Keyspace", keyspace))
+        return sections
+
+    def used_memory(self) -> int:
+        """Estimate memory used by the data, as the python objects' size."""
+        size = 0
+        for database in self.dbs:
+            for key, value in database.data.items():
+                size += sys.getsizeof(key) + sys.getsizeof(value)
+                if not isinstance(value, bytes):
+                    size += sum(sys.getsizeof(item) for item in value)
+        return size
+
+    def cmd_exists(self, db: int, *keys: bytes) -> ReplyType:
+        """EXISTS key [key ...]."""
+        if not keys:
+            raise ErrorReply("ERR wrong number of arguments for 'exists' command")
+        return sum(self.lookup(db, key) is not None for key in keys)
+
+    def cmd_del(self, db: int, key: bytes, *keys: bytes) -> ReplyType:
+        """DEL key [key ...]."""
+        return sum(self.delete(db, name) for name in (key, *keys))
+
+    cmd_unlink = cmd_del
+
+    def cmd_type(self, db: int, key: bytes) -> ReplyType:
+        """TYPE key."""
+        value = self.lookup(db, key)
+        return SimpleString("none" if value is None else type_name(value))
+
+    def cmd_keys(self, db: int, pattern: bytes) -> ReplyType:
+        """KEYS pattern."""
+        return [key for key in self.live_keys(db) if fnmatch.fnmatchcase(key, pattern)]
+
+    def cmd_scan(self, db: int, cursor: bytes, *args: bytes) -> ReplyType:
+        """SCAN cursor [MATCH pattern] [COUNT count] [TYPE type]."""
+        options = self.options(args, (b"match", b"count", b"type"))
+        start = to_int(cursor)
+        count = to_int(options.get(b"count", b"10"))
+        keys = sorted(self.live_keys(db))
+        batch = keys[start : start + count]
+        next_cursor = start + count if start + count < len(keys) else 0
+        if b"match" in options:
+            batch = [key for key in batch if fnmatch.fnmatchcase(key, options[b"match"])]
+        if b"type" in options:
+            kind = options[b"type"].decode().lower()
+            batch = [key for key in batch if type_name(self.dbs[db].data[key]) == kind]
+        return [str(next_cursor).encode(), batch]
+
+    @staticmethod
+    def options(args: Sequence[bytes], names: Sequence[bytes]) -> Dict[bytes, bytes]:
+        """Parse command's ``NAME value`` options."""
+        if len(args) % 2:
+            raise ErrorReply(SYNTAX_ERROR)
+        options = {name.lower(): value for name, value in zip(args[::2], args[1::2])}
+        if set(options) - set(names):
+            raise ErrorReply(SYNTAX_ERROR)
+        return options
+
+    def cmd_rename(self, db: int, key: bytes, new_key: bytes) -> ReplyType:
+        """RENAME key newkey."""
+        value = self.lookup(db, key)
+        if value is None:
+            raise ErrorReply("ERR no such key")
+        expires_at = self.dbs[db].expires.get(key)
+        self.delete(db, key)
+        self.store(db, new_key, value)
+        if expires_at is not None:
+            self.dbs[db].expires[new_key] = expires_at
+        return OK
+
+    def cmd_expire(self, db: int, key: bytes, seconds: bytes) -> ReplyType:
+        """EXPIRE key seconds."""
+        return self.expire_at(db, key, time.time() + to_int(seconds))
+
+    def cmd_pexpire(self, db: int, key: bytes, milliseconds: bytes) -> ReplyType:
+        """PEXPIRE key milliseconds."""
+        return self.expire_at(db, key, time.time() + to_int(milliseconds) / 1000)
+
+    def expire_at(self, db: int, key: bytes, timestamp: float) -> int:
+        """Set the key's expiry time, returning 1 if the key exists."""
+        if self.lookup(db, key) is None:
+            return 0
+        self.dbs[db].expires[key] = timestamp
+        self.touch(db, key)
+        self.lookup(db, key)
+        return 1
+
+    def cmd_ttl(self, db: int, key: bytes) -> ReplyType:
+        """TTL key."""
+        ttl = self.cmd_pttl(db, key)
+        return ttl if ttl < 0 else round(ttl / 1000)
+
+    def cmd_pttl(self, db: int, key: bytes) -> int:
+        """PTTL key."""
+        if self.lookup(db, key) is None:
+            return -2
+        expires_at = self.dbs[db].expires.get(key)
+        if expires_at is None:
+            return -1
+        return max(int((expires_at - time.time()) * 1000), 0)
+
+    def cmd_persist(self, db: int, key: bytes) -> ReplyType:
+        """PERSIST key."""
+        if self.lookup(db, key) is None or key not in self.dbs[db].expires:
+            return 0
+        del self.dbs[db].expires[key]
+        self.touch(db, key)
+        return 1
+
+    # strings
+
+    def cmd_get(self, db: int, key: bytes) -> ReplyType:
+        """GET key."""
+        value: Optional[bytes] = self.read(db, key, bytes)
+        return value
+
+    def cmd_set(self, db: int, key: bytes, value: bytes, *args: bytes) -> ReplyType:
+        """SET key value [NX|XX] [GET] [EX seconds|PX milliseconds|KEEPTTL]."""
+        flags: Set[bytes] = set()
+        expires_at: Optional[float] = None
+        arguments = iter(args)
+        for arg in arguments:
+            flag = arg.lower()
+            if flag in (b"ex", b"px"):
+                amount = to_int(next(arguments, b""))
+                if amount <= 0:
+                    raise ErrorReply("ERR invalid expire time in 'set' command")
+                expires_at = time.time() + (amount if flag == b"ex" else amount / 1000)
+            elif flag in (b"nx", b"xx", b"get", b"keepttl"):
+                flags.add(flag)
+            else:
+                raise ErrorReply(SYNTAX_ERROR)
+        old_value: Optional[bytes] = self.read(db, key, bytes) if b"get" in flags else None
+        exists = self.lookup(db, key) is not None
+        if (b"nx" in flags and exists) or (b"xx" in flags and not exists):
+            return old_value
+        self.store(db, key, value, keep_ttl=b"keepttl" in flags)
+        if expires_at is not None:
+            self.dbs[db].expires[key] = expires_at
+        return old_value if b"get" in flags else OK
+
+    def cmd_setnx(self, db: int, key: bytes, value: bytes) -> ReplyType:
+        """SETNX key value."""
+        return int(self.cmd_set(db, key, value, b"NX") is not None)
+
+    def cmd_setex(self, db: int, key: bytes, seconds: bytes, value: bytes) -> ReplyType:
+        """SETEX key seconds value."""
+        return self.cmd_set(db, key, value, b"EX", seconds)
+
+    def cmd_getdel(self, db: int, key: bytes) -> ReplyType:
+        """GETDEL key."""
+        value: Optional[bytes] = self.read(db, key, bytes)
+        if value is not None:
+            self.delete(db, key)
+        return value
+
+    def cmd_mget(self, db: int, key: bytes, *keys: bytes) -> ReplyType:
+        """MGET key [key ...]."""
+        values = [self.lookup(db, name) for name in (key, *keys)]
+        return [value if isinstance(value, bytes) else None for value in values]
+
+    def cmd_mset(self, db: int, *args: bytes) -> ReplyType:
+        """MSET key value [key value ...]."""
+        if not args or len(args) % 2:
+            raise ErrorReply("ERR wrong number of arguments for 'mset' command")
+        for key, value in zip(args[::2], args[1::2]):
+            self.store(db, key, value)
+        return OK
+
+    def cmd_incrby(self, db: int, key: bytes, increment: bytes) -> ReplyType:
+        """INCRBY key increment."""
+        value = to_int(self.read(db, key, bytes) or b"0") + to_int(increment)
+        self.store(db, key, str(value).encode(), keep_ttl=True)
+        return value
+
+    def cmd_incr(self, db: int, key: bytes) -> ReplyType:
+        """INCR key."""
+        return self.cmd_incrby(db, key, b"1")
+
+    def cmd_decrby(self, db: int, key: bytes, decrement: bytes) -> ReplyType:
+        """DECRBY key decrement."""
+        return self.cmd_incrby(db, key, str(-to_int(decrement)).encode())
+
+    def cmd_decr(self, db: int, key: bytes) -> ReplyType:
+        """DECR key."""
+        return self.cmd_incrby(db, key, b"-1")
+
+    def cmd_incrbyfloat(self, db: int, key: bytes, increment: bytes) -> ReplyType:
+        """INCRBYFLOAT key increment."""
+        value = format_float(to_float(self.read(db, key, bytes) or b"0") + to_float(increment))
+        self.store(db, key, value, keep_ttl=True)
+        return value
+
+    def cmd_append(self, db: int, key: bytes, value: bytes) -> ReplyType:
+        """APPEND key value."""
+        new_value = (self.read(db, key, bytes) or b"") + value
+        self.store(db, key, new_value, keep_ttl=True)
+        return len(new_value)
+
+    def cmd_strlen(self, db: int, key: bytes) -> ReplyType:
+        """STRLEN key."""
+        return len(self.read(db, key, bytes) or b"")
+
+    # hashes
+
+    def cmd_hset(self, db: int, key: bytes, *args: bytes) -> ReplyType:
+        """HSET key field value [field value ...]."""
+        if not args or len(args) % 2:
+            raise ErrorReply("ERR wrong number of arguments for 'hset' command")
+        hash_value: Dict[bytes, bytes] = self.write(db, key, dict)
+        added = sum(field not in hash_value for field in args[::2])
+        hash_value.update(zip(args[::2], args[1::2]))
+        return added
+
+    def cmd_hmset(self, db: int, key: bytes, *args: bytes) -> ReplyType:
+        """HMSET key field value [field value ...]."""
+        self.cmd_hset(db, key, *args)
+        return OK
+
+    def cmd_hsetnx(self, db: int, key: bytes, field: bytes, value: bytes) -> ReplyType:
+        """HSETNX key field value."""
+        if field in (self.read(db, key, dict) or {}):
+            return 0
+        return self.cmd_hset(db, key, field, value)
+
+    def cmd_hget(self, db: int, key: bytes, field: bytes) -> ReplyType:
+        """HGET key field."""
+        return (self.read(db, key, dict) or {}).get(field)
+
+    def cmd_hmget(self, db: int, key: bytes, field: bytes, *fields: bytes) -> ReplyType:
+        """HMGET key field [field ...]."""
+        hash_value = self.read(db, key, dict) or {}
+        return [hash_value.get(name) for name in (field, *fields)]
+
+    def cmd_hgetall(self, db: int, key: bytes) -> ReplyType:
+        """HGETALL key."""
+        return [item for pair in (self.read(db, key, dict) or {}).items() for item in pair]
+
+    def cmd_hkeys(self, db: int, key: bytes) -> ReplyType:
+        """HKEYS key."""
+        return list(self.read(db, key, dict) or {})
+
+    def cmd_hvals(self, db: int, key: bytes) -> ReplyType:
+        """HVALS key."""
+        return list((self.read(db, key, dict) or {}).values())
+
+    def cmd_hlen(self, db: int, key: bytes) -> ReplyType:
+        """HLEN key."""
+        return len(self.read(db, key, dict) or {})
+
+    def cmd_hexists(self, db: int, key: bytes, field: bytes) -> ReplyType:
+        """HEXISTS key field."""
+        return int(field in (self.read(db, key, dict) or {}))
+
+    def cmd_hdel(self, db: int, key: bytes, field: bytes, *fields: bytes) -> ReplyType:
+        """HDEL key field [field ...]."""
+        if self.read(db, key, dict) is None:
+            return 0
+        hash_value: Dict[bytes, bytes] = self.write(db, key, dict)
+        removed = sum(hash_value.pop(name, None) is not None for name in (field, *fields))
+        self.prune(db, key)
+        return removed
+
+    def cmd_hincrby(self, db: int, key: bytes, field: bytes, increment: bytes) -> ReplyType:
+        """HINCRBY key field increment."""
+        hash_value: Dict[bytes, bytes] = self.write(db, key, dict)
+        value = to_int(hash_value.get(field, b"0")) + to_int(increment)
+        hash_value[field] = str(value).encode()
+        return value
+
+    # lists
+
+    def cmd_lpush(self, db: int, key: bytes, element: bytes, *elements: bytes) -> ReplyType:
+        """LPUSH key element [element ...]."""
+        list_value: List[bytes] = self.write(db, key, list)
+        list_value[:0] = reversed((element, *elements))
+        return len(list_value)
+
+    def cmd_rpush(self, db: int, key: bytes, element: bytes, *elements: bytes) -> ReplyType:
+        """RPUSH key element [element ...]."""
+        list_value: List[bytes] = self.write(db, key, list)
+        list_value.extend((element, *elements))
+        return len(list_value)
+
+    def cmd_lpop(self, db: int, key: bytes, count: Optional[bytes] = None) -> ReplyType:
+        """LPOP key [count]."""
+        return self.pop(db, key, count, 0)
+
+    def cmd_rpop(self, db: int, key: bytes, count: Optional[bytes] = None) -> ReplyType:
+        """RPOP key [count]."""
+        return self.pop(db, key, count, -1)
+
+    def pop(self, db: int, key: bytes, count: Optional[bytes], index: int) -> ReplyType:
+        """Pop the element(s) from the list's head (index 0) or tail (index -1)."""
+        if self.read(db, key, list) is None:
+            return None
+        list_value: List[bytes] = self.write(db, key, list)
+        popped = [list_value.pop(index) for _ in range(min(to_int(count or b"1"), len(list_value)))]
+        self.prune(db, key)
+        return popped if count is not None else popped[0]
+
+    def cmd_llen(self, db: int, key: bytes) -> ReplyType:
+        """LLEN key."""
+        return len(self.read(db, key, list) or [])
+
+    def cmd_lindex(self, db: int, key: bytes, index: bytes) -> ReplyType:
+        """LINDEX key index."""
+        list_value = self.read(db, key, list) or []
+        position = to_int(index)
+        return list_value[position] if -len(list_value) <= position < len(list_value) else None
+
+    def cmd_lrange(self, db: int, key: bytes, start: bytes, stop: bytes) -> ReplyType:
+        """LRANGE key start stop."""
+        return self.slice(self.read(db, key, list) or [], start, stop)
+
+    @staticmethod
+    def slice(values: Sequence[Any], start: bytes, stop: bytes) -> List[Any]:
+        """Return values from start to stop inclusive, counting negative indexes from the end."""
+        first, last = to_int(start), to_int(stop)
+        first = max(first + len(values) if first < 0 else first, 0)
+        last = last + len(values) if last < 0 else last
+        return list(values[first : last + 1])
+
+    # sets
+
+    def cmd_sadd(self, db: int, key: bytes, member: bytes, *members: bytes) -> ReplyType:
+        """SADD key member [member ...]."""
+        set_value: Set[bytes] = self.write(db, key, set)
+        size = len(set_value)
+        set_value.update((member, *members))
+        return len(set_value) - size
+
+    def cmd_srem(self, db: int, key: bytes, member: bytes, *members: bytes) -> ReplyType:
+        """SREM key member [member ...]."""
+        if self.read(db, key, set) is None:
+            return 0
+        set_value: Set[bytes] = self.write(db, key, set)
+        size = len(set_value)
+        set_value.difference_update((member, *members))
+        self.prune(db, key)
+        return size - len(set_value)
+
+    def cmd_smembers(self, db: int, key: bytes) -> ReplyType:
+        """SMEMBERS key."""
+        return list(self.read(db, key, set) or ())
+
+    def cmd_sismember(self, db: int, key: bytes, member: bytes) -> ReplyType:
+        """SISMEMBER key member."""
+        return int(member in (self.read(db, key, set) or ()))
+
+    def cmd_scard(self, db: int, key: bytes) -> ReplyType:
+        """SCARD key."""
+        return len(self.read(db, key, set) or ())
+
+    # sorted sets
+
+    def cmd_zadd(self, db: int, key: bytes, *args: bytes) -> ReplyType:
+        """ZADD key score member [score member ...]."""
+        if not args or len(args) % 2:
+            raise ErrorReply(SYNTAX_ERROR)
+        scores = [to_float(score) for score in args[::2]]
+        sorted_set: SortedSet = self.write(db, key, SortedSet)
+        added = sum(member not in sorted_set for member in args[1::2])
+        sorted_set.update(zip(args[1::2], scores))
+        return added
+
+    def cmd_zincrby(self, db: int, key: bytes, increment: bytes, member: bytes) -> ReplyType:
+        """ZINCRBY key increment member."""
+        sorted_set: SortedSet = self.write(db, key, SortedSet)
+        sorted_set[member] = sorted_set.get(member, 0.0) + to_float(increment)
+        return format_float(sorted_set[member])
+
+    def cmd_zscore(self, db: int, key: bytes, member: bytes) -> ReplyType:
+        """ZSCORE key member."""
+        score = (self.read(db, key, SortedSet) or {}).get(member)
+        return None if score is None else format_float(score)
+
+    def cmd_zcard(self, db: int, key: bytes) -> ReplyType:
+        """ZCARD key."""
+        return len(self.read(db, key, SortedSet) or {})
+
+    def cmd_zrem(self, db: int, key: bytes, member: bytes, *members: bytes) -> ReplyType:
+        """ZREM key member [member ...]."""
+        if self.read(db, key, SortedSet) is None:
+            return 0
+        sorted_set: SortedSet = self.write(db, key, SortedSet)
+        removed = sum(sorted_set.pop(name, None) is not None for name in (member, *members))
+        self.prune(db, key)
+        return removed
+
+    def cmd_zrange(self, db: int, key: bytes, start: bytes, stop: bytes, *args: bytes) -> ReplyType:
+        """ZRANGE key start stop [WITHSCORES], by rank only."""
+        if [arg.lower() for arg in args] not in ([], [b"withscores"]):
+            raise ErrorReply(SYNTAX_ERROR)
+        ranked = self.slice((self.read(db, key, SortedSet) or SortedSet()).ranked(), start, stop)
+        if args:
+            return [item for member, score in ranked for item in (member, format_float(score))]
+        return [member for member, _ in ranked]
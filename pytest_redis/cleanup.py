@@ -0,0 +1,333 @@
+"""Database cleanup strategies used by the client fixtures."""
+
+import time
+from typing import TYPE_CHECKING, Any, Dict, Literal, Optional, Set, Tuple, TypedDict, Union
+
+import redis
+
+from pytest_redis.connection import async_close
+
+if TYPE_CHECKING:
+    import redis.asyncio
+
+CleanupType = Literal["flushall", "flushdb", "skip-empty", "tracked"]
+
+CLEANUP_STRATEGIES: Tuple[CleanupType, ...] = ("flushall", "flushdb", "skip-empty", "tracked")
+"""
+Available cleanup strategies:
+
+* flushall - FLUSHALL, removing data from all databases
+* flushdb - FLUSHDB ASYNC on client's own database
+* skip-empty - FLUSHDB ASYNC on client's own database, unless DBSIZE is already 0
+* tracked - remove only the keys touched during the test, tracked with keyspace notifications
+"""
+
+PING_MESSAGE = "pytest-redis-tracker"
+
+
+def check_cleanup(cleanup: str) -> CleanupType:
+    """Check if cleanup strategy is a known one.
+
+    :param cleanup: cleanup strategy name
+    :returns: cleanup strategy
+    """
+    for strategy in CLEANUP_STRATEGIES:
+        if cleanup == strategy:
+            return strategy
+    raise ValueError(
+        f"Unknown redis cleanup strategy: {cleanup}. "
+        f"Choose one of: {', '.join(CLEANUP_STRATEGIES)}."
+    )
+
+
+def keyspace_pattern(dbnum: int) -> str:
+    """Return keyspace notifications pattern for the database.
+
+    :param dbnum: number of the database
+    """
+    return f"__keyspace@{dbnum}__:*"
+
+
+class TrackedServerType(TypedDict):
+    """Trackers running on a server, and its notify-keyspace-events value to restore."""
+
+    trackers: int
+    original_events: Optional[str]
+
+
+TRACKED_SERVERS: Dict[Tuple[Any, ...], TrackedServerType] = {}
+"""
+Servers the trackers of this process run on, keyed by the server's address.
+"""
+
+
+def server_address(connection_kwargs: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Return address of the server, out of the connection pool's arguments."""
+    if path := connection_kwargs.get("path"):
+        return (path,)
+    return (connection_kwargs.get("host"), connection_kwargs.get("port"))
+
+
+def tracking_events(events: str) -> Optional[str]:
+    """Return keyspace notifications config value needed for the tracking.
+
+    :param events: current notify-keyspace-events value
+    :returns: new value, or None if the current one is enough already
+    """
+    if {"K", "A"}.issubset(set(events)):
+        return None
+    return f"{events}KA"
+
+
+def is_tracker_pong(message: Dict[str, Any]) -> bool:
+    """Check if that's a reply to the tracker's PING."""
+    return message["type"] == "pong" and message["data"] in (
+        PING_MESSAGE,
+        PING_MESSAGE.encode(),
+    )
+
+
+class BaseKeyTracker:
+    """Keys touched in a database, collected from keyspace notifications.
+
+    Keyspace notifications get enabled by the first tracker started on the server,
+    and their original setting restored once the last one stops.
+    Servers other processes can track as well (e.g. shared between xdist workers)
+    keep the notifications enabled, as there's no telling whether other trackers still run.
+    """
+
+    def __init__(self, dbnum: int, connection_kwargs: Dict[str, Any], restore_events: bool) -> None:
+        """Initialize tracker.
+
+        :param dbnum: number of the tracked database
+        :param connection_kwargs: arguments of the client's connection pool
+        :param restore_events: whether to restore notify-keyspace-events value
+            once the last tracker on the server stops
+        """
+        self.dbnum = dbnum
+        self.address = server_address(connection_kwargs)
+        self.restore_events = restore_events
+        self.keys: Set[Union[bytes, str]] = set()
+        self.started = False
+
+    @property
+    def pattern(self) -> str:
+        """Keyspace notifications pattern for the tracked database."""
+        return keyspace_pattern(self.dbnum)
+
+    def register(self) -> bool:
+        """Register tracker started on the server.
+
+        :returns: True if it's the first one, which has to check notifications setting
+        """
+        self.started = True
+        server = TRACKED_SERVERS.setdefault(
+            self.address, TrackedServerType(trackers=0, original_events=None)
+        )
+        server["trackers"] += 1
+        return server["trackers"] == 1
+
+    def enable_events(self, events: str) -> Optional[str]:
+        """Return notify-keyspace-events value to set, remembering the original one.
+
+        :param events: current notify-keyspace-events value
+        :returns: new value, or None if the current one is enough already
+        """
+        new_events = tracking_events(events)
+        if new_events is not None and self.restore_events:
+            TRACKED_SERVERS[self.address]["original_events"] = events
+        return new_events
+
+    def unregister(self) -> Optional[str]:
+        """Unregister tracker stopped on the server.
+
+        :returns: notify-keyspace-events value to restore, once the last tracker stopped
+        """
+        if not self.started:
+            return None
+        self.started = False
+        server = TRACKED_SERVERS[self.address]
+        server["trackers"] -= 1
+        if server["trackers"]:
+            return None
+        return TRACKED_SERVERS.pop(self.address)["original_events"]
+
+    def handle_message(self, message: Optional[Dict[str, Any]]) -> bool:
+        """Record the key the notification is about.
+
+        :param message: pubsub message, if any arrived
+        :returns: True once it's the reply to the tracker's PING,
+            sent after all the notifications collected
+        """
+        if message is None:
+            return False
+        if is_tracker_pong(message):
+            return True
+        if message["type"] == "pmessage":
+            self.keys.add(message["channel"][len(self.pattern) - 1 :])
+        return False
+
+
+class KeyTracker(BaseKeyTracker):
+    """Track keys touched in a database using keyspace notifications."""
+
+    def __init__(self, client: redis.Redis, dbnum: int, restore_events: bool = True) -> None:
+        """Initialize KeyTracker.
+
+        :param client: redis client connected to the tracked database
+        :param dbnum: number of the tracked database
+        :param restore_events: whether to restore notify-keyspace-events value
+            once the last tracker on the server stops
+        """
+        super().__init__(dbnum, client.connection_pool.connection_kwargs, restore_events)
+        self.client = client
+        self.pubsub: Optional[redis.client.PubSub] = None
+
+    def start(self) -> None:
+        """Enable keyspace notifications and subscribe to them."""
+        if self.register():
+            events = self.client.config_get("notify-keyspace-events")["notify-keyspace-events"]
+            if (new_events := self.enable_events(events)) is not None:
+                self.client.config_set("notify-keyspace-events", new_events)
+        self.pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        self.pubsub.psubscribe(self.pattern)
+
+    def collect(self, timeout: float = 5) -> Set[Union[bytes, str]]:
+        """Read all pending notifications and return keys touched so far.
+
+        PING sent over the subscribed connection gets its reply only
+        after all the notifications published before it.
+
+        :param timeout: how long to wait for the PING reply
+        """
+        assert self.pubsub is not None
+        self.pubsub.ping(PING_MESSAGE)
+        deadline = time.monotonic() + timeout
+        while (remaining := deadline - time.monotonic()) > 0:
+            if self.handle_message(self.pubsub.get_message(timeout=remaining)):
+                break
+        return self.keys
+
+    def stop(self) -> None:
+        """Unsubscribe from keyspace notifications, and restore their original setting."""
+        if self.pubsub is not None:
+            self.pubsub.close()
+            self.pubsub = None
+        if (original_events := self.unregister()) is not None:
+            self.client.config_set("notify-keyspace-events", original_events)
+
+    def cleanup(self, batch: int = 1000) -> None:
+        """Remove touched keys from database and stop tracking.
+
+        :param batch: how many keys to remove with a single UNLINK command
+        """
+        keys = list(self.collect())
+        self.stop()
+        for index in range(0, len(keys), batch):
+            self.client.unlink(*keys[index : index + batch])
+        self.keys.clear()
+
+
+FLUSH_COMMANDS: Dict[CleanupType, Tuple[str, ...]] = {
+    "flushall": ("FLUSHALL",),
+    "flushdb": ("FLUSHDB", "ASYNC"),
+    "skip-empty": ("FLUSHDB", "ASYNC"),
+}
+"""
+Commands flushing the database, for each cleanup strategy other than tracked.
+"""
+
+
+def flush_command(cleanup: CleanupType) -> Tuple[str, ...]:
+    """Return command flushing the database according to the cleanup strategy.
+
+    :param cleanup: cleanup strategy, other than tracked.
+    """
+    if cleanup not in FLUSH_COMMANDS:
+        raise ValueError(f"Cleanup strategy {cleanup} can not be used to flush database.")
+    return FLUSH_COMMANDS[cleanup]
+
+
+def flush(client: redis.Redis, cleanup: CleanupType) -> None:
+    """Flush client's database according to the cleanup strategy.
+
+    :param client: redis client
+    :param cleanup: cleanup strategy, other than tracked.
+    """
+    command = flush_command(cleanup)
+    if cleanup == "skip-empty" and not client.dbsize():
+        return
+    client.execute_command(*command)
+
+
+class AsyncKeyTracker(BaseKeyTracker):
+    """Track keys touched in a database using keyspace notifications, with asyncio client."""
+
+    def __init__(
+        self, client: "redis.asyncio.Redis", dbnum: int, restore_events: bool = True
+    ) -> None:
+        """Initialize AsyncKeyTracker.
+
+        :param client: asyncio redis client connected to the tracked database
+        :param dbnum: number of the tracked database
+        :param restore_events: whether to restore notify-keyspace-events value
+            once the last tracker on the server stops
+        """
+        super().__init__(dbnum, client.connection_pool.connection_kwargs, restore_events)
+        self.client = client
+        self.pubsub: Optional["redis.asyncio.client.PubSub"] = None
+
+    async def start(self) -> None:
+        """Enable keyspace notifications and subscribe to them."""
+        if self.register():
+            events = (await self.client.config_get("notify-keyspace-events"))[
+                "notify-keyspace-events"
+            ]
+            if (new_events := self.enable_events(events)) is not None:
+                await self.client.config_set("notify-keyspace-events", new_events)
+        self.pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        await self.pubsub.psubscribe(self.pattern)
+
+    async def collect(self, timeout: float = 5) -> Set[Union[bytes, str]]:
+        """Read all pending notifications and return keys touched so far.
+
+        :param timeout: how long to wait for the PING reply
+        """
+        assert self.pubsub is not None
+        await self.pubsub.ping(PING_MESSAGE)
+        deadline = time.monotonic() + timeout
+        while (remaining := deadline - time.monotonic()) > 0:
+            if self.handle_message(await self.pubsub.get_message(timeout=remaining)):
+                break
+        return self.keys
+
+    async def stop(self) -> None:
+        """Unsubscribe from keyspace notifications, and restore their original setting."""
+        if self.pubsub is not None:
+            await async_close(self.pubsub)
+            self.pubsub = None
+        if (original_events := self.unregister()) is not None:
+            await self.client.config_set("notify-keyspace-events", original_events)
+
+    async def cleanup(self, batch: int = 1000) -> None:
+        """Remove touched keys from database and stop tracking.
+
+        :param batch: how many keys to remove with a single UNLINK command
+        """
+        keys = list(await self.collect())
+        await self.stop()
+        for index in range(0, len(keys), batch):
+            await self.client.unlink(*keys[index : index + batch])
+        self.keys.clear()
+
+
+async def async_flush(client: "redis.asyncio.Redis", cleanup: CleanupType) -> None:
+    """Flush asyncio client's database according to the cleanup strategy.
+
+    :param client: asyncio redis client
+    :param cleanup: cleanup strategy, other than tracked.
+    """
+    command = flush_command(cleanup)
+    if cleanup == "skip-empty" and not await client.dbsize():
+        return
+    await client.execute_command(*command)  # type: ignore[no-untyped-call]
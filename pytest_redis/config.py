@@ -3,6 +3,15 @@
 from typing import Any, List, Optional, TypedDict
 
 from _pytest.fixtures import FixtureRequest
+from pytest import Config, StashKey
+
+from pytest_redis.cleanup import check_cleanup
+from pytest_redis.memory import check_maxmemory_policy, parse_memory
+
+WORKER_CONFIG_KEY = "pytest_redis_config"
+"""
+Key of the xdist workerinput entry holding config resolved on the controller.
+"""
 
 
 class RedisConfigType(TypedDict):
@@ -23,21 +32,60 @@ class RedisConfigType(TypedDict):
     decode: bool
     datadir: str
     modules: List[str]
+    xdist_shared: bool
+    cleanup: str
+    unixsocket_only: bool
+    server_profile: str
+    profile: bool
+    profile_json: str
+    server_stats: bool
+    maxmemory: Optional[str]
+    maxmemory_policy: Optional[str]
+    reuse: bool
+    reuse_idle_timeout: int
+
+
+redis_config_key = StashKey[RedisConfigType]()
 
 
 def get_config(request: FixtureRequest) -> RedisConfigType:
     """Return a dictionary with config options."""
+    return load_config(request.config)
+
+
+def load_config(pytest_config: Config) -> RedisConfigType:
+    """Return a dictionary with config options, resolved once per session.
+
+    Config is read from pytest's options and validated on first use,
+    xdist workers get the one resolved on the controller. Config is shared,
+    so it shouldn't be modified.
+    Useful in the plugin hooks, where there is no fixture request to use.
+    """
+    if redis_config_key in pytest_config.stash:
+        return pytest_config.stash[redis_config_key]
+    workerinput = getattr(pytest_config, "workerinput", {})
+    if WORKER_CONFIG_KEY in workerinput:
+        config: RedisConfigType = workerinput[WORKER_CONFIG_KEY]
+    else:
+        config = resolve_config(pytest_config)
+        validate_config(config)
+    pytest_config.stash[redis_config_key] = config
+    return config
+
+
+def resolve_config(pytest_config: Config) -> RedisConfigType:
+    """Return a dictionary with config options read from pytest's config."""
 
     def get_conf_option(option: str) -> Any:
         option_name = "redis_" + option
-        return request.config.getoption(option_name) or request.config.getini(option_name)
+        return pytest_config.getoption(option_name) or pytest_config.getini(option_name)
 
     port = get_conf_option("port")
     if modules := get_conf_option("modules"):
         modules = modules.split(",")
     else:
         modules = []
-    config: RedisConfigType = {
+    return {
         "host": get_conf_option("host"),
         "port": int(port) if port else None,
         "username": get_conf_option("username"),
@@ -53,5 +101,43 @@ def get_config(request: FixtureRequest) -> RedisConfigType:
         "decode": bool(get_conf_option("decode")),
         "datadir": get_conf_option("datadir"),
         "modules": modules,
+        "xdist_shared": bool(get_conf_option("xdist_shared")),
+        "cleanup": get_conf_option("cleanup"),
+        "unixsocket_only": bool(get_conf_option("unixsocket_only")),
+        "server_profile": get_conf_option("server_profile"),
+        "profile": bool(get_conf_option("profile")),
+        "profile_json": get_conf_option("profile_json"),
+        "server_stats": bool(get_conf_option("server_stats")),
+        "maxmemory": get_conf_option("maxmemory"),
+        "maxmemory_policy": get_conf_option("maxmemory_policy"),
+        "reuse": bool(get_conf_option("reuse")),
+        "reuse_idle_timeout": int(get_conf_option("reuse_idle_timeout")),
     }
-    return config
+
+
+def validate_config(config: RedisConfigType) -> None:
+    """Check config options' values, so that bad ones fail at the session start.
+
+    :raises ValueError: for unknown values
+    """
+    # factories import config, hence the late import
+    from pytest_redis.factories.proc import check_server_profile
+
+    check_cleanup(config["cleanup"])
+    check_server_profile(config["server_profile"])
+    if config["maxmemory"]:
+        parse_memory(config["maxmemory"])
+    if config["maxmemory_policy"]:
+        check_maxmemory_policy(config["maxmemory_policy"])
+
+
+class WorkerConfigSender:
+    """Xdist controller's plugin passing resolved config to the workers."""
+
+    def __init__(self, config: RedisConfigType) -> None:
+        """Initialize WorkerConfigSender."""
+        self.config = config
+
+    def pytest_configure_node(self, node: Any) -> None:
+        """Pass resolved config to the xdist worker."""
+        node.workerinput[WORKER_CONFIG_KEY] = self.config
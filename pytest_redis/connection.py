@@ -0,0 +1,184 @@
+"""Connection pools shared by the client fixtures within the session."""
+
+from typing import TYPE_CHECKING, Any, Dict, Set, Tuple, Union
+from weakref import WeakKeyDictionary
+
+import redis
+from redis.connection import Connection, UnixDomainSocketConnection
+from redis.exceptions import ConnectionError, ResponseError, TimeoutError
+
+from pytest_redis.executor import NoopRedis, RedisExecutor
+from pytest_redis.executor.cluster import RedisClusterExecutor
+
+if TYPE_CHECKING:
+    from redis.cluster import RedisCluster
+
+
+class FixtureConnectionPool(redis.ConnectionPool):
+    """Connection pool able to bring its connections back to their initial state.
+
+    Connections live through the whole session,
+    so whatever state test left them in, has to be reset before the next one.
+    """
+
+    def __init__(self, **connection_kwargs: Any) -> None:
+        """Initialize connection pool.
+
+        :param connection_kwargs: ConnectionPool's and Connection's arguments
+        """
+        self._idle_connections: Set[Connection] = set()
+        super().__init__(**connection_kwargs)
+
+    def get_connection(self, *args: Any, **kwargs: Any) -> Connection:
+        """Get a connection from the pool."""
+        connection: Connection = super().get_connection(*args, **kwargs)
+        self._idle_connections.discard(connection)
+        return connection
+
+    def release(self, connection: Connection) -> None:
+        """Release the connection back to the pool."""
+        super().release(connection)
+        self._idle_connections.add(connection)
+
+    def disconnect(self, inuse_connections: bool = True) -> None:
+        """Disconnect all connections in the pool."""
+        super().disconnect(inuse_connections)
+        self._idle_connections.clear()
+
+    def reset_connections(self) -> None:
+        """Reset state of all idle connections.
+
+        Pending MULTI gets discarded, WATCHed keys unwatched,
+        database selected again and client name restored - all in one round trip
+        for each connection. Connections that fail to reset are disconnected,
+        and will reconnect when used next time.
+        """
+        for connection in list(self._idle_connections):
+            if getattr(connection, "_sock", None) is None:
+                # disconnected one will start with a clean state anyway
+                continue
+            try:
+                self._reset_connection(connection)
+            except (ConnectionError, TimeoutError, OSError):
+                connection.disconnect()
+
+    @staticmethod
+    def _reset_connection(connection: Connection) -> None:
+        """Send reset commands in a single batch and read all the replies."""
+        commands = (
+            ("DISCARD",),
+            ("UNWATCH",),
+            ("SELECT", connection.db),
+            ("CLIENT", "SETNAME", connection.client_name or ""),
+        )
+        for command in commands:
+            connection.send_command(*command)
+        for _ in commands:
+            try:
+                connection.read_response()
+            except ResponseError:
+                # DISCARD without MULTI
+                pass
+
+
+PoolsType = Dict[Tuple[int, bool], FixtureConnectionPool]
+
+CONNECTION_POOLS: "WeakKeyDictionary[Union[NoopRedis, RedisExecutor], PoolsType]" = (
+    WeakKeyDictionary()
+)
+"""
+Connection pools for each process fixture, keyed by database number and decode flag.
+"""
+
+
+def get_connection_pool(
+    proc_fixture: Union[NoopRedis, RedisExecutor], dbnum: int, decode_responses: bool
+) -> FixtureConnectionPool:
+    """Return session-wide connection pool for the process fixture and database.
+
+    :param proc_fixture: process fixture's executor
+    :param dbnum: number of database to connect to
+    :param decode_responses: Client: to decode response or not.
+    :returns: connection pool
+    """
+    pools = CONNECTION_POOLS.setdefault(proc_fixture, {})
+    key = (dbnum, decode_responses)
+    if key not in pools:
+        connection_kwargs: Dict[str, Any] = {
+            "db": dbnum,
+            "username": proc_fixture.username,
+            "password": proc_fixture.password,
+            "decode_responses": decode_responses,
+        }
+        if proc_fixture.unixsocket:
+            connection_kwargs["connection_class"] = UnixDomainSocketConnection
+            connection_kwargs["path"] = proc_fixture.unixsocket
+        else:
+            connection_kwargs["host"] = proc_fixture.host
+            connection_kwargs["port"] = proc_fixture.port
+        pools[key] = FixtureConnectionPool(**connection_kwargs)
+    return pools[key]
+
+
+CLUSTER_CLIENTS: "WeakKeyDictionary[RedisClusterExecutor, Dict[bool, 'RedisCluster']]" = (
+    WeakKeyDictionary()
+)
+"""
+Cluster clients for each cluster process fixture, keyed by decode flag.
+"""
+
+
+def get_cluster_client(cluster: RedisClusterExecutor, decode_responses: bool) -> "RedisCluster":
+    """Return session-wide client of the cluster.
+
+    Cluster client discovers the cluster layout and connects to its nodes,
+    so it's kept for the whole session.
+
+    :param cluster: cluster process fixture's executor
+    :param decode_responses: Client: to decode response or not.
+    :returns: cluster client
+    """
+    # redis.cluster is there since redis-py 4.1, so it's imported only when the cluster is used
+    from redis.cluster import ClusterNode, RedisCluster
+
+    clients = CLUSTER_CLIENTS.setdefault(cluster, {})
+    if decode_responses not in clients:
+        clients[decode_responses] = RedisCluster(
+            startup_nodes=[ClusterNode(cluster.host, cluster.port)],
+            username=cluster.username,
+            password=cluster.password,
+            decode_responses=decode_responses,
+        )
+    return clients[decode_responses]
+
+
+def disconnect_connection_pool(proc_fixture: Union[NoopRedis, RedisExecutor]) -> None:
+    """Close all connections of the process fixture's connection pools.
+
+    :param proc_fixture: process fixture's executor
+    """
+    for pool in CONNECTION_POOLS.pop(proc_fixture, {}).values():
+        pool.disconnect()
+
+
+def disconnect_connection_pools() -> None:
+    """Close all connections of all the connection pools and cluster clients."""
+    for pools in list(CONNECTION_POOLS.values()):
+        for pool in pools.values():
+            pool.disconnect()
+    CONNECTION_POOLS.clear()
+    for clients in list(CLUSTER_CLIENTS.values()):
+        for client in clients.values():
+            client.close()
+    CLUSTER_CLIENTS.clear()
+
+
+async def async_close(closeable: Any) -> None:
+    """Close asyncio client or pubsub.
+
+    redis-py 5.0.1 renamed asyncio ``close()`` to ``aclose()``, deprecating the old name.
+
+    :param closeable: asyncio client or pubsub to close
+    """
+    aclose = getattr(closeable, "aclose", None)
+    await (aclose() if aclose is not None else closeable.close())
@@ -11,3 +11,11 @@ class RedisMisconfigured(Exception):
 
 class UnixSocketTooLong(Exception):
     """Exception raised when unixsocket path is too long."""
+
+
+class SeedLost(Exception):
+    """Exception raised when seed dataset's pristine copy got removed and can't be loaded again."""
+
+
+class ClusterNotReady(Exception):
+    """Exception raised when redis cluster doesn't get ready in time."""
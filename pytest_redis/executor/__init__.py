@@ -1,6 +1,17 @@
 """Redis executor."""
 
+from pytest_redis.executor.cluster import RedisClusterExecutor
+from pytest_redis.executor.inproc import InProcessRedis
 from pytest_redis.executor.noop import NoopRedis
 from pytest_redis.executor.process import RedisExecutor
+from pytest_redis.executor.proxy import RedisProxy
+from pytest_redis.executor.shared import SharedRedis
 
-__all__ = ("RedisExecutor", "NoopRedis")
+__all__ = (
+    "RedisExecutor",
+    "NoopRedis",
+    "SharedRedis",
+    "RedisClusterExecutor",
+    "InProcessRedis",
+    "RedisProxy",
+)
@@ -0,0 +1,203 @@
+"""Redis Cluster executor."""
+
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+import redis
+from packaging.version import parse
+
+from pytest_redis.exception import ClusterNotReady, RedisUnsupported
+from pytest_redis.executor.process import RedisExecutor
+
+CLUSTER_SLOTS = 16384
+
+ResultType = TypeVar("ResultType")
+
+
+def slot_ranges(masters: int) -> List[range]:
+    """Split cluster's hash slots evenly between the masters.
+
+    :param masters: number of master nodes
+    :returns: range of slots for each of the masters
+    """
+    return [
+        range(index * CLUSTER_SLOTS // masters, (index + 1) * CLUSTER_SLOTS // masters)
+        for index in range(masters)
+    ]
+
+
+class RedisClusterExecutor:
+    """Redis Cluster made of cluster-enabled RedisExecutor nodes.
+
+    Nodes are started and stopped concurrently. Once started,
+    masters get their hash slots, replicas their masters, and cluster
+    is considered started when all the nodes report ``cluster_state:ok``.
+    """
+
+    MIN_SUPPORTED_VERSION = parse("3.0")
+    """
+    Minimum redis version supporting the cluster.
+    """
+
+    def __init__(
+        self,
+        masters: List[RedisExecutor],
+        replicas: Optional[List[RedisExecutor]] = None,
+        timeout: float = 60,
+    ) -> None:
+        """Initialize RedisClusterExecutor.
+
+        :param masters: not yet started cluster-enabled master nodes
+        :param replicas: not yet started cluster-enabled replica nodes,
+            attached to the masters in turns
+        :param timeout: how long to wait for the cluster to get ready
+        """
+        assert masters, "cluster needs at least one master node"
+        self.masters = masters
+        self.replicas = replicas or []
+        self.timeout = timeout
+        first_node = masters[0]
+        self.host = first_node.host
+        self.port = first_node.port
+        self.username = first_node.username
+        self.password = first_node.password
+
+    @property
+    def nodes(self) -> List[RedisExecutor]:
+        """All the cluster nodes, masters first."""
+        return self.masters + self.replicas
+
+    @property
+    def version(self) -> Any:
+        """Return redis version."""
+        return self.masters[0].version
+
+    def _client(self, node: RedisExecutor) -> redis.Redis:
+        """Return client connected to the node."""
+        return redis.Redis(
+            unix_socket_path=node.unixsocket,
+            username=node.username,
+            password=node.password,
+            decode_responses=True,
+        )
+
+    def _run_concurrently(
+        self, task: Callable[[RedisExecutor], ResultType], nodes: List[RedisExecutor]
+    ) -> List[ResultType]:
+        """Run task for all the nodes at once."""
+        with ThreadPoolExecutor(max_workers=len(nodes)) as pool:
+            return list(pool.map(task, nodes))
+
+    def _wait_for(self, condition: Callable[[], bool], description: str) -> None:
+        """Wait for the cluster condition, checking it more often at first."""
+        deadline = time.monotonic() + self.timeout
+        delay = 0.005
+        while not condition():
+            if time.monotonic() > deadline:
+                raise ClusterNotReady(
+                    f"Redis Cluster did not get {description} within {self.timeout} seconds."
+                )
+            time.sleep(delay)
+            delay = min(delay * 2, 0.2)
+
+    def start(self) -> "RedisClusterExecutor":
+        """Start all the nodes and form the cluster out of them."""
+        if self.version < self.MIN_SUPPORTED_VERSION:
+            raise RedisUnsupported(
+                f"Redis Cluster requires Redis {self.MIN_SUPPORTED_VERSION} at least. "
+                f"The currently installed version of Redis: {self.version}."
+            )
+        try:
+            self._run_concurrently(lambda node: node.start(), self.nodes)
+            self._form_cluster()
+        except BaseException:
+            self.stop()
+            raise
+        return self
+
+    def _form_cluster(self) -> None:
+        """Assign slots, introduce nodes to each other and attach replicas."""
+        clients = {node: self._client(node) for node in self.nodes}
+        try:
+            for epoch, (master, slots) in enumerate(
+                zip(self.masters, slot_ranges(len(self.masters))), start=1
+            ):
+                clients[master].execute_command("CLUSTER ADDSLOTS", *slots)
+                clients[master].execute_command("CLUSTER SET-CONFIG-EPOCH", epoch)
+
+            # meeting every node directly is quicker than waiting for gossip
+            meet_host = socket.gethostbyname(self.host)
+            for index, node in enumerate(self.nodes):
+                for other in self.nodes[index + 1 :]:
+                    clients[node].execute_command("CLUSTER MEET", meet_host, other.port)
+            self._wait_for(
+                lambda: all(
+                    self._nodes_known(client) == len(self.nodes) for client in clients.values()
+                ),
+                "all nodes connected",
+            )
+
+            master_ids = [
+                clients[master].execute_command("CLUSTER MYID") for master in self.masters
+            ]
+            replicas_count = {master: 0 for master in self.masters}
+            for index, replica in enumerate(self.replicas):
+                master = self.masters[index % len(self.masters)]
+                clients[replica].execute_command(
+                    "CLUSTER REPLICATE", master_ids[index % len(self.masters)]
+                )
+                replicas_count[master] += 1
+            first_client = clients[self.masters[0]]
+            self._wait_for(
+                lambda: all(self._cluster_ok(client) for client in clients.values())
+                and all(
+                    clients[master].info("replication")["connected_slaves"] >= count
+                    for master, count in replicas_count.items()
+                )
+                # clients learn the cluster layout from the first node
+                and self._replicas_known(first_client) == len(self.replicas),
+                "cluster_state:ok",
+            )
+        finally:
+            for client in clients.values():
+                client.close()
+
+    @staticmethod
+    def _cluster_nodes(client: redis.Redis) -> Dict[str, Dict[str, Any]]:
+        """Return nodes known to the node, with their details."""
+        nodes: Dict[str, Dict[str, Any]] = client.execute_command("CLUSTER NODES")
+        return nodes
+
+    def _nodes_known(self, client: redis.Redis) -> int:
+        """Return number of nodes known to the node, past the handshake."""
+        return sum(
+            "handshake" not in node["flags"] for node in self._cluster_nodes(client).values()
+        )
+
+    def _replicas_known(self, client: redis.Redis) -> int:
+        """Return number of replicas known to the node."""
+        return sum("slave" in node["flags"] for node in self._cluster_nodes(client).values())
+
+    @staticmethod
+    def _cluster_ok(client: redis.Redis) -> bool:
+        """Check if the node considers cluster healthy."""
+        info: Dict[str, Any] = client.execute_command("CLUSTER INFO")
+        return str(info.get("cluster_state")) == "ok"
+
+    def stop(self) -> None:
+        """Stop all the nodes."""
+        self._run_concurrently(lambda node: node.stop(), self.nodes)
+
+    def running(self) -> bool:
+        """Check if all the nodes are running."""
+        return all(node.running() for node in self.nodes)
+
+    def __enter__(self) -> "RedisClusterExecutor":
+        """Start the cluster when used as a context manager."""
+        return self.start()
+
+    def __exit__(self, *args: Any) -> None:
+        """Stop the cluster when leaving the context manager."""
+        self.stop()
@@ -0,0 +1,208 @@
+"""Redis stand-in served from a thread of the test process."""
+
+import asyncio
+from inspect import signature
+from typing import Callable, Dict, List, Optional, Tuple
+
+from pytest_redis.backend import OK, BackendType, DictBackend
+from pytest_redis.executor.threaded import ThreadedServer
+from pytest_redis.resp import ErrorReply, ReplyType, SimpleString, encode_reply, read_command
+
+CONNECTION_COMMANDS = {
+    b"auth",
+    b"select",
+    b"client",
+    b"quit",
+    b"multi",
+    b"exec",
+    b"discard",
+    b"watch",
+    b"unwatch",
+}
+"""
+Commands handled by the server itself, rather than passed to the backend.
+"""
+
+
+class ClientConnection:
+    """State of a single client's connection: selected database, transaction, WATCHed keys."""
+
+    def __init__(self, server: "InProcessRedis", client_id: int) -> None:
+        """Initialize ClientConnection.
+
+        :param server: server the client connected to
+        :param client_id: client's id, as CLIENT ID returns it
+        """
+        self.server = server
+        self.client_id = client_id
+        self.db = 0
+        self.name: Optional[bytes] = None
+        self.authenticated = not server.password
+        self.transaction: Optional[List[List[bytes]]] = None
+        self.watched: Dict[Tuple[int, bytes], int] = {}
+        self.closing = False
+
+    def execute(self, command: List[bytes]) -> ReplyType:
+        """Execute client's command, returning its reply, or ErrorReply if it failed."""
+        name = command[0].lower()
+        try:
+            if not self.authenticated and name not in (b"auth", b"quit"):
+                raise ErrorReply("NOAUTH Authentication required.")
+            if self.transaction is not None and name not in (b"exec", b"discard", b"multi"):
+                if name in (b"watch", b"unwatch"):
+                    raise ErrorReply(f"ERR {name.decode().upper()} inside MULTI is not allowed")
+                self.transaction.append(command)
+                return SimpleString("QUEUED")
+            if name in CONNECTION_COMMANDS:
+                return self.execute_connection_command(name.decode(), command[1:])
+            return self.server.backend.execute(self.db, command)
+        except ErrorReply as error:
+            return error
+
+    def execute_connection_command(self, name: str, args: List[bytes]) -> ReplyType:
+        """Execute command changing the connection's state."""
+        method: Callable[..., ReplyType] = getattr(self, f"cmd_{name}")
+        try:
+            signature(method).bind(*args)
+        except TypeError as error:
+            raise ErrorReply(f"ERR wrong number of arguments for '{name}' command") from error
+        return method(*args)
+
+    def cmd_auth(self, *credentials: bytes) -> ReplyType:
+        """AUTH [username] password."""
+        if not self.server.password:
+            raise ErrorReply("ERR AUTH called without any password configured for the default user")
+        if len(credentials) not in (1, 2):
+            raise ErrorReply("ERR wrong number of arguments for 'auth' command")
+        username = credentials[0].decode() if len(credentials) == 2 else None
+        if credentials[-1].decode() != self.server.password or username not in (
+            None,
+            self.server.username or "default",
+        ):
+            raise ErrorReply("WRONGPASS invalid username-password pair or user is disabled.")
+        self.authenticated = True
+        return OK
+
+    def cmd_select(self, index: bytes) -> ReplyType:
+        """SELECT index."""
+        if not index.isdigit() or int(index) >= self.server.backend.databases:
+            raise ErrorReply("ERR DB index is out of range")
+        self.db = int(index)
+        return OK
+
+    def cmd_client(self, subcommand: bytes, *args: bytes) -> ReplyType:
+        """CLIENT ID|GETNAME|SETNAME|SETINFO."""
+        subcommand = subcommand.lower()
+        if subcommand == b"id":
+            return self.client_id
+        if subcommand == b"getname":
+            return self.name
+        if subcommand == b"setname" and len(args) == 1:
+            self.name = args[0] or None
+            return OK
+        if subcommand == b"setinfo" and len(args) == 2:
+            return OK
+        raise ErrorReply(f"ERR unknown subcommand or wrong number of arguments for {subcommand!r}")
+
+    def cmd_quit(self) -> ReplyType:
+        """QUIT."""
+        self.closing = True
+        return OK
+
+    def cmd_multi(self) -> ReplyType:
+        """MULTI."""
+        if self.transaction is not None:
+            raise ErrorReply("ERR MULTI calls can not be nested")
+        self.transaction = []
+        return OK
+
+    def cmd_exec(self) -> ReplyType:
+        """EXEC, or null reply if any of the WATCHed keys got modified."""
+        if self.transaction is None:
+            raise ErrorReply("ERR EXEC without MULTI")
+        commands, self.transaction = self.transaction, None
+        watched, self.watched = self.watched, {}
+        backend = self.server.backend
+        if any(backend.key_version(db, key) != version for (db, key), version in watched.items()):
+            return None
+        return [self.execute(command) for command in commands]
+
+    def cmd_discard(self) -> ReplyType:
+        """DISCARD."""
+        if self.transaction is None:
+            raise ErrorReply("ERR DISCARD without MULTI")
+        self.transaction = None
+        self.watched = {}
+        return OK
+
+    def cmd_watch(self, key: bytes, *keys: bytes) -> ReplyType:
+        """WATCH key [key ...]."""
+        for name in (key, *keys):
+            self.watched.setdefault((self.db, name), self.server.backend.key_version(self.db, name))
+        return OK
+
+    def cmd_unwatch(self) -> ReplyType:
+        """UNWATCH."""
+        self.watched = {}
+        return OK
+
+
+class InProcessRedis(ThreadedServer):
+    """Redis stand-in served from a thread of the test process.
+
+    Asyncio RESP server, running in its own thread, passes the commands to the backend.
+    There's no process to spawn and nothing to poll for readiness,
+    the server is ready to serve clients once it's listening.
+    It has the same connection attributes, as the redis executors have,
+    so that the client fixtures can connect to it the same way.
+    """
+
+    thread_name = "pytest-redis-inproc"
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        backend: Optional[BackendType] = None,
+        timeout: int = 15,
+    ) -> None:
+        """Initialize InProcessRedis.
+
+        :param host: host to listen on
+        :param port: port to listen on, 0 to pick a free one when started
+        :param username: username clients have to authenticate with
+        :param password: password clients have to authenticate with
+        :param backend: backend executing the data commands, DictBackend by default
+        :param timeout: how long to wait for the server to start or stop
+        """
+        super().__init__(host, port, None, timeout)
+        self.username = username
+        self.password = password
+        self.backend: BackendType = backend if backend is not None else DictBackend()
+        self._client_ids = 0
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve client's commands, one by one, until it disconnects."""
+        task = self._register_connection(writer)
+        self._client_ids += 1
+        connection = ClientConnection(self, self._client_ids)
+        try:
+            while not connection.closing:
+                try:
+                    command = await read_command(reader)
+                except ErrorReply as error:
+                    writer.write(encode_reply(error))
+                    break
+                if command is None:
+                    break
+                writer.write(encode_reply(connection.execute(command)))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._connections.pop(task, None)
+            writer.close()
@@ -1,12 +1,12 @@
 """Reddis class respsenting an instance started by a third party."""
 
-import socket
+import time
 from typing import Optional
 
-from mirakuru import TCPExecutor
+from pytest_redis.executor.readiness import RedisTCPExecutor
 
 
-class NoopRedis(TCPExecutor):
+class NoopRedis(RedisTCPExecutor):
     """Reddis class respsenting an instance started by a third party."""
 
     def __init__(
@@ -37,16 +37,9 @@ class NoopRedis(TCPExecutor):
 
     def start(self) -> "NoopRedis":
         """Start is a NOOP."""
+        self.ready_probes = 0
+        started_at = time.monotonic()
         self._set_timeout()
         self.wait_for(self.redis_available)
+        self.ready_time = time.monotonic() - started_at
         return self
-
-    def redis_available(self) -> bool:
-        """Return True if connecting to Redis is possible."""
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            try:
-                s.settimeout(0.1)
-                s.connect((self.host, self.port))
-            except (TimeoutError, ConnectionRefusedError):
-                return False
-        return True
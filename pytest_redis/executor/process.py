@@ -3,15 +3,22 @@
 import os
 import platform
 import re
+import shutil
+import subprocess
+import time
 from itertools import islice
 from pathlib import Path
+from secrets import token_hex
 from tempfile import gettempdir
-from typing import Any, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
-from mirakuru import TCPExecutor
+import redis
 from packaging.version import Version, parse
+from pytest import Cache
+from redis.exceptions import RedisError
 
 from pytest_redis.exception import RedisMisconfigured, RedisUnsupported, UnixSocketTooLong
+from pytest_redis.executor.readiness import RedisTCPExecutor, redis_ping
 
 MAX_UNIXSOCKET = 104
 if platform.system() == "Linux":
@@ -28,7 +35,73 @@ def extract_version(text: str) -> Version:
     return parse(matches.group(0))
 
 
-class RedisExecutor(TCPExecutor):
+VERSION_CACHE_KEY = "pytest-redis/versions"
+"""
+Key under which redis-server versions are stored in pytest's cache.
+"""
+
+REDIS_VERSIONS: Dict[Tuple[str, int, int], Version] = {}
+"""
+In-process cache of redis-server versions, keyed by executable's fingerprint.
+"""
+
+
+def executable_fingerprint(executable: str) -> Optional[Tuple[str, int, int]]:
+    """Identify executable by its real path, modification time and size.
+
+    :param executable: path to, or name of the executable
+    :returns: fingerprint or None if there's no such executable
+    """
+    path = shutil.which(executable)
+    if not path:
+        return None
+    stat = os.stat(path)
+    return os.path.realpath(path), stat.st_mtime_ns, stat.st_size
+
+
+def read_version(executable: str) -> Version:
+    """Run `redis-server --version` and return the version it reports.
+
+    :param executable: path to redis-server
+    """
+    with os.popen(f"{executable} --version") as version_output:
+        version_string = version_output.read()
+    if not version_string:
+        raise RedisMisconfigured(
+            f"Bad path to redis_exec is given: {executable} not exists or wrong program"
+        )
+    return extract_version(version_string)
+
+
+def redis_version(executable: str, cache: Optional[Cache] = None) -> Version:
+    """Return redis-server version, running `redis-server --version` only when needed.
+
+    Version is memoized in-process and, if pytest's cache is given,
+    on disk between test runs.
+
+    :param executable: path to redis-server
+    :param cache: pytest's cache
+    :returns: redis-server version
+    """
+    fingerprint = executable_fingerprint(executable)
+    if fingerprint is None:
+        return read_version(executable)
+    if fingerprint in REDIS_VERSIONS:
+        return REDIS_VERSIONS[fingerprint]
+
+    cache_key = ":".join(str(part) for part in fingerprint)
+    cached_versions: Dict[str, str] = cache.get(VERSION_CACHE_KEY, {}) if cache else {}
+    if cache_key in cached_versions:
+        version = parse(cached_versions[cache_key])
+    else:
+        version = read_version(executable)
+        if cache:
+            cache.set(VERSION_CACHE_KEY, {**cached_versions, cache_key: str(version)})
+    REDIS_VERSIONS[fingerprint] = version
+    return version
+
+
+class RedisExecutor(RedisTCPExecutor):
     """Redis executor.
 
     Extended TCPExecutor to contain all required logic for parametrizing
@@ -59,6 +132,14 @@ class RedisExecutor(TCPExecutor):
         appendonly: str = "no",
         datadir: Optional[Path] = None,
         modules: Optional[List[str]] = None,
+        version_cache: Optional[Cache] = None,
+        ephemeral: bool = False,
+        cluster: bool = False,
+        cluster_node_timeout: int = 15000,
+        replicaof: Optional[Tuple[str, int]] = None,
+        maxmemory: Optional[int] = None,
+        maxmemory_policy: Optional[str] = None,
+        server_options: Optional[Dict[str, Any]] = None,
     ) -> None:  # pylint:disable=too-many-locals
         """Init method of a RedisExecutor.
 
@@ -67,7 +148,7 @@ class RedisExecutor(TCPExecutor):
         :param redis_timeout: client's connection timeout
         :param loglevel: redis log verbosity level
         :param host: server's host
-        :param port: server's port
+        :param port: server's port, 0 to listen on the unix socket only
         :param username: server's username
         :param password: server's password
         :param startup_timeout: executor's timeout for start and stop actions
@@ -81,17 +162,42 @@ class RedisExecutor(TCPExecutor):
         :param datadir: location where all the process files will be located
         :param appendonly:
         :param modules: list of paths of Redis extension modules to load
+        :param version_cache: pytest's cache to store redis-server version in
+        :param ephemeral: Whether to disable persistence completely:
+            RDB snapshots, AOF and the fsync-related settings
+        :param cluster: Whether to start the server as a cluster node.
+            Cluster bus listens on the port + 10000.
+        :param cluster_node_timeout: milliseconds after which cluster node
+            not answering is considered failing
+        :param replicaof: host and port of the primary server,
+            to start the server as its replica
+        :param maxmemory: memory limit, in bytes
+        :param maxmemory_policy: eviction policy applied once the memory limit is reached
+        :param server_options: any other redis-server options, with names using underscores
+            in place of dashes, e.g. ``{"io_threads": 4}`` for ``--io-threads 4``.
+            Boolean values are passed as yes/no.
         """
         if not datadir:
             datadir = Path(gettempdir())
-        self.unixsocket = str(datadir / f"redis.{port}.sock")
+        # without TCP port, files need another key to not collide with other servers'
+        files_key = str(port) if port else token_hex(4)
+        self.unixsocket: str = str(datadir / f"redis.{files_key}.sock")
+        self.dbfilename = f"dump.{files_key}.rdb"
         self.executable = executable
+        self.version_cache = version_cache
+        self.replicaof = replicaof
 
         self.username = username
         self.password = password
 
-        logfile_path = datadir / f"redis-server.{port}.log"
-        pidfile_path = datadir / f"redis-server.{port}.pid"
+        logfile_path = datadir / f"redis-server.{files_key}.log"
+        pidfile_path = datadir / f"redis-server.{files_key}.pid"
+        self.files: List[Path] = [
+            logfile_path,
+            pidfile_path,
+            datadir / self.dbfilename,
+            Path(self.unixsocket),
+        ]
 
         command = [
             self.executable,
@@ -112,23 +218,65 @@ class RedisExecutor(TCPExecutor):
             "--unixsocket",
             self.unixsocket,
             "--dbfilename",
-            f"dump.{port}.rdb",
+            self.dbfilename,
             "--logfile",
             str(logfile_path),
             "--loglevel",
             loglevel,
             "--syslog-enabled",
             self._redis_bool(syslog_enabled),
-            "--bind",
-            str(host),
             "--port",
             str(port),
             "--dir",
             str(datadir),
         ]
+        if port:
+            command.extend(["--bind", str(host)])
         if password:
-            command.extend(["--requirepass", str(password)])
-        if save:
+            command.extend(["--requirepass", str(password), "--masterauth", str(password)])
+        if maxmemory:
+            command.extend(["--maxmemory", str(maxmemory)])
+        if maxmemory_policy:
+            command.extend(["--maxmemory-policy", maxmemory_policy])
+        if replicaof:
+            replicaof_option = "--replicaof" if self.version >= parse("5") else "--slaveof"
+            command.extend([replicaof_option, replicaof[0], str(replicaof[1])])
+        if cluster:
+            assert port, "cluster node needs TCP port for the cluster bus"
+            self.files.append(datadir / f"nodes.{files_key}.conf")
+            command.extend(
+                [
+                    "--cluster-enabled",
+                    "yes",
+                    "--cluster-config-file",
+                    f"nodes.{files_key}.conf",
+                    "--cluster-node-timeout",
+                    str(cluster_node_timeout),
+                ]
+            )
+        if ephemeral:
+            command.extend(
+                [
+                    "--save",
+                    "",
+                    "--appendonly",
+                    "no",
+                    "--appendfsync",
+                    "no",
+                    "--stop-writes-on-bgsave-error",
+                    "no",
+                ]
+            )
+            if self.version >= parse("5"):
+                command.extend(
+                    [
+                        "--rdb-save-incremental-fsync",
+                        "no",
+                        "--aof-rewrite-incremental-fsync",
+                        "no",
+                    ]
+                )
+        elif save:
             if self.version < parse("7"):
                 save_parts = save.split()
                 assert all(
@@ -148,6 +296,10 @@ class RedisExecutor(TCPExecutor):
             for module_path in modules:
                 command.extend(["--loadmodule", module_path])
 
+        for name, value in (server_options or {}).items():
+            option_value = self._redis_bool(value) if isinstance(value, bool) else str(value)
+            command.extend([f"--{name.replace('_', '-')}", option_value])
+
         super().__init__(command, host, port, timeout=startup_timeout)
 
     @classmethod
@@ -160,13 +312,93 @@ class RedisExecutor(TCPExecutor):
         """
         return "yes" if value and value != "no" else "no"
 
+    def after_start_check(self) -> bool:
+        """Check if redis is ready to serve clients, and replica got synchronised."""
+        if not super().after_start_check():
+            return False
+        if self.replicaof:
+            return self.replication_synced()
+        return True
+
+    def replication_synced(self) -> bool:
+        """Check if replica's link to the primary is up, and initial sync completed."""
+        try:
+            with redis.Redis(
+                unix_socket_path=self.unixsocket,
+                username=self.username,
+                password=self.password,
+                decode_responses=True,
+            ) as client:
+                info = client.info("replication")
+        except RedisError:
+            return False
+        return info.get("master_link_status") == "up" and not info.get("master_sync_in_progress")
+
+    def pre_start_check(self) -> bool:
+        """Check if there's a server running already on the same port or unix socket."""
+        if not self.port:
+            return redis_ping(self.unixsocket, self.username, self.password)
+        return super().pre_start_check()
+
     def start(self) -> "RedisExecutor":
         """Check supported version before starting."""
         self._check_unixsocket_length()
         self._check_version()
+        self.ready_probes = 0
+        started_at = time.monotonic()
         super().start()
+        self.ready_time = time.monotonic() - started_at
         return self
 
+    def stop(
+        self, stop_signal: Optional[int] = None, expected_returncode: Optional[int] = None
+    ) -> "RedisExecutor":
+        """Stop redis with SHUTDOWN NOSAVE, falling back to the signal, and remove its files.
+
+        SHUTDOWN NOSAVE skips the final RDB snapshot and AOF rewrite, that stopping
+        with the signal would do, if persistence is configured.
+        """
+        started = self.process is not None
+        if started and stop_signal is None:
+            self.shutdown_nosave()
+        super().stop(stop_signal, expected_returncode)
+        if started:
+            self.remove_files()
+        return self
+
+    def shutdown_nosave(self) -> bool:
+        """Shut the server down with SHUTDOWN NOSAVE, and wait for it to exit.
+
+        :returns: True if server exited, False if it has to be stopped with the signal
+        """
+        if self.process is None:
+            return False
+        try:
+            with redis.Redis(
+                unix_socket_path=self.unixsocket,
+                username=self.username,
+                password=self.password,
+                socket_timeout=self._timeout,
+            ) as client:
+                # authenticate first, shutdown() takes failed AUTH for the server going down
+                client.ping()
+                client.shutdown(nosave=True)
+        except RedisError:
+            return False
+        try:
+            self.process.wait(timeout=self._timeout)
+        except subprocess.TimeoutExpired:
+            return False
+        return True
+
+    def remove_files(self) -> None:
+        """Remove server's log, pidfile, RDB snapshot, unix socket and cluster config."""
+        for path in self.files:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
     def _check_unixsocket_length(self) -> None:
         """Check unixsocket length."""
         if len(self.unixsocket) > MAX_UNIXSOCKET:
@@ -183,15 +415,7 @@ class RedisExecutor(TCPExecutor):
     @property
     def version(self) -> Any:
         """Return redis version."""
-        with os.popen(f"{self.executable} --version") as version_output:
-            version_string = version_output.read()
-        if not version_string:
-            raise RedisMisconfigured(
-                f"Bad path to redis_exec is given:"
-                f" {self.executable} not exists or wrong program"
-            )
-
-        return extract_version(version_string)
+        return redis_version(self.executable, self.version_cache)
 
     def _check_version(self) -> None:
         """Check redises version if it's compatible."""
@@ -0,0 +1,251 @@
+"""Proxy between redis clients and the server, injecting network conditions."""
+
+import asyncio
+import random
+import socket
+import struct
+from typing import List, Optional, Tuple, TypedDict, Union
+
+from pytest_redis.executor.noop import NoopRedis
+from pytest_redis.executor.process import RedisExecutor
+from pytest_redis.executor.threaded import ThreadedServer
+
+CHUNK_SIZE = 65536
+"""
+Maximum size of the data forwarded at once.
+"""
+
+
+class ProxyStatsType(TypedDict):
+    """Traffic that passed through the proxy."""
+
+    connections: int
+    resets: int
+    bytes_sent: int
+    bytes_received: int
+    round_trips: int
+
+
+class ProxyConnection:
+    """Client's connection, passed through the proxy to the server."""
+
+    def __init__(
+        self, client_writer: asyncio.StreamWriter, server_writer: asyncio.StreamWriter
+    ) -> None:
+        """Initialize ProxyConnection.
+
+        :param client_writer: stream to the client
+        :param server_writer: stream to the server
+        """
+        self.client_writer = client_writer
+        self.server_writer = server_writer
+        self.awaiting_reply = False
+
+    def reset(self) -> None:
+        """Reset the connection, both to the client and to the server."""
+        for writer in (self.client_writer, self.server_writer):
+            if writer.transport.is_closing():
+                continue
+            sock = writer.get_extra_info("socket")
+            if sock is not None and sock.family != socket.AF_UNIX:
+                # close with RST rather than FIN
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+            writer.transport.abort()
+
+
+class RedisProxy(ThreadedServer):
+    """Local proxy between redis clients and the server, injecting network conditions.
+
+    Asyncio TCP (or unix socket) proxy, running in its own thread, forwards the traffic
+    both ways, delaying each chunk of data by the latency, give or take the jitter,
+    and limiting the throughput to the bandwidth. Delayed chunks don't hold up
+    the ones read after them, so pipelined commands pay the latency once,
+    the same way as they do over a real network.
+    Connections can be reset at random (``reset_rate`` - chance of each chunk
+    the client sends), or all at once with :meth:`reset_connections`.
+
+    Network conditions are read for each chunk, so they can be changed while the proxy runs.
+    It has the same connection attributes as the redis executors have,
+    so that the client fixtures can connect through it.
+    """
+
+    thread_name = "pytest-redis-proxy"
+
+    def __init__(
+        self,
+        upstream: Union[NoopRedis, RedisExecutor],
+        host: str = "127.0.0.1",
+        port: int = 0,
+        unixsocket: Optional[str] = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        bandwidth: Optional[int] = None,
+        reset_rate: float = 0.0,
+        seed: Optional[int] = None,
+        timeout: int = 15,
+    ) -> None:
+        """Initialize RedisProxy.
+
+        :param upstream: process fixture's executor of the server to pass the traffic to
+        :param host: host to listen on
+        :param port: port to listen on, 0 to pick a free one when started
+        :param unixsocket: path of the unix socket to listen on, instead of TCP
+        :param latency: one way delay of each chunk of data, in seconds
+        :param jitter: maximum random deviation from the latency, in seconds
+        :param bandwidth: throughput limit of each connection's direction, in bytes per second
+        :param reset_rate: chance of the connection getting reset
+            when the client sends a chunk of data, from 0 to 1
+        :param seed: seed of the jitter and resets, for repeatable runs
+        :param timeout: how long to wait for the proxy to start or stop
+        """
+        super().__init__(host, port, unixsocket, timeout)
+        self.upstream = upstream
+        self.username = upstream.username
+        self.password = upstream.password
+        self.latency = latency
+        self.jitter = jitter
+        self.bandwidth = bandwidth
+        self.reset_rate = reset_rate
+        self._random = random.Random(seed)
+        self._proxied: List[ProxyConnection] = []
+        self.connections = 0
+        self.resets = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.round_trips = 0
+
+    def stats(self) -> ProxyStatsType:
+        """Return traffic that passed through the proxy.
+
+        Bytes sent are the ones client sent to the server, received - the server's replies.
+        Round trip is counted when the client sends data after the server's reply (or first),
+        so the whole pipeline counts as a single round trip.
+        """
+        return ProxyStatsType(
+            connections=self.connections,
+            resets=self.resets,
+            bytes_sent=self.bytes_sent,
+            bytes_received=self.bytes_received,
+            round_trips=self.round_trips,
+        )
+
+    def reset_stats(self) -> None:
+        """Start counting the traffic from zero."""
+        self.connections = self.resets = 0
+        self.bytes_sent = self.bytes_received = self.round_trips = 0
+
+    def reset_connections(self) -> int:
+        """Reset all the connections passing through the proxy.
+
+        :returns: number of connections reset
+        """
+        if not self._loop or not self.running():
+            return 0
+        return asyncio.run_coroutine_threadsafe(self._reset_all(), self._loop).result(self.timeout)
+
+    async def _reset_all(self) -> int:
+        """Reset all the connections, from within the event loop."""
+        proxied, self._proxied = self._proxied, []
+        for connection in proxied:
+            connection.reset()
+        self.resets += len(proxied)
+        return len(proxied)
+
+    def _delay(self) -> float:
+        """Return the delay of the next chunk of data."""
+        jitter = self._random.uniform(-self.jitter, self.jitter) if self.jitter else 0.0
+        return max(self.latency + jitter, 0.0)
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Pass the traffic between the client and the server, until either disconnects."""
+        task = self._register_connection(writer)
+        try:
+            if self.upstream.unixsocket:
+                server_reader, server_writer = await asyncio.open_unix_connection(
+                    self.upstream.unixsocket
+                )
+            else:
+                server_reader, server_writer = await asyncio.open_connection(
+                    self.upstream.host, self.upstream.port
+                )
+        except OSError:
+            self._connections.pop(task, None)
+            writer.transport.abort()
+            return
+        self._register_connection(server_writer)
+        connection = ProxyConnection(writer, server_writer)
+        self._proxied.append(connection)
+        self.connections += 1
+        try:
+            await asyncio.gather(
+                self._forward(reader, server_writer, connection, to_server=True),
+                self._forward(server_reader, writer, connection, to_server=False),
+            )
+        finally:
+            if connection in self._proxied:
+                self._proxied.remove(connection)
+            self._connections.pop(task, None)
+            writer.close()
+            server_writer.close()
+
+    async def _forward(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        connection: ProxyConnection,
+        to_server: bool,
+    ) -> None:
+        """Read the data from one side, and queue it to be sent to the other one."""
+        loop = asyncio.get_running_loop()
+        queue: "asyncio.Queue[Tuple[float, bytes]]" = asyncio.Queue()
+        sender = asyncio.ensure_future(self._send(queue, writer))
+        try:
+            while data := await reader.read(CHUNK_SIZE):
+                if to_server:
+                    if self.reset_rate and self._random.random() < self.reset_rate:
+                        if connection in self._proxied:
+                            self._proxied.remove(connection)
+                            self.resets += 1
+                        connection.reset()
+                        return
+                    self.bytes_sent += len(data)
+                    if not connection.awaiting_reply:
+                        self.round_trips += 1
+                        connection.awaiting_reply = True
+                else:
+                    self.bytes_received += len(data)
+                    connection.awaiting_reply = False
+                queue.put_nowait((loop.time() + self._delay(), data))
+            if not writer.transport.is_closing():
+                # pass the disconnection on, once the data read before it is sent
+                queue.put_nowait((loop.time() + self._delay(), b""))
+                await sender
+        except (ConnectionError, OSError):
+            connection.reset()
+        finally:
+            sender.cancel()
+            await asyncio.gather(sender, return_exceptions=True)
+
+    async def _send(
+        self, queue: "asyncio.Queue[Tuple[float, bytes]]", writer: asyncio.StreamWriter
+    ) -> None:
+        """Send the queued data, in order, once it's due and the bandwidth allows."""
+        loop = asyncio.get_running_loop()
+        free_at = 0.0
+        while True:
+            due_at, data = await queue.get()
+            if not data:
+                await asyncio.sleep(max(due_at - loop.time(), 0.0))
+                writer.close()
+                return
+            piece_size = max(self.bandwidth // 100, 1) if self.bandwidth else len(data)
+            for offset in range(0, len(data), piece_size):
+                piece = data[offset : offset + piece_size]
+                free_at = max(due_at, free_at)
+                if self.bandwidth:
+                    free_at += len(piece) / self.bandwidth
+                await asyncio.sleep(max(free_at - loop.time(), 0.0))
+                writer.write(piece)
+                await writer.drain()
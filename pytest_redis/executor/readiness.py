@@ -0,0 +1,115 @@
+"""Checking whether redis server is ready to serve clients."""
+
+import socket
+import time
+from typing import Callable, List, Optional, Tuple, TypeVar, Union
+
+from mirakuru import TCPExecutor
+from mirakuru.exceptions import TimeoutExpired
+
+from pytest_redis.resp import resp_command
+
+NOT_READY_REPLIES = (b"-LOADING", b"-BUSY", b"-MASTERDOWN")
+"""
+Error replies of a server that is up, but not yet able to serve clients.
+"""
+
+RedisTCPExecutorType = TypeVar("RedisTCPExecutorType", bound="RedisTCPExecutor")
+
+
+def redis_ping(
+    address: Union[str, Tuple[str, int]],
+    username: Optional[str] = None,
+    password: Optional[str] = None,
+    timeout: float = 0.1,
+) -> bool:
+    """Check if redis server answers PING, authenticating first if needed.
+
+    AUTH and PING are sent together, and their replies read in a single round trip.
+
+    :param address: unix socket path, or host and port pair
+    :param username: server's username
+    :param password: server's password
+    :param timeout: socket timeout
+    :returns: True if server is ready to serve clients
+    """
+    commands: List[bytes] = []
+    if password:
+        credentials = [username, password] if username else [password]
+        commands.append(resp_command("AUTH", *credentials))
+    commands.append(resp_command("PING"))
+    family = socket.AF_UNIX if isinstance(address, str) else socket.AF_INET
+    with socket.socket(family, socket.SOCK_STREAM) as sock:
+        try:
+            sock.settimeout(timeout)
+            sock.connect(address)
+            sock.sendall(b"".join(commands))
+            replies = b""
+            while replies.count(b"\r\n") < len(commands):
+                chunk = sock.recv(1024)
+                if not chunk:
+                    return False
+                replies += chunk
+        except OSError:
+            return False
+    ping_reply = replies.split(b"\r\n")[len(commands) - 1]
+    return not ping_reply.startswith(NOT_READY_REPLIES)
+
+
+class RedisTCPExecutor(TCPExecutor):
+    """TCPExecutor checking redis readiness with PING instead of bare TCP connection.
+
+    Server is probed over its unix socket if there's one, and probes
+    get less frequent the longer server takes to get ready.
+    """
+
+    BACKOFF_START: float = 0.001
+    """
+    Delay after the first failed readiness probe, doubled after each next one.
+    """
+    BACKOFF_MAX: float = 0.1
+    """
+    Longest delay between readiness probes.
+    """
+
+    host: str
+    port: int
+    unixsocket: Optional[str]
+    username: Optional[str]
+    password: Optional[str]
+
+    ready_time: Optional[float] = None
+    """
+    Seconds it took the server to get ready during the last start.
+    """
+    ready_probes: int = 0
+    """
+    Number of readiness probes sent during the last start.
+    """
+
+    def redis_available(self) -> bool:
+        """Return True if redis answers PING."""
+        self.ready_probes += 1
+        address: Union[str, Tuple[str, int]] = self.unixsocket or (self.host, self.port)
+        return redis_ping(address, self.username, self.password)
+
+    def after_start_check(self) -> bool:
+        """Check if redis is ready to serve clients."""
+        return self.redis_available()
+
+    def wait_for(self: RedisTCPExecutorType, wait_for: Callable[[], bool]) -> RedisTCPExecutorType:
+        """Wait for callback to return True, checking more often at first.
+
+        :param wait_for: callback to call
+        :raises: mirakuru.exceptions.TimeoutExpired
+        :returns: itself
+        """
+        delay = self.BACKOFF_START
+        while self.check_timeout():
+            if wait_for():
+                return self
+            time.sleep(delay)
+            delay = min(delay * 2, self.BACKOFF_MAX)
+
+        self.kill()
+        raise TimeoutExpired(self, timeout=self._timeout)
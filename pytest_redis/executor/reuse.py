@@ -0,0 +1,242 @@
+"""Redis server kept running between test sessions."""
+
+import errno
+import hashlib
+import os
+import stat
+import subprocess
+import sys
+import time
+from pathlib import Path
+from tempfile import gettempdir
+from typing import Callable, Dict, Optional, TypedDict
+
+import redis
+from mirakuru.exceptions import TimeoutExpired
+from pytest import Cache
+from redis.exceptions import RedisError
+
+from pytest_redis.exception import RedisMisconfigured
+from pytest_redis.executor.process import RedisExecutor
+from pytest_redis.executor.readiness import redis_ping
+from pytest_redis.executor.standby import reset_server
+
+REUSE_CACHE_KEY = "pytest-redis/reuse/{name}"
+"""
+Key of the pytest's cache entry holding the reused server's state.
+"""
+
+SECRET_CONFIG = ("requirepass", "masterauth")
+"""
+Configuration parameters holding the password, not to be kept in pytest's cache.
+They're set from the server's command line, so they're restored from the executor's password.
+"""
+
+
+class ReusedServerType(TypedDict):
+    """State of the server kept running between test sessions."""
+
+    pid: int
+    port: int
+    unixsocket: str
+    command_hash: str
+    config: Dict[str, str]
+
+
+def reuse_datadir(rootpath: Path, name: str) -> Path:
+    """Return data directory of the reused server, the same in each test session.
+
+    Directories are kept in the user's private directory within the system's temporary one,
+    which is refused if someone else owns it, or other users can access it.
+
+    :param rootpath: pytest's rootdir, so that projects don't share the servers
+    :param name: name of the process fixture
+    """
+    user_dir = Path(gettempdir()) / f"pytest-redis-of-{os.getuid()}"
+    user_dir.mkdir(mode=0o700, exist_ok=True)
+    user_dir_stat = user_dir.lstat()
+    if (
+        not stat.S_ISDIR(user_dir_stat.st_mode)
+        or user_dir_stat.st_uid != os.getuid()
+        or user_dir_stat.st_mode & 0o077
+    ):
+        raise RedisMisconfigured(
+            f"Directory {user_dir} for the reused servers' data has to be owned "
+            "by the current user, and not accessible to the other ones."
+        )
+    key = hashlib.sha256(f"{rootpath}:{name}".encode()).hexdigest()[:12]
+    datadir = user_dir / f"reuse-{key}"
+    datadir.mkdir(mode=0o700, exist_ok=True)
+    return datadir
+
+
+def command_hash(executor: RedisExecutor) -> str:
+    """Return hash of the full redis-server command line."""
+    return hashlib.sha256(executor.command.encode()).hexdigest()
+
+
+def pid_alive(pid: int) -> bool:
+    """Check if there's a process with the given pid."""
+    try:
+        os.kill(pid, 0)
+    except OSError as err:
+        return err.errno != errno.ESRCH
+    return True
+
+
+class ReusableServer:
+    """Redis server left running after the test session, and reattached to by the next one.
+
+    Server's pid, port, unix socket, hash of its command line and its initial configuration
+    (except for the passwords) are kept in pytest's cache. Server is reattached to
+    if its command line didn't change, and reset - data, scripts, stats and changed
+    configuration parameters, the same way the standby servers are recycled.
+    Otherwise it's shut down and a new one is started.
+    Server is started daemonized, so it survives the session, together with a watchdog
+    shutting it down once it's idle for the given time.
+    """
+
+    def __init__(
+        self,
+        executor_factory: Callable[[Optional[int]], RedisExecutor],
+        cache: Cache,
+        name: str,
+        fixed_port: Optional[int] = None,
+        idle_timeout: int = 900,
+        startup_timeout: int = 60,
+    ) -> None:
+        """Initialize ReusableServer.
+
+        :param executor_factory: callable creating RedisExecutor for the given port,
+            or for the newly selected port if given None
+        :param cache: pytest's cache to keep server's state in
+        :param name: name of the process fixture
+        :param fixed_port: port the server has to listen on, if it's configured explicitly
+        :param idle_timeout: seconds after which server no one uses gets shut down
+        :param startup_timeout: how long to wait for the server to start or shut down
+        """
+        self.executor_factory = executor_factory
+        self.cache = cache
+        self.cache_key = REUSE_CACHE_KEY.format(name=name)
+        self.fixed_port = fixed_port
+        self.idle_timeout = idle_timeout
+        self.startup_timeout = startup_timeout
+        self.reattached = False
+
+    def start(self) -> RedisExecutor:
+        """Reattach to the server left by the previous session, or start a new one."""
+        state: Optional[ReusedServerType] = self.cache.get(self.cache_key, None)
+        if state and self.fixed_port in (None, state["port"]) and "config" in state:
+            executor = self.executor_factory(state["port"])
+            started_at = time.monotonic()
+            if command_hash(executor) == state["command_hash"] and self._alive(executor, state):
+                with self._client(executor.unixsocket, executor) as client:
+                    reset_server(client, {**state["config"], **self._secret_config(executor)})
+                executor.ready_time = time.monotonic() - started_at
+                self.reattached = True
+                return executor
+        executor = self.executor_factory(self.fixed_port)
+        if state:
+            self._shutdown(state, executor)
+
+        pid = self._start_detached(executor)
+        with self._client(executor.unixsocket, executor) as client:
+            initial_config = client.config_get("*")
+        self.cache.set(
+            self.cache_key,
+            ReusedServerType(
+                pid=pid,
+                port=executor.port,
+                unixsocket=executor.unixsocket,
+                command_hash=command_hash(executor),
+                config={
+                    parameter: value
+                    for parameter, value in initial_config.items()
+                    if parameter not in SECRET_CONFIG
+                },
+            ),
+        )
+        return executor
+
+    @staticmethod
+    def _client(unixsocket: str, executor: RedisExecutor) -> redis.Redis:
+        """Return client connected to the server on the unix socket, with executor's credentials."""
+        return redis.Redis(
+            unix_socket_path=unixsocket,
+            username=executor.username,
+            password=executor.password,
+            decode_responses=True,
+        )
+
+    @staticmethod
+    def _secret_config(executor: RedisExecutor) -> Dict[str, str]:
+        """Return initial values of the configuration parameters holding the password."""
+        return {parameter: executor.password or "" for parameter in SECRET_CONFIG}
+
+    @staticmethod
+    def _alive(executor: RedisExecutor, state: ReusedServerType) -> bool:
+        """Check if server from the previous session still runs and answers PING."""
+        return pid_alive(state["pid"]) and redis_ping(
+            state["unixsocket"], executor.username, executor.password
+        )
+
+    def _shutdown(self, state: ReusedServerType, executor: RedisExecutor) -> None:
+        """Shut down server left by the previous session, with no longer matching config."""
+        self.cache.set(self.cache_key, None)
+        if not self._alive(executor, state):
+            return
+        try:
+            with self._client(state["unixsocket"], executor) as client:
+                client.shutdown(nosave=True)
+        except RedisError:
+            pass
+        deadline = time.monotonic() + self.startup_timeout
+        while pid_alive(state["pid"]) and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def _start_detached(self, executor: RedisExecutor) -> int:
+        """Start server daemonized, along with its idle watchdog.
+
+        Daemonized server doesn't belong to the session's process tree,
+        so it's not killed once the session ends.
+
+        :returns: server's pid
+        """
+        # pylint:disable=protected-access
+        executor._check_unixsocket_length()
+        executor._check_version()
+        # pylint:enable=protected-access
+        if executor.pre_start_check():
+            raise RedisMisconfigured(
+                f"Can't start reusable redis-server, its unix socket {executor.unixsocket} "
+                f"or port {executor.port} is in use already."
+            )
+        command = list(executor.command_parts)
+        command[command.index("--daemonize") + 1] = "yes"
+        started_at = time.monotonic()
+        subprocess.run(command, check=True, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL)
+        delay = executor.BACKOFF_START
+        while not executor.redis_available():
+            if time.monotonic() - started_at > self.startup_timeout:
+                raise TimeoutExpired(executor, timeout=self.startup_timeout)
+            time.sleep(delay)
+            delay = min(delay * 2, executor.BACKOFF_MAX)
+        executor.ready_time = time.monotonic() - started_at
+        pidfile = Path(command[command.index("--pidfile") + 1])
+
+        environment = os.environ.copy()
+        environment["PYTEST_REDIS_USERNAME"] = executor.username or ""
+        environment["PYTEST_REDIS_PASSWORD"] = executor.password or ""
+        subprocess.run(
+            [
+                sys.executable,
+                str(Path(__file__).with_name("watchdog.py")),
+                executor.unixsocket,
+                str(self.idle_timeout),
+            ],
+            check=True,
+            env=environment,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+        )
+        return int(pidfile.read_text(encoding="utf-8").strip())
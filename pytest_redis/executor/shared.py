@@ -0,0 +1,121 @@
+"""Redis class representing a server shared between pytest-xdist workers."""
+
+from typing import Dict, Optional, TypedDict
+from weakref import WeakKeyDictionary
+
+from pytest import Config
+
+from pytest_redis.executor.noop import NoopRedis
+
+SHARED_SERVER_KEY = "pytest_redis_shared_server"
+
+SHARED_FIXTURE_SLOTS = 4
+"""
+Number of process fixtures each worker can attach to the shared server,
+each one using its own block of databases.
+"""
+
+SHARED_SLOTS: "WeakKeyDictionary[Config, Dict[str, int]]" = WeakKeyDictionary()
+"""
+Slots taken by the worker's process fixtures, keyed by the fixture name.
+"""
+
+
+class SharedServerType(TypedDict):
+    """Shared redis-server's details passed to xdist workers."""
+
+    host: str
+    port: int
+    unixsocket: str
+    username: Optional[str]
+    password: Optional[str]
+    databases: int
+    slots: int
+
+
+def get_worker_index(config: Config) -> Optional[int]:
+    """Return xdist worker's number or None if not running in a worker."""
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is None:
+        return None
+    return int(workerinput["workerid"].lstrip("gw"))
+
+
+def get_shared_server(config: Config) -> Optional[SharedServerType]:
+    """Return shared redis-server's details if the xdist controller has started one."""
+    workerinput = getattr(config, "workerinput", {})
+    return workerinput.get(SHARED_SERVER_KEY)
+
+
+def get_shared_slot(config: Config, fixture_name: str, slots: int) -> int:
+    """Return the slot of the worker's block of databases the process fixture uses.
+
+    :param config: worker's pytest config
+    :param fixture_name: name of the process fixture
+    :param slots: number of slots each worker has
+    :returns: slot's index, the same one for the same fixture
+    """
+    taken = SHARED_SLOTS.setdefault(config, {})
+    if fixture_name not in taken:
+        if len(taken) >= slots:
+            raise ValueError(
+                f"Process fixture {fixture_name} can't use the shared redis-server, "
+                f"only {slots} process fixtures can share it: {', '.join(taken)}. "
+                "Opt out with xdist_shared=False."
+            )
+        taken[fixture_name] = len(taken)
+    return taken[fixture_name]
+
+
+class SharedRedis(NoopRedis):
+    """Redis instance started on xdist controller and shared by all the workers.
+
+    Each process fixture of each worker gets its own block of databases
+    on the shared server, starting at ``db_offset``.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        db_offset: int,
+        databases: int,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        unixsocket: Optional[str] = None,
+        startup_timeout: int = 15,
+    ) -> None:
+        """Init method of SharedRedis.
+
+        :param host: server's host
+        :param port: server's port
+        :param db_offset: index of the first database assigned to the process fixture
+        :param databases: number of databases assigned to the process fixture
+        :param username: server's username
+        :param password: server's password
+        :param unixsocket: server's unix socket path
+        :param startup_timeout: executor's timeout for start and stop actions
+        """
+        self.db_offset = db_offset
+        self.databases = databases
+        super().__init__(
+            host,
+            port,
+            username=username,
+            password=password,
+            unixsocket=unixsocket,
+            startup_timeout=startup_timeout,
+        )
+
+    def db_index(self, dbnum: int) -> int:
+        """Translate fixture's database number into the shared server's one.
+
+        :param dbnum: database number as requested by the client fixture
+        :returns: database number on the shared server
+        """
+        if not 0 <= dbnum < self.databases:
+            raise ValueError(
+                f"Database number {dbnum} is out of range for the shared redis server. "
+                f"Each process fixture of xdist worker gets {self.databases} databases."
+            )
+        return self.db_offset + dbnum
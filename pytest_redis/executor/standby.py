@@ -0,0 +1,148 @@
+"""Pool of already started redis servers waiting to be used."""
+
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Set, Union
+
+import redis
+from redis.exceptions import RedisError
+
+from pytest_redis.executor.process import RedisExecutor
+
+
+def reset_server(client: redis.Redis, initial_config: Dict[str, str]) -> None:
+    """Bring the server back to its initial state.
+
+    Data, scripts, stats and configuration parameters changed since the server started get reset.
+
+    :param client: client connected to the server, decoding the responses
+    :param initial_config: server's configuration parameters (``CONFIG GET *``) once it started
+    """
+    client.flushall()
+    client.script_flush()
+    for parameter, value in client.config_get("*").items():
+        if initial_config.get(parameter) != value:
+            client.config_set(parameter, initial_config[parameter])
+    client.config_resetstat()
+
+
+class StandbyPool:
+    """Pool of already started redis servers waiting to be used.
+
+    Servers get started in background threads, so when a test takes one,
+    a replacement starts while the test runs.
+    Returned servers are either killed, or recycled to be used again.
+
+    Executors are created on the thread using the pool, and only started in the background.
+    That way their ports are selected one after another, excluding the ones
+    of the pool's other servers, which might not be listening yet.
+    """
+
+    def __init__(
+        self,
+        executor_factory: Callable[[Set[int]], RedisExecutor],
+        size: int,
+        recycle: bool = False,
+    ) -> None:
+        """Initialize StandbyPool.
+
+        :param executor_factory: callable creating new, not yet started, RedisExecutor,
+            listening on the port other than the given ones
+        :param size: number of servers kept started and waiting to be used
+        :param recycle: whether to reset and reuse returned servers, instead of killing them
+        """
+        assert size > 0, "standby pool needs at least one server"
+        self.executor_factory = executor_factory
+        self.size = size
+        self.recycle = recycle
+        self.standby: "queue.Queue[Union[RedisExecutor, BaseException, None]]" = queue.Queue()
+        self.configs: Dict[RedisExecutor, Dict[str, str]] = {}
+        self.executors: List[RedisExecutor] = []
+        self.threads = ThreadPoolExecutor(max_workers=size, thread_name_prefix="pytest-redis")
+        self.filled = False
+
+    def _create(self) -> RedisExecutor:
+        """Create new executor, on the port none of the pool's servers uses."""
+        executor = self.executor_factory({executor.port for executor in list(self.executors)})
+        self.executors.append(executor)
+        return executor
+
+    def _spawn(self, executor: RedisExecutor) -> None:
+        """Start the server and put it on standby."""
+        try:
+            executor.start()
+            with self._client(executor) as client:
+                self.configs[executor] = client.config_get("*")
+        except BaseException as exc:  # pylint:disable=broad-except
+            self.executors.remove(executor)
+            self.standby.put(exc)
+        else:
+            self.standby.put(executor)
+
+    def _submit(self, task: Callable[..., None], *args: RedisExecutor) -> None:
+        """Run task in the background."""
+        self.threads.submit(task, *args)
+
+    @staticmethod
+    def _client(executor: RedisExecutor) -> redis.Redis:
+        """Return client connected to the executor's server."""
+        return redis.Redis(
+            unix_socket_path=executor.unixsocket,
+            username=executor.username,
+            password=executor.password,
+            decode_responses=True,
+        )
+
+    def acquire(self) -> RedisExecutor:
+        """Take started server out of the pool, waiting for one if needed."""
+        if not self.filled:
+            self.filled = True
+            for _ in range(self.size):
+                self._submit(self._spawn, self._create())
+        while (executor := self.standby.get()) is None:
+            # recycling failed and the server got stopped, start its replacement
+            self._submit(self._spawn, self._create())
+        if isinstance(executor, BaseException):
+            # the next acquire waits for the failed server's replacement
+            self._submit(self._spawn, self._create())
+            raise executor
+        if not self.recycle:
+            self._submit(self._spawn, self._create())
+        return executor
+
+    def release(self, executor: RedisExecutor) -> None:
+        """Return server to the pool, to be recycled or stopped in the background."""
+        if self.recycle:
+            self._submit(self._recycle, executor)
+        else:
+            self._submit(self._stop, executor)
+
+    def _stop(self, executor: RedisExecutor) -> None:
+        """Stop the server."""
+        executor.stop()
+        self.configs.pop(executor, None)
+        self.executors.remove(executor)
+
+    def _recycle(self, executor: RedisExecutor) -> None:
+        """Bring server back to its initial state and put it on standby.
+
+        Data, scripts, stats and changed configuration parameters get reset.
+        If that's not possible, server is stopped, and the next :meth:`acquire`
+        starts its replacement.
+        """
+        try:
+            with self._client(executor) as client:
+                reset_server(client, self.configs[executor])
+        except (RedisError, KeyError, OSError):
+            self._stop(executor)
+            self.standby.put(None)
+        else:
+            self.standby.put(executor)
+
+    def close(self) -> None:
+        """Stop all servers, once the background tasks are done."""
+        self.threads.shutdown(wait=True)
+        for executor in list(self.executors):
+            executor.stop()
+        self.executors.clear()
+        self.configs.clear()
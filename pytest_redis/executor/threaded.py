@@ -0,0 +1,134 @@
+"""Asyncio server running in a thread of the test process."""
+
+import abc
+import asyncio
+import threading
+import time
+from types import TracebackType
+from typing import Dict, List, Optional, Type, TypeVar
+
+ServerT = TypeVar("ServerT", bound="ThreadedServer")
+
+
+class ThreadedServer(abc.ABC):
+    """Asyncio server, with its event loop running in a background thread.
+
+    There's no process to spawn and nothing to poll for readiness,
+    the server is ready to serve clients once it's listening.
+    Subclasses serve the connections in ``_handle_connection``,
+    registering the streams to close when the server stops.
+    """
+
+    thread_name = "pytest-redis-server"
+
+    def __init__(self, host: str, port: int, unixsocket: Optional[str], timeout: int) -> None:
+        """Initialize ThreadedServer.
+
+        :param host: host to listen on
+        :param port: port to listen on, 0 to pick a free one when started
+        :param unixsocket: path of the unix socket to listen on, instead of TCP
+        :param timeout: how long to wait for the server to start or stop
+        """
+        self.host = host
+        self.port = port
+        self.unixsocket = unixsocket
+        self.timeout = timeout
+        self.ready_time: Optional[float] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._connections: Dict["asyncio.Task[None]", List[asyncio.StreamWriter]] = {}
+
+    def start(self: ServerT) -> ServerT:
+        """Start serving clients in a background thread."""
+        if self.running():
+            return self
+        started_at = time.monotonic()
+        listening = threading.Event()
+        errors: List[BaseException] = []
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._serve, args=(listening, errors), name=self.thread_name, daemon=True
+        )
+        self._thread.start()
+        if not listening.wait(self.timeout):
+            raise TimeoutError(f"{type(self).__name__} didn't start within {self.timeout} seconds")
+        if errors:
+            self._thread.join()
+            raise errors[0]
+        self.ready_time = time.monotonic() - started_at
+        return self
+
+    def stop(self: ServerT) -> ServerT:
+        """Stop the server, disconnecting all its clients."""
+        if self._loop and self._thread:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(self.timeout)
+        self._thread = None
+        return self
+
+    def running(self) -> bool:
+        """Check if the server is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def __enter__(self: ServerT) -> ServerT:
+        """Start the server in the context manager."""
+        return self.start()
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Stop the server when leaving the context manager."""
+        self.stop()
+
+    def _serve(self, listening: threading.Event, errors: List[BaseException]) -> None:
+        """Run the server's event loop, until it's stopped."""
+        assert self._loop
+        loop = self._loop
+        asyncio.set_event_loop(loop)
+        try:
+            if self.unixsocket:
+                server = loop.run_until_complete(
+                    asyncio.start_unix_server(self._handle_connection, self.unixsocket)
+                )
+            else:
+                server = loop.run_until_complete(
+                    asyncio.start_server(self._handle_connection, self.host, self.port)
+                )
+        except OSError as error:
+            errors.append(error)
+            loop.close()
+            listening.set()
+            return
+        if not self.unixsocket:
+            self.port = server.sockets[0].getsockname()[1]
+        listening.set()
+        try:
+            loop.run_forever()
+        finally:
+            server.close()
+            connections = list(self._connections)
+            for writers in self._connections.values():
+                for writer in writers:
+                    writer.transport.abort()
+            loop.run_until_complete(asyncio.gather(*connections, return_exceptions=True))
+            loop.run_until_complete(server.wait_closed())
+            loop.close()
+
+    def _register_connection(self, *writers: asyncio.StreamWriter) -> "asyncio.Task[None]":
+        """Register current connection's streams, to close them when the server stops.
+
+        :returns: task serving the connection
+        """
+        task = asyncio.current_task()
+        assert task
+        self._connections.setdefault(task, []).extend(writers)
+        return task
+
+    @abc.abstractmethod
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve client's connection, until it disconnects."""
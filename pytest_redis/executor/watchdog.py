@@ -0,0 +1,71 @@
+"""Watchdog shutting down the reused redis server once it's idle.
+
+Run as ``python watchdog.py <unixsocket> <idle timeout>``,
+with server's credentials in ``PYTEST_REDIS_USERNAME`` and ``PYTEST_REDIS_PASSWORD``
+environment variables. Watchdog detaches itself and returns right away.
+"""
+
+import os
+import sys
+import time
+from typing import List, Tuple
+
+import redis
+from redis.exceptions import RedisError
+
+
+def is_idle(client: redis.Redis, commands_before: int) -> Tuple[bool, int]:
+    """Check if anyone but the watchdog used the server since the last check.
+
+    :param client: watchdog's client
+    :param commands_before: commands processed by the server at the last check
+    :returns: whether server is idle, and the number of commands it processed
+    """
+    info = client.info()
+    commands = int(info["total_commands_processed"])
+    # watchdog's own connection and INFO command don't count
+    return int(info["connected_clients"]) <= 1 and commands - commands_before <= 1, commands
+
+
+def watch(client: redis.Redis, idle_timeout: float) -> None:
+    """Shut down the server once it's idle for idle_timeout seconds.
+
+    Watchdog quits once it loses connection to the server, e.g. when it was shut down.
+
+    :param client: watchdog's client
+    :param idle_timeout: seconds after which idle server is shut down
+    """
+    interval = min(idle_timeout / 10, 5.0)
+    idle_since = time.monotonic()
+    commands = -1
+    try:
+        while True:
+            time.sleep(interval)
+            idle, commands = is_idle(client, commands)
+            if not idle:
+                idle_since = time.monotonic()
+            elif time.monotonic() - idle_since >= idle_timeout:
+                client.shutdown(nosave=True)
+                return
+    except RedisError:
+        return
+
+
+def main(argv: List[str]) -> None:
+    """Detach from the parent and watch the server."""
+    unixsocket, idle_timeout = argv
+    if os.fork():
+        return
+    os.setsid()
+    client = redis.Redis(
+        unix_socket_path=unixsocket,
+        username=os.environ.get("PYTEST_REDIS_USERNAME") or None,
+        password=os.environ.get("PYTEST_REDIS_PASSWORD") or None,
+        single_connection_client=True,
+    )
+    watch(client, float(idle_timeout))
+    os._exit(0)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,7 +1,29 @@
 """Redis fixture factories."""
 
-from pytest_redis.factories.client import redisdb
+from pytest_redis.factories.client import async_redisdb, redisdb
+from pytest_redis.factories.cluster import redis_cluster_proc, redis_clusterdb
+from pytest_redis.factories.group import redis_proc_group
+from pytest_redis.factories.inproc import redis_inproc
+from pytest_redis.factories.isolated import redis_isolated_proc
+from pytest_redis.factories.load import redis_load
 from pytest_redis.factories.noproc import redis_noproc
 from pytest_redis.factories.proc import redis_proc
+from pytest_redis.factories.proxy import redis_proxy
+from pytest_redis.factories.replica import redis_replica_proc
+from pytest_redis.factories.seeded import seeded_redisdb
 
-__all__ = ("redis_proc", "redis_noproc", "redisdb")
+__all__ = (
+    "redis_proc",
+    "redis_noproc",
+    "redis_isolated_proc",
+    "redisdb",
+    "async_redisdb",
+    "seeded_redisdb",
+    "redis_cluster_proc",
+    "redis_clusterdb",
+    "redis_replica_proc",
+    "redis_proc_group",
+    "redis_inproc",
+    "redis_load",
+    "redis_proxy",
+)
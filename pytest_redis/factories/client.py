@@ -1,26 +1,146 @@
 """Redis client fixture factory."""
 
-from typing import Callable, Generator, Literal, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    AsyncGenerator,
+    Callable,
+    Generator,
+    Literal,
+    Optional,
+    Union,
+    cast,
+)
 
 import pytest
 import redis
 from _pytest.fixtures import FixtureRequest
 
-from pytest_redis.config import get_config
-from pytest_redis.executor import NoopRedis, RedisExecutor
+from pytest_redis.cleanup import (
+    AsyncKeyTracker,
+    CleanupType,
+    KeyTracker,
+    async_flush,
+    check_cleanup,
+    flush,
+)
+from pytest_redis.config import RedisConfigType, get_config
+from pytest_redis.connection import async_close, get_connection_pool
+from pytest_redis.executor import (
+    InProcessRedis,
+    NoopRedis,
+    RedisExecutor,
+    RedisProxy,
+    SharedRedis,
+)
+from pytest_redis.memory import MemoryBudget, memory_budgets_key
+from pytest_redis.profiling import PROFILE_PROPERTY, CommandProfile, ProfiledRedis
+from pytest_redis.seed import SEEDED_SERVERS
+from pytest_redis.server_stats import server_stats_clients_key
+
+try:
+    import pytest_asyncio
+except ImportError:  # pragma: no cover
+    pytest_asyncio = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    import redis.asyncio
+
+    from pytest_redis.pool import RedisServerPool
+
+
+def get_process_fixture(
+    request: FixtureRequest, process_fixture_name: str
+) -> Union[NoopRedis, RedisExecutor]:
+    """Return the process fixture's executor, or the server test's ``redis`` marker selects.
+
+    Tests marked with ``@pytest.mark.redis(**options)`` run against the server
+    started with these options, taken from the session's server pool.
+    Bare ``redis`` marker, without any options, doesn't change the server.
+    """
+    marker = request.node.get_closest_marker("redis")
+    if marker is not None and marker.kwargs:
+        server_pool = cast(
+            "RedisServerPool", request.config.pluginmanager.get_plugin("redis_server_pool")
+        )
+        return server_pool.get(marker.kwargs, request.getfixturevalue("tmp_path_factory"))
+    proc_fixture: Union[NoopRedis, RedisExecutor] = request.getfixturevalue(process_fixture_name)
+    return proc_fixture
+
+
+def get_db_index(proc_fixture: Union[NoopRedis, RedisExecutor], dbnum: int) -> int:
+    """Return the database number to connect to on the process fixture's server."""
+    if isinstance(proc_fixture, SharedRedis):
+        return proc_fixture.db_index(dbnum)
+    return dbnum
+
+
+def check_keyspace_events(proc_fixture: Union[NoopRedis, RedisExecutor], feature: str) -> None:
+    """Check that the process fixture's server can send keyspace notifications.
+
+    In-process server (also behind a proxy) doesn't support pub/sub,
+    so the key tracking would fail on the first command.
+
+    :param proc_fixture: process fixture's executor
+    :param feature: what relies on keyspace notifications, for the error message
+    :raises pytest.UsageError: if the server doesn't support keyspace notifications
+    """
+    server: object = proc_fixture
+    while isinstance(server, RedisProxy):
+        server = server.upstream
+    if isinstance(server, InProcessRedis):
+        raise pytest.UsageError(
+            f"{feature} relies on keyspace notifications, "
+            "which the in-process redis server doesn't support."
+        )
+
+
+def get_cleanup(
+    proc_fixture: Union[NoopRedis, RedisExecutor],
+    config: RedisConfigType,
+    cleanup: Optional[str],
+) -> CleanupType:
+    """Return cleanup strategy to use for the process fixture.
+
+    FLUSHALL on a server shared between xdist workers would remove the other workers' data,
+    and on a seeded server - the seed's pristine copy, hence it's replaced with FLUSHDB.
+    Tracked cleanup gets rejected for servers without keyspace notifications.
+    """
+    redis_cleanup = check_cleanup(cleanup or config["cleanup"])
+    if redis_cleanup == "tracked":
+        check_keyspace_events(proc_fixture, "tracked cleanup")
+    if redis_cleanup == "flushall" and (
+        isinstance(proc_fixture, SharedRedis) or proc_fixture in SEEDED_SERVERS
+    ):
+        return "flushdb"
+    return redis_cleanup
 
 
 def redisdb(
-    process_fixture_name: str, dbnum: int = 0, decode: Optional[bool] = None
+    process_fixture_name: str,
+    dbnum: int = 0,
+    decode: Optional[bool] = None,
+    cleanup: Optional[str] = None,
 ) -> Callable[[FixtureRequest], Generator[redis.Redis, None, None]]:
     """Create connection fixture factory for pytest-redis.
 
     :param process_fixture_name: name of the process fixture
-    :param dbnum: number of database to use
+    :param dbnum: number of database to use.
+        With a redis-server shared between xdist workers, it's translated
+        into the database within the worker's own block of databases.
     :param decode: Client: to decode response or not.
         See redis.StrictRedis decode_reponse client parameter.
+    :param cleanup: How to clean the database after each test:
+
+        * flushall - remove data from all databases (default)
+        * flushdb - FLUSHDB ASYNC on the fixture's own database
+        * skip-empty - like flushdb, but skipped when the database is already empty
+        * tracked - remove only the keys touched during the test,
+          tracked with keyspace notifications
+
     :returns: function which makes a connection to redis
     """
+    if cleanup is not None:
+        check_cleanup(cleanup)
 
     @pytest.fixture
     def redisdb_factory(request: FixtureRequest) -> Generator[redis.Redis, None, None]:
@@ -28,38 +148,144 @@ def redisdb(
 
         #. Load required process fixture.
         #. Get redis module and config.
-        #. Connect to redis.
-        #. Flush database after tests.
+        #. Connect to redis through the session-wide connection pool.
+        #. Record client's commands if profiling is enabled.
+        #. Diff server's stats around the test's call if requested.
+        #. Check memory used by the test, if it's marked with ``redis_memory``.
+        #. Reset pooled connections' state after tests.
+        #. Clean database after tests (only the used database, if server is shared).
 
         :param FixtureRequest request: fixture request object
         :rtype: redis.client.Redis
         :returns: Redis client
         """
-        proc_fixture: Union[NoopRedis, RedisExecutor] = request.getfixturevalue(
-            process_fixture_name
+        proc_fixture = get_process_fixture(request, process_fixture_name)
+        config = get_config(request)
+
+        redis_db = get_db_index(proc_fixture, dbnum)
+        decode_responses: Union[Literal[True], Literal[False]] = (
+            decode if decode is not None else config["decode"]
         )
+
+        connection_pool = get_connection_pool(proc_fixture, redis_db, decode_responses)
+        profile: Optional[CommandProfile] = None
+        if config["profile"]:
+            profile = CommandProfile()
+            redis_client: redis.Redis = ProfiledRedis(
+                connection_pool=connection_pool, profile=profile
+            )
+        else:
+            redis_client = redis.Redis(connection_pool=connection_pool)
+
+        redis_cleanup = get_cleanup(proc_fixture, config, cleanup)
+        tracker: Optional[KeyTracker] = None
+        if redis_cleanup == "tracked":
+            # tracker's own commands are not the test's ones to profile
+            tracker = KeyTracker(
+                redis.Redis(connection_pool=connection_pool),
+                redis_db,
+                restore_events=not isinstance(proc_fixture, SharedRedis),
+            )
+            tracker.start()
+        if memory_marker := request.node.get_closest_marker("redis_memory"):
+            # measured by the plugin once the test's call is done, to fail the call itself
+            request.node.stash.setdefault(memory_budgets_key, []).append(
+                MemoryBudget(
+                    redis.Redis(connection_pool=connection_pool),
+                    *memory_marker.args,
+                    **memory_marker.kwargs,
+                )
+            )
+        if config["server_stats"]:
+            # server is shared with other xdist workers, or with other marked tests
+            marker = request.node.get_closest_marker("redis")
+            shared = isinstance(proc_fixture, SharedRedis) or bool(marker and marker.kwargs)
+            # snapshots are taken by the plugin, right before and after the test's call
+            request.node.stash.setdefault(server_stats_clients_key, []).append(
+                (redis.Redis(connection_pool=connection_pool), shared)
+            )
+        yield redis_client
+        if profile:
+            request.node.user_properties.append((PROFILE_PROPERTY, profile.as_dict()))
+        connection_pool.reset_connections()
+        if tracker:
+            tracker.cleanup()
+        else:
+            flush(redis_client, redis_cleanup)
+
+    return redisdb_factory
+
+
+def async_redisdb(
+    process_fixture_name: str,
+    dbnum: int = 0,
+    decode: Optional[bool] = None,
+    cleanup: Optional[str] = None,
+) -> Callable[[FixtureRequest], AsyncGenerator["redis.asyncio.Redis", None]]:
+    """Create asyncio connection fixture factory for pytest-redis.
+
+    Requires pytest-asyncio to run the fixture, and redis-py 4.2 or newer.
+
+    :param process_fixture_name: name of the process fixture
+    :param dbnum: number of database to use.
+    :param decode: Client: to decode response or not.
+        See redis.asyncio.Redis decode_reponse client parameter.
+    :param cleanup: How to clean the database after each test, see :func:`redisdb`.
+    :returns: function which makes an asyncio connection to redis
+    """
+    if pytest_asyncio is None:
+        raise ImportError("async_redisdb fixture factory requires pytest-asyncio to be installed")
+    try:
+        from redis.asyncio import Redis as AsyncRedis
+    except ImportError as error:  # pragma: no cover
+        raise ImportError("async_redisdb fixture factory requires redis-py 4.2 or newer") from error
+    if cleanup is not None:
+        check_cleanup(cleanup)
+
+    @pytest_asyncio.fixture
+    async def async_redisdb_factory(
+        request: FixtureRequest,
+    ) -> AsyncGenerator["redis.asyncio.Redis", None]:
+        """Create asyncio connection for pytest-redis.
+
+        #. Load required process fixture.
+        #. Get redis module and config.
+        #. Connect to redis.
+        #. Clean database after tests (only the used database, if server is shared).
+
+        :param FixtureRequest request: fixture request object
+        :rtype: redis.asyncio.Redis
+        :returns: asyncio Redis client
+        """
+        proc_fixture = get_process_fixture(request, process_fixture_name)
         config = get_config(request)
 
-        redis_host = proc_fixture.host
-        redis_port = proc_fixture.port
-        redis_username = proc_fixture.username
-        redis_password = proc_fixture.password
-        redis_db = dbnum
+        redis_db = get_db_index(proc_fixture, dbnum)
         decode_responses: Union[Literal[True], Literal[False]] = (
             decode if decode is not None else config["decode"]
         )
 
-        redis_client = redis.Redis(
-            redis_host,
-            redis_port,
-            redis_db,
-            username=redis_username,
-            password=redis_password,
+        redis_client: "redis.asyncio.Redis" = AsyncRedis(
+            host=proc_fixture.host,
+            port=proc_fixture.port,
+            db=redis_db,
+            username=proc_fixture.username,
+            password=proc_fixture.password,
             unix_socket_path=proc_fixture.unixsocket,
             decode_responses=decode_responses,
         )
 
-        yield redis_client
-        redis_client.flushall()
+        redis_cleanup = get_cleanup(proc_fixture, config, cleanup)
+        if redis_cleanup == "tracked":
+            tracker = AsyncKeyTracker(
+                redis_client, redis_db, restore_events=not isinstance(proc_fixture, SharedRedis)
+            )
+            await tracker.start()
+            yield redis_client
+            await tracker.cleanup()
+        else:
+            yield redis_client
+            await async_flush(redis_client, redis_cleanup)
+        await async_close(redis_client)
 
-    return redisdb_factory
+    return async_redisdb_factory
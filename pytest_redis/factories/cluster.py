@@ -0,0 +1,181 @@
+"""Redis Cluster process and client fixture factories."""
+
+import shutil
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Generator, List, Literal, Optional, Set, Union
+
+import pytest
+from _pytest.fixtures import FixtureRequest
+from _pytest.tmpdir import TempPathFactory
+from port_for import get_port, is_available
+
+from pytest_redis.config import get_config
+from pytest_redis.connection import get_cluster_client
+from pytest_redis.executor.cluster import RedisClusterExecutor
+from pytest_redis.executor.process import RedisExecutor
+from pytest_redis.factories.proc import (
+    check_server_profile,
+    ephemeral_datadir,
+    redis_executor,
+    server_profile,
+)
+
+if TYPE_CHECKING:
+    from redis.cluster import RedisCluster
+
+CLUSTER_BUS_OFFSET = 10000
+"""
+Cluster bus port is the node's port increased by this offset.
+"""
+
+
+def cluster_port(used: Set[int]) -> int:
+    """Select port for the cluster node, with its cluster bus port available as well.
+
+    :param used: ports already selected for the other nodes, including their bus ports
+    """
+    while True:
+        port = get_port(None)
+        assert port
+        bus_port = port + CLUSTER_BUS_OFFSET
+        if bus_port > 65535 or {port, bus_port} & used or not is_available(bus_port):
+            continue
+        used.update((port, bus_port))
+        return port
+
+
+def redis_cluster_proc(
+    executable: Optional[str] = None,
+    masters: int = 3,
+    replicas: int = 0,
+    timeout: Optional[int] = None,
+    host: Optional[str] = None,
+    username: Optional[str] = None,
+    password: Optional[str] = None,
+    loglevel: Optional[str] = None,
+    datadir: Optional[str] = None,
+    modules: Optional[List[str]] = None,
+    profile: Optional[str] = None,
+    node_timeout: int = 2000,
+    startup_timeout: int = 60,
+) -> Callable[[FixtureRequest, TempPathFactory], Generator[RedisClusterExecutor, None, None]]:
+    """Redis Cluster fixture factory for pytest-redis.
+
+    All the nodes are started at once, then the slots get assigned to the masters,
+    and replicas attached to them in turns.
+
+    :param executable: path to redis-server
+    :param masters: number of master nodes, sharing hash slots evenly
+    :param replicas: number of replica nodes
+    :param timeout: client's connection timeout
+    :param host: hostname
+    :param username: username
+    :param password: password
+    :param loglevel: redis log verbosity level.
+        One of debug, verbose, notice or warning
+    :param datadir: Path for redis data files of all the nodes
+    :param modules: list of paths of Redis extension modules to load
+    :param profile: redis-server profile, see :func:`redis_proc`
+    :param node_timeout: cluster-node-timeout in milliseconds.
+        The lower it is, the quicker nodes learn about each other.
+    :param startup_timeout: how long to wait for the cluster to get ready
+    :returns: function which makes a redis cluster
+    """
+    if profile is not None:
+        check_server_profile(profile)
+
+    @pytest.fixture(scope="session")
+    def redis_cluster_proc_fixture(
+        request: FixtureRequest, tmp_path_factory: TempPathFactory
+    ) -> Generator[RedisClusterExecutor, None, None]:
+        """Fixture for pytest-redis.
+
+        #. Get configs.
+        #. Run redis cluster nodes, and form the cluster out of them.
+        #. Stop the nodes after tests.
+
+        :param request: fixture request object
+        :param tmp_path_factory:
+        :returns: redis cluster executor
+        """
+        config = get_config(request)
+        redis_profile = server_profile(config, profile)
+        shm_datadir = None
+        if datadir:
+            redis_datadir = Path(datadir)
+        elif config["datadir"]:
+            redis_datadir = Path(config["datadir"])
+        elif redis_profile == "ephemeral" and (
+            shm_datadir := ephemeral_datadir(f"pytest-redis-{request.fixturename}-")
+        ):
+            redis_datadir = shm_datadir
+        else:
+            redis_datadir = tmp_path_factory.mktemp(f"pytest-redis-{request.fixturename}")
+
+        used_ports: Set[int] = set()
+
+        def cluster_node() -> RedisExecutor:
+            """Build executor for the cluster node."""
+            return redis_executor(
+                config,
+                redis_datadir,
+                cluster_port(used_ports),
+                executable=executable,
+                timeout=timeout,
+                host=host,
+                username=username,
+                password=password,
+                db_count=1,
+                loglevel=loglevel,
+                modules=modules,
+                version_cache=getattr(request.config, "cache", None),
+                profile=redis_profile,
+                cluster_node_timeout=node_timeout,
+            )
+
+        cluster = RedisClusterExecutor(
+            [cluster_node() for _ in range(masters)],
+            [cluster_node() for _ in range(replicas)],
+            timeout=startup_timeout,
+        )
+        with cluster:
+            yield cluster
+        if shm_datadir:
+            shutil.rmtree(shm_datadir, ignore_errors=True)
+
+    return redis_cluster_proc_fixture
+
+
+def redis_clusterdb(
+    process_fixture_name: str,
+    decode: Optional[bool] = None,
+) -> Callable[[FixtureRequest], Generator["RedisCluster", None, None]]:
+    """Create Redis Cluster client fixture factory for pytest-redis.
+
+    :param process_fixture_name: name of the cluster process fixture
+    :param decode: Client: to decode response or not.
+        See redis.RedisCluster decode_reponse client parameter.
+    :returns: function which makes a connection to redis cluster
+    """
+
+    @pytest.fixture
+    def redis_clusterdb_factory(request: FixtureRequest) -> Generator["RedisCluster", None, None]:
+        """Create Redis Cluster client for pytest-redis.
+
+        #. Load required cluster process fixture.
+        #. Get the session-wide cluster client.
+        #. Flush all the master nodes after tests.
+
+        :param FixtureRequest request: fixture request object
+        :returns: RedisCluster client
+        """
+        cluster: RedisClusterExecutor = request.getfixturevalue(process_fixture_name)
+        config = get_config(request)
+        decode_responses: Union[Literal[True], Literal[False]] = (
+            decode if decode is not None else config["decode"]
+        )
+        client = get_cluster_client(cluster, decode_responses)
+        yield client
+        client.flushall(target_nodes=client.PRIMARIES)
+
+    return redis_clusterdb_factory
@@ -0,0 +1,116 @@
+"""Group of redis process fixtures, started and stopped concurrently."""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+from _pytest.fixtures import FixtureRequest
+from _pytest.tmpdir import TempPathFactory
+from pytest import Config
+
+from pytest_redis.executor import RedisExecutor
+
+PrepareType = Callable[
+    [FixtureRequest, TempPathFactory, str], Tuple[RedisExecutor, Callable[[], None]]
+]
+"""
+Callable building not yet started executor of the group member,
+along with the callable cleaning up after it's stopped.
+"""
+
+
+class ProcessGroup:
+    """Process fixtures started all at once, when the first of them is requested.
+
+    Servers get spawned together, and their readiness waits overlap,
+    so the session waits for the slowest server only, rather than for all of them in turn.
+    They are stopped together as well, once the first requested member gets torn down.
+    """
+
+    def __init__(self, name: str) -> None:
+        """Initialize ProcessGroup.
+
+        :param name: group's name, used to name members' data directories
+        """
+        self.name = name
+        self.members: List[PrepareType] = []
+        self.started: (
+            "WeakKeyDictionary[Config, Dict[PrepareType, Tuple[RedisExecutor, Callable[[], None]]]]"
+        ) = WeakKeyDictionary()
+
+    def add(self, prepare: PrepareType) -> None:
+        """Add process fixture to the group.
+
+        :param prepare: callable building the member's executor
+        """
+        self.members.append(prepare)
+
+    def start(self, request: FixtureRequest, tmp_path_factory: TempPathFactory) -> bool:
+        """Start all the group members, unless they're started already.
+
+        :param request: fixture request of the group member requested first
+        :param tmp_path_factory: pytest's temporary directory factory
+        :returns: True if group got started now, False if it's been started before
+        """
+        if request.config in self.started:
+            return False
+        prepared: Dict[PrepareType, Tuple[RedisExecutor, Callable[[], None]]] = {}
+        try:
+            for index, prepare in enumerate(self.members):
+                prepared[prepare] = prepare(request, tmp_path_factory, f"{self.name}{index}")
+            self._run_concurrently(
+                lambda executor: executor.start(), [executor for executor, _ in prepared.values()]
+            )
+        except BaseException:
+            # members which did start get stopped, and all the prepared ones cleaned up after
+            self._stop_members(prepared)
+            raise
+        self.started[request.config] = prepared
+        return True
+
+    def executor(self, prepare: PrepareType, config: Config) -> RedisExecutor:
+        """Return the started member's executor.
+
+        :param prepare: callable the member was added with
+        :param config: pytest's config of the session group was started in
+        """
+        return self.started[config][prepare][0]
+
+    def stop(self, config: Config) -> None:
+        """Stop all the group members, and clean up after them.
+
+        :param config: pytest's config of the session group was started in
+        """
+        self._stop_members(self.started.pop(config, {}))
+
+    def _stop_members(
+        self, prepared: Dict[PrepareType, Tuple[RedisExecutor, Callable[[], None]]]
+    ) -> None:
+        """Stop the running members, and clean up after all of them."""
+        self._run_concurrently(
+            lambda executor: executor.stop(),
+            [executor for executor, _ in prepared.values() if executor.running()],
+        )
+        for _, cleanup in prepared.values():
+            cleanup()
+
+    @staticmethod
+    def _run_concurrently(
+        task: Callable[[RedisExecutor], Optional[RedisExecutor]], executors: List[RedisExecutor]
+    ) -> None:
+        """Run task for all the executors at once."""
+        if not executors:
+            return
+        with ThreadPoolExecutor(max_workers=len(executors)) as pool:
+            list(pool.map(task, executors))
+
+
+def redis_proc_group(name: str = "redis-group") -> ProcessGroup:
+    """Create group of process fixtures, started and stopped concurrently.
+
+    Pass it as the ``group`` argument of :func:`redis_proc` fixture factories.
+
+    :param name: group's name, used to name members' data directories
+    :returns: group of process fixtures
+    """
+    return ProcessGroup(name)
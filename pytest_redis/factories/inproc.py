@@ -0,0 +1,54 @@
+"""In-process redis fixture factory."""
+
+from typing import Callable, Generator, Optional
+
+import pytest
+from _pytest.fixtures import FixtureRequest
+
+from pytest_redis.backend import BackendType
+from pytest_redis.config import get_config
+from pytest_redis.executor.inproc import InProcessRedis
+
+
+def redis_inproc(
+    host: Optional[str] = None,
+    port: Optional[int] = None,
+    username: Optional[str] = None,
+    password: Optional[str] = None,
+    backend: Optional[Callable[[], BackendType]] = None,
+) -> Callable[[FixtureRequest], Generator[InProcessRedis, None, None]]:
+    """In-process redis fixture factory for pytest-redis.
+
+    Serves redis protocol from a thread of the test process, without redis-server.
+
+    :param host: hostname
+    :param port: exact port (e.g. '8000', 8000), free one is picked by default
+    :param username: username clients have to authenticate with
+    :param password: password clients have to authenticate with
+    :param backend: callable creating the backend, executing the data commands,
+        e.g. ``DictBackend`` subclass. DictBackend by default.
+    :returns: function which makes an in-process redis server
+    """
+
+    @pytest.fixture(scope="session")
+    def redis_inproc_fixture(request: FixtureRequest) -> Generator[InProcessRedis, None, None]:
+        """In-process redis fixture for pytest-redis.
+
+        #. Get configs.
+        #. Start serving redis protocol in the background thread.
+        #. Stop it after tests.
+
+        :param FixtureRequest request: fixture request object
+        :returns: in-process redis server
+        """
+        config = get_config(request)
+        with InProcessRedis(
+            host=host or config["host"],
+            port=port or 0,
+            username=username or config["username"],
+            password=password or config["password"],
+            backend=backend() if backend else None,
+        ) as server:
+            yield server
+
+    return redis_inproc_fixture
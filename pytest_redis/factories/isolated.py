@@ -0,0 +1,161 @@
+"""Function scoped redis process fixture factory, backed by a pool of standby servers."""
+
+import shutil
+from pathlib import Path
+from tempfile import mkdtemp
+from typing import Callable, Dict, Generator, List, Optional, Set, Tuple, Union
+
+import pytest
+from _pytest.fixtures import FixtureRequest
+from _pytest.tmpdir import TempPathFactory
+from pytest import StashKey
+
+from pytest_redis.config import get_config
+from pytest_redis.executor import RedisExecutor
+from pytest_redis.executor.standby import StandbyPool
+from pytest_redis.factories.proc import (
+    check_server_profile,
+    ephemeral_datadir,
+    redis_executor,
+    redis_port,
+    server_profile,
+)
+from pytest_redis.memory import check_maxmemory_policy, parse_memory
+
+standby_pools_key = StashKey[Dict[str, StandbyPool]]()
+
+
+def redis_isolated_proc(
+    executable: Optional[str] = None,
+    timeout: Optional[int] = None,
+    host: Optional[str] = None,
+    port: Union[
+        None,
+        Tuple[int, int],
+        Set[int],
+        List[Tuple[int, int]],
+        List[Set[int]],
+        List[Union[Set[int], Tuple[int, int]]],
+    ] = None,
+    username: Optional[str] = None,
+    password: Optional[str] = None,
+    db_count: Optional[int] = None,
+    save: Optional[str] = None,
+    compression: Optional[bool] = None,
+    checksum: Optional[bool] = None,
+    syslog: Optional[bool] = None,
+    loglevel: Optional[str] = None,
+    datadir: Optional[str] = None,
+    modules: Optional[List[str]] = None,
+    pool_size: int = 2,
+    recycle: bool = False,
+    unixsocket_only: Optional[bool] = None,
+    profile: Optional[str] = None,
+    maxmemory: Optional[Union[str, int]] = None,
+    maxmemory_policy: Optional[str] = None,
+) -> Callable[[FixtureRequest, TempPathFactory], Generator[RedisExecutor, None, None]]:
+    """Create isolated process fixture for pytest-redis, scoped to a single test.
+
+    Each test gets a fully isolated redis server, taken from the pool of
+    already started standby servers. Pool gets refilled in the background
+    while the test runs.
+
+    :param port:
+        randomly selected port (None) - any random available port
+        [(2000,3000)] or (2000,3000) - random available port from a given range
+        [{4002,4003}] or {4002,4003} - random of 4002 or 4003 ports
+        [(2000,3000), {4002,4003}] -random of given orange and set
+    :param datadir: Path for the directories with redis data files,
+        one for each server. If this is not configured, the directories are created
+        in the configured datadir, in /dev/shm for the ephemeral profile,
+        or in pytest's temporary directory.
+    :param pool_size: number of started servers waiting to be used
+    :param recycle: whether to reset used servers (data, scripts, stats
+        and configuration) and put them back to the pool, instead of killing them
+    :param unixsocket_only: whether to start servers listening on the unix socket only
+    :returns: function which makes a redis process
+
+    All the other parameters are the same as in :func:`redis_proc`.
+    """
+    if profile is not None:
+        check_server_profile(profile)
+    if maxmemory is not None:
+        parse_memory(maxmemory)
+    if maxmemory_policy is not None:
+        check_maxmemory_policy(maxmemory_policy)
+
+    @pytest.fixture
+    def redis_isolated_proc_fixture(
+        request: FixtureRequest, tmp_path_factory: TempPathFactory
+    ) -> Generator[RedisExecutor, None, None]:
+        """Fixture for pytest-redis.
+
+        #. Take redis process from the standby pool, starting the pool if needed.
+        #. Return redis process to the pool after the test.
+
+        :param request: fixture request object
+        :param tmp_path_factory:
+        :returns: tcp executor
+        """
+        config = get_config(request)
+        fixturename = request.fixturename
+        assert fixturename
+        standby_pools = request.config.stash.setdefault(standby_pools_key, {})
+
+        # directories created in the configured datadir or in /dev/shm,
+        # pytest takes care of its temporary ones
+        created_datadirs: List[Path] = []
+
+        def remove_created_datadirs() -> None:
+            """Remove standby servers' data directories created by the fixture."""
+            for created_datadir in created_datadirs:
+                shutil.rmtree(created_datadir, ignore_errors=True)
+
+        def executor_factory(exclude_ports: Set[int]) -> RedisExecutor:
+            """Build executor for the standby server, on the port not yet taken."""
+            prefix = f"pytest-redis-{fixturename}-"
+            base_datadir = datadir or config["datadir"]
+            if base_datadir:
+                redis_datadir = Path(mkdtemp(prefix=prefix, dir=base_datadir))
+                created_datadirs.append(redis_datadir)
+            elif server_profile(config, profile) == "ephemeral" and (
+                shm_datadir := ephemeral_datadir(prefix)
+            ):
+                redis_datadir = shm_datadir
+                created_datadirs.append(shm_datadir)
+            else:
+                redis_datadir = tmp_path_factory.mktemp(f"pytest-redis-{fixturename}")
+            return redis_executor(
+                config,
+                redis_datadir,
+                redis_port(config, port, unixsocket_only, exclude_ports),
+                executable=executable,
+                timeout=timeout,
+                host=host,
+                username=username,
+                password=password,
+                db_count=db_count,
+                save=save,
+                compression=compression,
+                checksum=checksum,
+                syslog=syslog,
+                loglevel=loglevel,
+                modules=modules,
+                version_cache=getattr(request.config, "cache", None),
+                profile=profile,
+                maxmemory=maxmemory,
+                maxmemory_policy=maxmemory_policy,
+            )
+
+        if fixturename not in standby_pools:
+            standby_pools[fixturename] = StandbyPool(executor_factory, pool_size, recycle)
+            # cleanups run in reverse order, directories get removed once the servers stop
+            request.config.add_cleanup(remove_created_datadirs)
+            request.config.add_cleanup(standby_pools[fixturename].close)
+        standby_pool = standby_pools[fixturename]
+
+        executor = standby_pool.acquire()
+        yield executor
+        standby_pool.release(executor)
+
+    return redis_isolated_proc_fixture
@@ -0,0 +1,133 @@
+"""Redis load generator fixture factory."""
+
+from typing import Any, Callable, Dict, Generator, List, Optional, Union
+
+import pytest
+import redis
+from _pytest.fixtures import FixtureRequest
+
+from pytest_redis.executor import NoopRedis, RedisExecutor
+from pytest_redis.factories.client import get_db_index, get_process_fixture
+from pytest_redis.load import (
+    LOAD_PROPERTY,
+    LoadConcurrencyType,
+    LoadResultType,
+    Workload,
+    check_load_concurrency,
+    run_load,
+)
+
+
+class LoadGenerator:
+    """Load generator, driving workloads against the process fixture's server."""
+
+    def __init__(
+        self,
+        proc_fixture: Union[NoopRedis, RedisExecutor],
+        dbnum: int,
+        clients: int,
+        concurrency: LoadConcurrencyType,
+    ) -> None:
+        """Initialize LoadGenerator.
+
+        :param proc_fixture: process fixture's executor
+        :param dbnum: number of database to drive the load against
+        :param clients: number of concurrent clients
+        :param concurrency: how the clients run concurrently
+        """
+        self.connection_kwargs: Dict[str, Any] = {
+            "db": dbnum,
+            "username": proc_fixture.username,
+            "password": proc_fixture.password,
+        }
+        if proc_fixture.unixsocket:
+            self.connection_kwargs["unix_socket_path"] = proc_fixture.unixsocket
+        else:
+            self.connection_kwargs["host"] = proc_fixture.host
+            self.connection_kwargs["port"] = proc_fixture.port
+        self.clients = clients
+        self.concurrency = concurrency
+        self.workloads: List[Workload] = []
+        self.results: List[LoadResultType] = []
+
+    def run(
+        self,
+        workload: Optional[Workload] = None,
+        clients: Optional[int] = None,
+        concurrency: Optional[str] = None,
+        **workload_kwargs: Any,
+    ) -> LoadResultType:
+        """Drive the workload against the server, and return throughput and latencies.
+
+        :param workload: workload to drive, built from workload_kwargs if not given
+        :param clients: number of concurrent clients, overriding fixture's one
+        :param concurrency: how the clients run concurrently, overriding fixture's one
+        :param workload_kwargs: :class:`pytest_redis.load.Workload` arguments
+        :returns: load's results
+        """
+        workload = workload or Workload(**workload_kwargs)
+        self.workloads.append(workload)
+        if workload.preload:
+            with redis.Redis(**self.connection_kwargs) as client:
+                workload.fill(client)
+        result = run_load(
+            self.connection_kwargs,
+            workload,
+            clients or self.clients,
+            check_load_concurrency(concurrency) if concurrency else self.concurrency,
+        )
+        self.results.append(result)
+        return result
+
+    def cleanup(self) -> None:
+        """Remove the keys created by the workloads."""
+        with redis.Redis(**self.connection_kwargs) as client:
+            for workload in self.workloads:
+                workload.clear(client)
+
+
+def redis_load(
+    process_fixture_name: str,
+    clients: int = 4,
+    concurrency: str = "threads",
+    dbnum: int = 0,
+) -> Callable[[FixtureRequest], Generator[LoadGenerator, None, None]]:
+    """Create load generator fixture factory for pytest-redis.
+
+    :param process_fixture_name: name of the process fixture
+    :param clients: number of concurrent clients
+    :param concurrency: how the clients run concurrently:
+
+        * threads - each client in its own thread (default)
+        * processes - each client in its own process, not limited by the GIL
+        * asyncio - all clients as asyncio tasks of a single event loop
+
+    :param dbnum: number of database to drive the load against.
+        With a redis-server shared between xdist workers, it's translated
+        into the database within the worker's own block of databases.
+    :returns: function which makes a load generator
+    """
+    load_concurrency = check_load_concurrency(concurrency)
+
+    @pytest.fixture
+    def redis_load_factory(request: FixtureRequest) -> Generator[LoadGenerator, None, None]:
+        """Load generator fixture for pytest-redis.
+
+        #. Load required process fixture.
+        #. Drive the workloads test runs against its server.
+        #. Record results as the test's user properties.
+        #. Remove the keys workloads created.
+
+        :param FixtureRequest request: fixture request object
+        :returns: load generator
+        """
+        proc_fixture = get_process_fixture(request, process_fixture_name)
+        load_generator = LoadGenerator(
+            proc_fixture, get_db_index(proc_fixture, dbnum), clients, load_concurrency
+        )
+        yield load_generator
+        for result in load_generator.results:
+            request.node.user_properties.append((LOAD_PROPERTY, result))
+        load_generator.cleanup()
+
+    return redis_load_factory
@@ -1,34 +1,241 @@
 """Redis process fixture factory."""
 
+import os
+import shutil
 from pathlib import Path
-from typing import Callable, Generator, List, Optional, Set, Tuple, Union
+from tempfile import mkdtemp
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import pytest
 from _pytest.fixtures import FixtureRequest
 from _pytest.tmpdir import TempPathFactory
 from port_for import get_port
+from pytest import Cache, UsageError
 
-from pytest_redis.config import get_config
-from pytest_redis.executor import RedisExecutor
+from pytest_redis.config import RedisConfigType, get_config
+from pytest_redis.executor import RedisExecutor, SharedRedis
+from pytest_redis.executor.reuse import ReusableServer, reuse_datadir
+from pytest_redis.executor.shared import get_shared_server, get_shared_slot, get_worker_index
+from pytest_redis.factories.group import ProcessGroup
+from pytest_redis.memory import check_maxmemory_policy, parse_memory
+
+PortType = Union[
+    None,
+    str,
+    int,
+    Tuple[int, int],
+    Set[int],
+    List[str],
+    List[int],
+    List[Tuple[int, int]],
+    List[Set[int]],
+    List[Union[Set[int], Tuple[int, int]]],
+    List[Union[str, int, Tuple[int, int], Set[int]]],
+]
+
+
+ServerProfileType = Literal["default", "ephemeral"]
+
+SERVER_PROFILES: Tuple[ServerProfileType, ...] = ("default", "ephemeral")
+"""
+Available redis-server profiles:
+
+* default - server configured with the options as given
+* ephemeral - no persistence at all, with data files kept in memory (/dev/shm) if possible
+"""
+
+SHM_DIR = Path("/dev/shm")
+
+
+def check_server_profile(profile: str) -> ServerProfileType:
+    """Check if redis-server profile is a known one.
+
+    :param profile: profile name
+    :returns: profile
+    """
+    for known_profile in SERVER_PROFILES:
+        if profile == known_profile:
+            return known_profile
+    raise ValueError(
+        f"Unknown redis server profile: {profile}. " f"Choose one of: {', '.join(SERVER_PROFILES)}."
+    )
+
+
+def server_profile(config: RedisConfigType, profile: Optional[str] = None) -> ServerProfileType:
+    """Return redis-server profile to use.
+
+    :param config: pytest-redis config options
+    :param profile: profile given to the fixture factory
+    """
+    return check_server_profile(profile or config["server_profile"])
+
+
+def ephemeral_datadir(prefix: str) -> Optional[Path]:
+    """Create data directory in memory backed /dev/shm, if it's available.
+
+    :param prefix: directory name's prefix
+    :returns: created directory, or None if there's no writable /dev/shm
+    """
+    if not SHM_DIR.is_dir() or not os.access(SHM_DIR, os.W_OK):
+        return None
+    return Path(mkdtemp(prefix=prefix, dir=SHM_DIR))
+
+
+def redis_datadir(
+    config: RedisConfigType,
+    tmp_path_factory: TempPathFactory,
+    name: Optional[str],
+    datadir: Optional[str] = None,
+    profile: Optional[str] = None,
+) -> Tuple[Path, Optional[Path]]:
+    """Select data directory for the redis-server.
+
+    Directory given to the fixture factory comes first, then the configured one.
+    Without either, ephemeral servers get one in /dev/shm (if it's available),
+    and all the others in pytest's temporary directory.
+
+    :param config: pytest-redis config options
+    :param tmp_path_factory: pytest's temporary directory factory
+    :param name: name of the fixture, prefixing created directory's name
+    :param datadir: data directory given to the fixture factory
+    :param profile: profile given to the fixture factory
+    :returns: data directory, and the same directory again if it was created in /dev/shm
+        and has to be removed once the server stops, None otherwise
+    """
+    if datadir:
+        return Path(datadir), None
+    if config["datadir"]:
+        return Path(config["datadir"]), None
+    if server_profile(config, profile) == "ephemeral" and (
+        shm_datadir := ephemeral_datadir(f"pytest-redis-{name}-")
+    ):
+        return shm_datadir, shm_datadir
+    return tmp_path_factory.mktemp(f"pytest-redis-{name}"), None
+
+
+def redis_port(
+    config: RedisConfigType,
+    port: PortType = -1,
+    unixsocket_only: Optional[bool] = None,
+    exclude_ports: Optional[Iterable[int]] = None,
+) -> int:
+    """Select port for the redis-server.
+
+    :param config: pytest-redis config options
+    :param port: port definition given to the fixture factory, see :func:`redis_proc`
+    :param unixsocket_only: whether server should listen on the unix socket only
+    :param exclude_ports: ports not to select, e.g. taken by servers not listening yet
+    :returns: selected port, or 0 if server shouldn't listen on TCP at all
+    """
+    if config["unixsocket_only"] if unixsocket_only is None else unixsocket_only:
+        return 0
+    selected_port = get_port(port, exclude_ports) or get_port(config["port"], exclude_ports)
+    assert selected_port
+    return selected_port
+
+
+def fixed_port(config: RedisConfigType, port: PortType = -1) -> Optional[int]:
+    """Return the port, if it's configured explicitly rather than selected at random.
+
+    :param config: pytest-redis config options
+    :param port: port definition given to the fixture factory, see :func:`redis_proc`
+    """
+    port_definition = config["port"] if port == -1 else port
+    if isinstance(port_definition, int) and port_definition > 0:
+        return port_definition
+    if isinstance(port_definition, str) and port_definition.isdigit():
+        return int(port_definition)
+    return None
+
+
+def redis_executor(
+    config: RedisConfigType,
+    datadir: Path,
+    port: int,
+    executable: Optional[str] = None,
+    timeout: Optional[int] = None,
+    host: Optional[str] = None,
+    username: Optional[str] = None,
+    password: Optional[str] = None,
+    db_count: Optional[int] = None,
+    save: Optional[str] = None,
+    compression: Optional[bool] = None,
+    checksum: Optional[bool] = None,
+    syslog: Optional[bool] = None,
+    loglevel: Optional[str] = None,
+    modules: Optional[List[str]] = None,
+    version_cache: Optional[Cache] = None,
+    profile: Optional[str] = None,
+    cluster_node_timeout: Optional[int] = None,
+    replicaof: Optional[Tuple[str, int]] = None,
+    maxmemory: Optional[Union[str, int]] = None,
+    maxmemory_policy: Optional[str] = None,
+    server_options: Optional[Dict[str, Any]] = None,
+) -> RedisExecutor:
+    """Build RedisExecutor out of config options overridden by the given arguments.
+
+    :param config: pytest-redis config options
+    :param datadir: Path for redis data files, including the unix domain socket.
+    :param port: port the redis-server will listen on
+    :param version_cache: pytest's cache to store redis-server version in
+    :param cluster_node_timeout: if given, redis-server is started as a cluster node
+        with the given node timeout (in milliseconds)
+    :param replicaof: host and port of the primary server, to start replica of
+    :param server_options: any other redis-server options, see :class:`RedisExecutor`
+    :returns: not yet started RedisExecutor
+
+    All the other parameters override the config values, see :func:`redis_proc`.
+    """
+    rdbcompression: bool = config["compression"] if compression is None else compression
+    rdbchecksum: bool = config["rdbchecksum"] if checksum is None else checksum
+    redis_maxmemory = maxmemory or config["maxmemory"]
+    redis_maxmemory_policy = maxmemory_policy or config["maxmemory_policy"]
+    return RedisExecutor(
+        executable=executable or config["exec"],
+        databases=db_count or config["db_count"],
+        redis_timeout=timeout or config["timeout"],
+        loglevel=loglevel or config["loglevel"],
+        rdbcompression=rdbcompression,
+        rdbchecksum=rdbchecksum,
+        syslog_enabled=syslog or config["syslog"],
+        save=save or config["save"],
+        host=host or config["host"],
+        port=port,
+        username=username or config["username"],
+        password=password or config["password"],
+        startup_timeout=60,
+        datadir=datadir,
+        modules=modules or config["modules"],
+        version_cache=version_cache,
+        ephemeral=server_profile(config, profile) == "ephemeral",
+        cluster=cluster_node_timeout is not None,
+        cluster_node_timeout=cluster_node_timeout or 15000,
+        replicaof=replicaof,
+        maxmemory=parse_memory(redis_maxmemory) if redis_maxmemory else None,
+        maxmemory_policy=(
+            check_maxmemory_policy(redis_maxmemory_policy) if redis_maxmemory_policy else None
+        ),
+        server_options=server_options,
+    )
 
 
 def redis_proc(
     executable: Optional[str] = None,
     timeout: Optional[int] = None,
     host: Optional[str] = None,
-    port: Union[
-        None,
-        str,
-        int,
-        Tuple[int, int],
-        Set[int],
-        List[str],
-        List[int],
-        List[Tuple[int, int]],
-        List[Set[int]],
-        List[Union[Set[int], Tuple[int, int]]],
-        List[Union[str, int, Tuple[int, int], Set[int]]],
-    ] = -1,
+    port: PortType = -1,
     username: Optional[str] = None,
     password: Optional[str] = None,
     db_count: Optional[int] = None,
@@ -39,7 +246,16 @@ def redis_proc(
     loglevel: Optional[str] = None,
     datadir: Optional[str] = None,
     modules: Optional[List[str]] = None,
-) -> Callable[[FixtureRequest, TempPathFactory], Generator[RedisExecutor, None, None]]:
+    xdist_shared: Optional[bool] = None,
+    unixsocket_only: Optional[bool] = None,
+    rdb: Optional[str] = None,
+    profile: Optional[str] = None,
+    maxmemory: Optional[Union[str, int]] = None,
+    maxmemory_policy: Optional[str] = None,
+    group: Optional[ProcessGroup] = None,
+) -> Callable[
+    [FixtureRequest, TempPathFactory], Generator[Union[RedisExecutor, SharedRedis], None, None]
+]:
     """Fixture factory for pytest-redis.
 
     :param executable: path to redis-server
@@ -64,58 +280,195 @@ def redis_proc(
         If this is not configured, then a temporary directory is created and used
         instead.
     :param modules: list of paths of Redis extension modules to load
+    :param xdist_shared: Whether to use the redis-server shared between all
+        xdist workers instead of starting a new one.
+        The shared server is configured with the command line and ini options only,
+        so fixtures customising the server options start their own servers
+        (and can't be set to True explicitly).
+    :param unixsocket_only: Whether to start redis-server listening on the unix socket only,
+        without allocating a TCP port. Port settings are ignored then.
+    :param rdb: path to the rdb file redis-server should load its data from at start.
+        File gets copied into the datadir.
+    :param profile: redis-server profile:
+
+        * default - server configured with the options as given
+        * ephemeral - RDB snapshots, AOF and fsync disabled, and data files
+          (including the unix socket) kept in /dev/shm, if it's available
+          and no datadir is configured
+
+    :param maxmemory: memory limit, in bytes or with the redis.conf unit, e.g. 100mb
+    :param maxmemory_policy: eviction policy applied once the memory limit is reached,
+        e.g. allkeys-lru or noeviction
+    :param group: group of process fixtures, see :func:`redis_proc_group`,
+        all started at once when the first of them is requested, and stopped at once.
+        Group members are always started as separate servers,
+        regardless of the xdist_shared and reuse settings.
     :returns: function which makes a redis process
     """
+    if profile is not None:
+        check_server_profile(profile)
+    if maxmemory is not None:
+        parse_memory(maxmemory)
+    if maxmemory_policy is not None:
+        check_maxmemory_policy(maxmemory_policy)
+    server_options = {
+        "executable": executable,
+        "timeout": timeout,
+        "host": host,
+        "username": username,
+        "password": password,
+        "db_count": db_count,
+        "save": save,
+        "compression": compression,
+        "checksum": checksum,
+        "syslog": syslog,
+        "loglevel": loglevel,
+        "datadir": datadir,
+        "modules": modules,
+        "unixsocket_only": unixsocket_only,
+        "rdb": rdb,
+        "profile": profile,
+        "maxmemory": maxmemory,
+        "maxmemory_policy": maxmemory_policy,
+    }
+    customised = [name for name, value in server_options.items() if value is not None]
+    if port != -1:
+        customised.append("port")
+    if xdist_shared and customised:
+        raise UsageError(
+            "Process fixture sharing the redis-server between xdist workers "
+            f"can't customise the server options: {', '.join(customised)}."
+        )
 
     @pytest.fixture(scope="session")
     def redis_proc_fixture(
         request: FixtureRequest, tmp_path_factory: TempPathFactory
-    ) -> Generator[RedisExecutor, None, None]:
+    ) -> Generator[Union[RedisExecutor, SharedRedis], None, None]:
         """Fixture for pytest-redis.
 
         #. Get configs.
-        #. Run redis process.
-        #. Stop redis process after tests.
+        #. Run redis process (or the whole group of them, or attach to the shared one,
+           or to the one left running by the previous session with ``--redis-reuse``).
+        #. Stop redis process after tests (unless it's reused).
 
         :param request: fixture request object
         :param tmpdir_factory:
         :rtype: pytest_redis.executors.TCPExecutor
         :returns: tcp executor
         """
+        if group:
+            started_group = group.start(request, tmp_path_factory)
+            yield group.executor(prepare_executor, request.config)
+            if started_group:
+                group.stop(request.config)
+            return
+
+        config = get_config(request)
+        shared = config["xdist_shared"] if xdist_shared is None else xdist_shared
+        shared_server = get_shared_server(request.config)
+        if shared and shared_server and not customised:
+            worker_index = get_worker_index(request.config)
+            assert worker_index is not None and request.fixturename
+            try:
+                slot = get_shared_slot(request.config, request.fixturename, shared_server["slots"])
+            except ValueError as error:
+                raise UsageError(f"pytest-redis: {error}") from error
+            with SharedRedis(
+                host=shared_server["host"],
+                port=shared_server["port"],
+                db_offset=(worker_index * shared_server["slots"] + slot)
+                * shared_server["databases"],
+                databases=shared_server["databases"],
+                username=shared_server["username"],
+                password=shared_server["password"],
+                unixsocket=shared_server["unixsocket"],
+            ) as shared_executor:
+                yield shared_executor
+            return
+
+        cache = getattr(request.config, "cache", None)
+        socket_only = config["unixsocket_only"] if unixsocket_only is None else unixsocket_only
+        if cache and config["reuse"] and not rdb and not socket_only:
+            assert request.fixturename
+            worker_index = get_worker_index(request.config)
+            reuse_name = request.fixturename
+            if worker_index is not None:
+                reuse_name = f"{reuse_name}-{worker_index}"
+            reuse_dir = reuse_datadir(request.config.rootpath, reuse_name)
+            reused_datadir = Path(datadir or config["datadir"] or reuse_dir)
+            server = ReusableServer(
+                lambda selected_port: build_executor(
+                    config,
+                    reused_datadir,
+                    redis_port(config, port) if selected_port is None else selected_port,
+                    cache,
+                ),
+                cache,
+                reuse_name,
+                fixed_port=fixed_port(config, port),
+                idle_timeout=config["reuse_idle_timeout"],
+            )
+            yield server.start()
+            return
+
+        executor, cleanup = prepare_executor(request, tmp_path_factory, request.fixturename)
+        with executor:
+            yield executor
+        cleanup()
+
+    def prepare_executor(
+        request: FixtureRequest, tmp_path_factory: TempPathFactory, name: Optional[str]
+    ) -> Tuple[RedisExecutor, Callable[[], None]]:
+        """Build not yet started executor, along with the cleanup to run after it's stopped."""
         config = get_config(request)
-        redis_exec = executable or config["exec"]
-        rdbcompression: bool = config["compression"] if compression is None else compression
-        rdbchecksum: bool = config["rdbchecksum"] if checksum is None else checksum
-
-        if datadir:
-            redis_datadir = Path(datadir)
-        elif config["datadir"]:
-            redis_datadir = Path(config["datadir"])
-        else:
-            redis_datadir = tmp_path_factory.mktemp(f"pytest-redis-{request.fixturename}")
-
-        redis_modules = modules or config["modules"]
-
-        redis_port = get_port(port) or get_port(config["port"])
-        assert redis_port
-        redis_executor = RedisExecutor(
-            executable=redis_exec,
-            databases=db_count or config["db_count"],
-            redis_timeout=timeout or config["timeout"],
-            loglevel=loglevel or config["loglevel"],
-            rdbcompression=rdbcompression,
-            rdbchecksum=rdbchecksum,
-            syslog_enabled=syslog or config["syslog"],
-            save=save or config["save"],
-            host=host or config["host"],
-            port=redis_port,
-            username=username or config["username"],
-            password=password or config["password"],
-            startup_timeout=60,
-            datadir=redis_datadir,
-            modules=redis_modules,
+        server_datadir, shm_datadir = redis_datadir(
+            config, tmp_path_factory, name, datadir, profile
+        )
+        executor = build_executor(
+            config,
+            server_datadir,
+            redis_port(config, port, unixsocket_only),
+            getattr(request.config, "cache", None),
+        )
+        if rdb:
+            shutil.copyfile(rdb, server_datadir / executor.dbfilename)
+
+        def cleanup() -> None:
+            if shm_datadir:
+                shutil.rmtree(shm_datadir, ignore_errors=True)
+
+        return executor, cleanup
+
+    def build_executor(
+        config: RedisConfigType,
+        server_datadir: Path,
+        selected_port: int,
+        version_cache: Optional[Cache],
+    ) -> RedisExecutor:
+        """Build executor out of the fixture factory's arguments."""
+        return redis_executor(
+            config,
+            server_datadir,
+            selected_port,
+            executable=executable,
+            timeout=timeout,
+            host=host,
+            username=username,
+            password=password,
+            db_count=db_count,
+            save=save,
+            compression=compression,
+            checksum=checksum,
+            syslog=syslog,
+            loglevel=loglevel,
+            modules=modules,
+            version_cache=version_cache,
+            profile=profile,
+            maxmemory=maxmemory,
+            maxmemory_policy=maxmemory_policy,
         )
-        with redis_executor:
-            yield redis_executor
+
+    if group:
+        group.add(prepare_executor)
 
     return redis_proc_fixture
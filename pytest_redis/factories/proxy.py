@@ -0,0 +1,74 @@
+"""Redis proxy fixture factory."""
+
+from typing import Callable, Generator, Optional, Union
+
+import pytest
+from _pytest.fixtures import FixtureRequest
+from _pytest.tmpdir import TempPathFactory
+
+from pytest_redis.config import get_config
+from pytest_redis.connection import disconnect_connection_pool
+from pytest_redis.executor import NoopRedis, RedisExecutor
+from pytest_redis.executor.proxy import RedisProxy
+
+
+def redis_proxy(
+    process_fixture_name: str,
+    latency: float = 0.0,
+    jitter: float = 0.0,
+    bandwidth: Optional[int] = None,
+    reset_rate: float = 0.0,
+    unixsocket: bool = False,
+    seed: Optional[int] = None,
+) -> Callable[[FixtureRequest, TempPathFactory], Generator[RedisProxy, None, None]]:
+    """Proxy fixture factory for pytest-redis.
+
+    Proxy sits between the clients and the process fixture's server,
+    slowing down the traffic the way network does. Pass its name to the client fixture
+    factories, in place of the process fixture's one, to connect through it.
+
+    :param process_fixture_name: name of the process fixture to pass the traffic to
+    :param latency: one way delay of each chunk of data, in seconds
+    :param jitter: maximum random deviation from the latency, in seconds
+    :param bandwidth: throughput limit of each connection's direction, in bytes per second
+    :param reset_rate: chance of the connection getting reset
+        when the client sends a chunk of data, from 0 to 1
+    :param unixsocket: whether to listen on the unix socket, rather than on TCP
+    :param seed: seed of the jitter and resets, for repeatable runs
+    :returns: function which makes a proxy
+    """
+
+    @pytest.fixture
+    def redis_proxy_fixture(
+        request: FixtureRequest, tmp_path_factory: TempPathFactory
+    ) -> Generator[RedisProxy, None, None]:
+        """Proxy fixture for pytest-redis.
+
+        #. Load required process fixture.
+        #. Start passing the traffic through to its server.
+        #. Close client fixtures' connections and stop the proxy after the test.
+
+        :param FixtureRequest request: fixture request object
+        :param tmp_path_factory: pytest's temporary directory factory
+        :returns: started proxy
+        """
+        proc_fixture: Union[NoopRedis, RedisExecutor] = request.getfixturevalue(
+            process_fixture_name
+        )
+        proxy_unixsocket = None
+        if unixsocket:
+            proxy_unixsocket = str(tmp_path_factory.mktemp("pytest-redis-proxy") / "proxy.sock")
+        with RedisProxy(
+            proc_fixture,
+            host=get_config(request)["host"],
+            unixsocket=proxy_unixsocket,
+            latency=latency,
+            jitter=jitter,
+            bandwidth=bandwidth,
+            reset_rate=reset_rate,
+            seed=seed,
+        ) as proxy:
+            yield proxy
+            disconnect_connection_pool(proxy)  # type: ignore[arg-type]
+
+    return redis_proxy_fixture
@@ -0,0 +1,124 @@
+"""Redis replica process fixture factory."""
+
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Generator, List, Optional, Set, Union
+
+import pytest
+from _pytest.fixtures import FixtureRequest
+from _pytest.tmpdir import TempPathFactory
+
+from pytest_redis.config import get_config
+from pytest_redis.executor import NoopRedis, RedisExecutor
+from pytest_redis.factories.proc import (
+    check_server_profile,
+    redis_datadir,
+    redis_executor,
+    redis_port,
+)
+
+
+def redis_replica_proc(
+    primary_fixture_name: str,
+    count: int = 1,
+    executable: Optional[str] = None,
+    timeout: Optional[int] = None,
+    loglevel: Optional[str] = None,
+    modules: Optional[List[str]] = None,
+    profile: Optional[str] = None,
+    unixsocket_only: Optional[bool] = None,
+    datadir: Optional[str] = None,
+) -> Callable[[FixtureRequest, TempPathFactory], Generator[List[RedisExecutor], None, None]]:
+    """Replica process fixture factory for pytest-redis.
+
+    Replicas are started at once, and considered started when their link
+    to the primary is up and the initial synchronisation completed.
+
+    :param primary_fixture_name: name of the primary's process fixture.
+        Primary has to listen on TCP port.
+    :param count: number of replicas
+    :param executable: path to redis-server
+    :param timeout: client's connection timeout
+    :param loglevel: redis log verbosity level.
+        One of debug, verbose, notice or warning
+    :param modules: list of paths of Redis extension modules to load
+    :param profile: redis-server profile, see :func:`redis_proc`
+    :param unixsocket_only: Whether replicas should listen on the unix socket only.
+    :param datadir: Path for replicas' data files, see :func:`redis_proc`
+    :returns: function which makes a list of redis replica processes
+    """
+    if profile is not None:
+        check_server_profile(profile)
+
+    @pytest.fixture(scope="session")
+    def redis_replica_proc_fixture(
+        request: FixtureRequest, tmp_path_factory: TempPathFactory
+    ) -> Generator[List[RedisExecutor], None, None]:
+        """Fixture for pytest-redis.
+
+        #. Get configs and the primary process.
+        #. Run replica processes concurrently, stopping the started ones if any fails.
+        #. Stop replica processes after tests.
+
+        :param request: fixture request object
+        :param tmp_path_factory:
+        :returns: list of replicas' executors
+        """
+        primary: Union[NoopRedis, RedisExecutor] = request.getfixturevalue(primary_fixture_name)
+        if not primary.port:
+            raise ValueError(
+                f"Primary {primary_fixture_name} listens on the unix socket only, "
+                "while replicas connect to it over TCP."
+            )
+        config = get_config(request)
+        replicas_datadir, shm_datadir = redis_datadir(
+            config, tmp_path_factory, request.fixturename, datadir, profile
+        )
+        # none of the replicas listens before all are started, so exclude ports already picked
+        used_ports: Set[int] = set()
+
+        def replica_port() -> int:
+            """Select port for the next replica, other than the ones already selected."""
+            port = redis_port(config, None, unixsocket_only, exclude_ports=used_ports)
+            used_ports.add(port)
+            return port
+
+        replicas = [
+            redis_executor(
+                config,
+                replicas_datadir,
+                replica_port(),
+                executable=executable,
+                timeout=timeout,
+                host=primary.host,
+                username=primary.username,
+                password=primary.password,
+                loglevel=loglevel,
+                modules=modules,
+                version_cache=getattr(request.config, "cache", None),
+                profile=profile,
+                replicaof=(primary.host, primary.port),
+            )
+            for _ in range(count)
+        ]
+
+        def stop_replicas() -> None:
+            """Stop the running replicas, and remove their data directory from /dev/shm."""
+            running = [replica for replica in replicas if replica.running()]
+            if running:
+                with ThreadPoolExecutor(max_workers=len(running)) as pool:
+                    list(pool.map(lambda replica: replica.stop(), running))
+            if shm_datadir:
+                shutil.rmtree(shm_datadir, ignore_errors=True)
+
+        try:
+            # leaving the block waits for all the replicas, whether they start or fail
+            with ThreadPoolExecutor(max_workers=count) as pool:
+                started = list(pool.map(lambda replica: replica.start(), replicas))
+        except BaseException:
+            stop_replicas()
+            raise
+        yield started
+        stop_replicas()
+
+    return redis_replica_proc_fixture
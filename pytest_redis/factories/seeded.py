@@ -0,0 +1,108 @@
+"""Redis client fixture factory, with a seed dataset restored between tests."""
+
+from typing import Callable, Generator, Literal, Optional, Union
+from weakref import WeakKeyDictionary
+
+import pytest
+import redis
+from _pytest.fixtures import FixtureRequest
+from packaging.version import parse
+
+from pytest_redis.cleanup import KeyTracker
+from pytest_redis.config import get_config
+from pytest_redis.connection import get_connection_pool
+from pytest_redis.exception import RedisUnsupported
+from pytest_redis.executor import NoopRedis, RedisExecutor, SharedRedis
+from pytest_redis.factories.client import (
+    check_keyspace_events,
+    get_db_index,
+    get_process_fixture,
+)
+from pytest_redis.seed import SEEDED_SERVERS, SeedLoaderType, SeedSnapshot
+
+
+def seeded_redisdb(
+    process_fixture_name: str,
+    loader: Optional[SeedLoaderType] = None,
+    dbnum: int = 0,
+    pristine_dbnum: Optional[int] = None,
+    decode: Optional[bool] = None,
+) -> Callable[[FixtureRequest], Generator[redis.Redis, None, None]]:
+    """Create connection fixture factory, with the seed dataset restored after each test.
+
+    Seed is loaded once, and its pristine copy kept in another database.
+    Keys touched during the test (tracked with keyspace notifications) get
+    copied back from the pristine database after it. Requires redis 6.2 or newer.
+
+    :param process_fixture_name: name of the process fixture
+    :param loader: callable loading the seed with the given client.
+        Without it, data the server started with (see ``rdb`` argument of
+        :func:`redis_proc`) is the seed.
+    :param dbnum: number of database to use
+    :param pristine_dbnum: number of database to keep the seed's pristine copy in,
+        server's last database by default
+    :param decode: Client: to decode response or not.
+        See redis.StrictRedis decode_reponse client parameter.
+    :returns: function which makes a connection to redis
+    """
+    snapshots: "WeakKeyDictionary[Union[NoopRedis, RedisExecutor], SeedSnapshot]" = (
+        WeakKeyDictionary()
+    )
+
+    @pytest.fixture
+    def seeded_redisdb_factory(request: FixtureRequest) -> Generator[redis.Redis, None, None]:
+        """Create connection to the seeded database for pytest-redis.
+
+        #. Load required process fixture.
+        #. Load the seed on first use, and take its pristine copy.
+        #. Track keys touched by the test.
+        #. Restore touched keys from the pristine copy after the test.
+
+        :param FixtureRequest request: fixture request object
+        :rtype: redis.client.Redis
+        :returns: Redis client
+        """
+        proc_fixture = get_process_fixture(request, process_fixture_name)
+        check_keyspace_events(proc_fixture, "seeded_redisdb")
+        config = get_config(request)
+        decode_responses: Union[Literal[True], Literal[False]] = (
+            decode if decode is not None else config["decode"]
+        )
+        redis_db = get_db_index(proc_fixture, dbnum)
+        connection_pool = get_connection_pool(proc_fixture, redis_db, decode_responses)
+        redis_client = redis.Redis(connection_pool=connection_pool)
+
+        if proc_fixture not in snapshots:
+            if isinstance(proc_fixture, RedisExecutor) and proc_fixture.version < parse("6.2"):
+                raise RedisUnsupported(
+                    "Seeded database is restored with COPY command, "
+                    f"which requires Redis 6.2 at least. Current version: {proc_fixture.version}"
+                )
+            if pristine_dbnum is not None:
+                pristine_db = get_db_index(proc_fixture, pristine_dbnum)
+            elif isinstance(proc_fixture, SharedRedis):
+                pristine_db = proc_fixture.db_index(proc_fixture.databases - 1)
+            else:
+                databases = redis_client.config_get("databases")["databases"]
+                pristine_db = int(databases) - 1
+            pristine_client = redis.Redis(
+                connection_pool=get_connection_pool(proc_fixture, pristine_db, decode_responses)
+            )
+            snapshots[proc_fixture] = SeedSnapshot(
+                redis_client, redis_db, pristine_client, pristine_db, loader
+            )
+            SEEDED_SERVERS.add(proc_fixture)
+        snapshot = snapshots[proc_fixture]
+        snapshot.prepare()
+
+        tracker = KeyTracker(
+            redis_client, redis_db, restore_events=not isinstance(proc_fixture, SharedRedis)
+        )
+        tracker.start()
+        yield redis_client
+        connection_pool.reset_connections()
+        keys = tracker.collect()
+        tracker.stop()
+        snapshot.restore(keys)
+
+    return seeded_redisdb_factory
@@ -0,0 +1,343 @@
+"""Load generator, driving a workload against the server from concurrent clients."""
+
+import asyncio
+import math
+import multiprocessing
+import random
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Tuple, TypedDict, Union
+
+import redis
+
+from pytest_redis.connection import async_close
+
+LoadConcurrencyType = Literal["threads", "processes", "asyncio"]
+
+LOAD_CONCURRENCY: Tuple[LoadConcurrencyType, ...] = ("threads", "processes", "asyncio")
+"""
+How the load generator's clients run concurrently:
+
+* threads - each client in its own thread
+* processes - each client in its own process, not limited by the GIL
+* asyncio - all clients as asyncio tasks of a single event loop
+"""
+
+LOAD_PROPERTY = "redis_load"
+"""
+Name of the test's user property holding its load results.
+"""
+
+CommandBuilderType = Callable[[bytes, bytes], Tuple[Any, ...]]
+
+LOAD_COMMANDS: Dict[str, Tuple[str, CommandBuilderType]] = {
+    "get": ("string", lambda key, value: ("GET", key)),
+    "set": ("string", lambda key, value: ("SET", key, value)),
+    "del": ("string", lambda key, value: ("DEL", key)),
+    "incr": ("counter", lambda key, value: ("INCR", key)),
+    "hget": ("hash", lambda key, value: ("HGET", key, "field")),
+    "hset": ("hash", lambda key, value: ("HSET", key, "field", value)),
+    "lpush": ("list", lambda key, value: ("LPUSH", key, value)),
+    "rpop": ("list", lambda key, value: ("RPOP", key)),
+    "sadd": ("set", lambda key, value: ("SADD", key, value)),
+    "sismember": ("set", lambda key, value: ("SISMEMBER", key, value)),
+}
+"""
+Commands workload can be made of, along with the type of keys they operate on.
+Each type has its own keys, so that commands never hit a key of the wrong type.
+"""
+
+PRELOAD_COMMANDS: Dict[str, CommandBuilderType] = {
+    "string": lambda key, value: ("SET", key, value),
+    "hash": lambda key, value: ("HSET", key, "field", value),
+    "list": lambda key, value: ("RPUSH", key, value),
+    "set": lambda key, value: ("SADD", key, value),
+}
+"""
+Commands filling the key space before the load starts, so that reads hit existing keys.
+"""
+
+
+class LoadClientResultType(TypedDict):
+    """Results of a single load generator's client."""
+
+    started: float
+    finished: float
+    commands: int
+    errors: int
+    latencies: List[float]
+
+
+class LoadResultType(TypedDict):
+    """Results of the load, latencies in milliseconds."""
+
+    clients: int
+    concurrency: LoadConcurrencyType
+    commands: int
+    round_trips: int
+    errors: int
+    seconds: float
+    throughput: float
+    latency: Dict[str, float]
+
+
+def check_load_concurrency(concurrency: str) -> LoadConcurrencyType:
+    """Check if load generator's concurrency mode is a known one.
+
+    :param concurrency: concurrency mode name
+    :returns: concurrency mode
+    """
+    for mode in LOAD_CONCURRENCY:
+        if concurrency == mode:
+            return mode
+    raise ValueError(
+        f"Unknown redis load concurrency: {concurrency}. "
+        f"Choose one of: {', '.join(LOAD_CONCURRENCY)}."
+    )
+
+
+def percentile(values: Sequence[float], fraction: float) -> float:
+    """Return the percentile of sorted values, using the nearest rank method.
+
+    :param values: sorted values
+    :param fraction: percentile as a fraction, e.g. 0.99 for p99
+    """
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, max(math.ceil(fraction * len(values)) - 1, 0))]
+
+
+class Workload:
+    """Workload to drive against the server: command mix, key space, value sizes, pipelining."""
+
+    def __init__(
+        self,
+        commands: Optional[Dict[str, float]] = None,
+        keyspace: int = 1000,
+        value_size: Union[int, Tuple[int, int]] = 64,
+        pipeline: int = 1,
+        requests: int = 10_000,
+        duration: Optional[float] = None,
+        preload: bool = True,
+        key_prefix: str = "pytest-redis-load",
+    ) -> None:
+        """Initialize Workload.
+
+        :param commands: command names (see LOAD_COMMANDS) with their weights in the mix,
+            90% of GETs and 10% of SETs by default
+        :param keyspace: number of keys of each type commands pick from at random
+        :param value_size: size of the values in bytes, or range of sizes to pick from
+        :param pipeline: number of commands sent in a single round trip
+        :param requests: number of commands sent by all the clients together
+        :param duration: run for the given number of seconds instead of the number of requests
+        :param preload: fill the key space before the load, so that reads hit existing keys
+        :param key_prefix: prefix of the keys workload operates on
+        """
+        commands = commands or {"get": 0.9, "set": 0.1}
+        if unknown := set(commands) - set(LOAD_COMMANDS):
+            raise ValueError(
+                f"Unknown load commands: {', '.join(sorted(unknown))}. "
+                f"Choose from: {', '.join(LOAD_COMMANDS)}."
+            )
+        if any(weight <= 0 for weight in commands.values()):
+            raise ValueError("Load commands' weights have to be positive.")
+        if keyspace < 1 or pipeline < 1 or requests < 1:
+            raise ValueError("Load keyspace, pipeline and requests have to be positive.")
+        self.commands = commands
+        self.names = list(commands)
+        self.weights = list(commands.values())
+        self.keyspace = keyspace
+        self.value_sizes = (value_size, value_size) if isinstance(value_size, int) else value_size
+        self.pipeline = pipeline
+        self.requests = requests
+        self.duration = duration
+        self.preload = preload
+        self.key_prefix = key_prefix
+        self.payload = random.Random(0).randbytes(self.value_sizes[1])
+
+    def key(self, key_type: str, index: int) -> bytes:
+        """Return name of the key of the given type."""
+        return f"{self.key_prefix}:{key_type}:{index}".encode()
+
+    def value(self, rng: random.Random) -> bytes:
+        """Return a value of the random size."""
+        return self.payload[: rng.randint(*self.value_sizes)]
+
+    def command(self, rng: random.Random) -> Tuple[Any, ...]:
+        """Return a random command from the mix, with a random key and value."""
+        key_type, build = LOAD_COMMANDS[rng.choices(self.names, self.weights)[0]]
+        return build(self.key(key_type, rng.randrange(self.keyspace)), self.value(rng))
+
+    def fill(self, client: redis.Redis, batch: int = 1000) -> None:
+        """Fill the key space with the keys of the types the command mix operates on."""
+        key_types = {LOAD_COMMANDS[name][0] for name in self.names} & set(PRELOAD_COMMANDS)
+        rng = random.Random(0)
+        pipeline = client.pipeline(transaction=False)
+        for key_type in sorted(key_types):
+            for index in range(self.keyspace):
+                pipeline.execute_command(  # type: ignore[no-untyped-call]
+                    *PRELOAD_COMMANDS[key_type](self.key(key_type, index), self.value(rng))
+                )
+                if len(pipeline) >= batch:
+                    pipeline.execute()
+        pipeline.execute()
+
+    def clear(self, client: redis.Redis, batch: int = 1000) -> None:
+        """Remove all the keys the workload created."""
+        keys = list(client.scan_iter(match=f"{self.key_prefix}:*", count=batch))
+        for start in range(0, len(keys), batch):
+            client.unlink(*keys[start : start + batch])
+
+
+def run_client(
+    connection_kwargs: Dict[str, Any], workload: Workload, requests: int, seed: int
+) -> LoadClientResultType:
+    """Drive the workload against the server, as a single client.
+
+    :param connection_kwargs: redis client's arguments
+    :param workload: workload to drive
+    :param requests: number of commands to send, unless workload has duration
+    :param seed: random generator's seed
+    """
+    rng = random.Random(seed)
+    client = redis.Redis(**connection_kwargs)
+    client.ping()
+    latencies: List[float] = []
+    commands = errors = 0
+    started = time.monotonic()
+    deadline = started + workload.duration if workload.duration else None
+    while (time.monotonic() < deadline) if deadline else (commands < requests):
+        depth = workload.pipeline if deadline else min(workload.pipeline, requests - commands)
+        pipeline = client.pipeline(transaction=False)
+        for _ in range(depth):
+            pipeline.execute_command(*workload.command(rng))  # type: ignore[no-untyped-call]
+        sent_at = time.perf_counter()
+        replies = pipeline.execute(raise_on_error=False)
+        latencies.append(time.perf_counter() - sent_at)
+        commands += depth
+        errors += sum(isinstance(reply, Exception) for reply in replies)
+    finished = time.monotonic()
+    client.close()
+    return LoadClientResultType(
+        started=started, finished=finished, commands=commands, errors=errors, latencies=latencies
+    )
+
+
+async def run_async_client(
+    connection_kwargs: Dict[str, Any], workload: Workload, requests: int, seed: int
+) -> LoadClientResultType:
+    """Drive the workload against the server, as a single asyncio client.
+
+    :param connection_kwargs: redis client's arguments
+    :param workload: workload to drive
+    :param requests: number of commands to send, unless workload has duration
+    :param seed: random generator's seed
+    """
+    from redis.asyncio import Redis as AsyncRedis
+
+    rng = random.Random(seed)
+    client = AsyncRedis(**connection_kwargs)
+    await client.ping()
+    latencies: List[float] = []
+    commands = errors = 0
+    started = time.monotonic()
+    deadline = started + workload.duration if workload.duration else None
+    while (time.monotonic() < deadline) if deadline else (commands < requests):
+        depth = workload.pipeline if deadline else min(workload.pipeline, requests - commands)
+        pipeline = client.pipeline(transaction=False)
+        for _ in range(depth):
+            pipeline.execute_command(*workload.command(rng))
+        sent_at = time.perf_counter()
+        replies = await pipeline.execute(raise_on_error=False)
+        latencies.append(time.perf_counter() - sent_at)
+        commands += depth
+        errors += sum(isinstance(reply, Exception) for reply in replies)
+    finished = time.monotonic()
+    await async_close(client)
+    return LoadClientResultType(
+        started=started, finished=finished, commands=commands, errors=errors, latencies=latencies
+    )
+
+
+async def run_async_clients(
+    connection_kwargs: Dict[str, Any], workload: Workload, shares: List[int]
+) -> List[LoadClientResultType]:
+    """Drive the workload from all the asyncio clients at once."""
+    return list(
+        await asyncio.gather(
+            *(
+                run_async_client(connection_kwargs, workload, requests, seed)
+                for seed, requests in enumerate(shares)
+            )
+        )
+    )
+
+
+def summarize(
+    results: List[LoadClientResultType], concurrency: LoadConcurrencyType
+) -> LoadResultType:
+    """Merge clients' results into the load's throughput and latency percentiles."""
+    latencies = sorted(latency * 1000 for result in results for latency in result["latencies"])
+    commands = sum(result["commands"] for result in results)
+    seconds = max(result["finished"] for result in results) - min(
+        result["started"] for result in results
+    )
+    return LoadResultType(
+        clients=len(results),
+        concurrency=concurrency,
+        commands=commands,
+        round_trips=len(latencies),
+        errors=sum(result["errors"] for result in results),
+        seconds=seconds,
+        throughput=commands / seconds if seconds else 0.0,
+        latency={
+            "mean": sum(latencies) / len(latencies) if latencies else 0.0,
+            "p50": percentile(latencies, 0.5),
+            "p99": percentile(latencies, 0.99),
+            "p999": percentile(latencies, 0.999),
+            "max": latencies[-1] if latencies else 0.0,
+        },
+    )
+
+
+def run_load(
+    connection_kwargs: Dict[str, Any],
+    workload: Workload,
+    clients: int = 4,
+    concurrency: LoadConcurrencyType = "threads",
+) -> LoadResultType:
+    """Drive the workload against the server from concurrent clients.
+
+    Latency is measured for each round trip, so with pipelining,
+    it's the time of getting replies to all the pipelined commands.
+    Throughput counts commands, from the first client starting to the last one finishing.
+
+    :param connection_kwargs: redis client's arguments
+    :param workload: workload to drive
+    :param clients: number of concurrent clients
+    :param concurrency: how the clients run concurrently
+    :returns: load's results
+    """
+    shares = [
+        workload.requests // clients + (index < workload.requests % clients)
+        for index in range(clients)
+    ]
+    pool: Executor
+    if concurrency == "asyncio":
+        # own event loop in its own thread, as the test may be running one already
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            results = pool.submit(
+                asyncio.run, run_async_clients(connection_kwargs, workload, shares)
+            ).result()
+        return summarize(results, concurrency)
+    if concurrency == "processes":
+        pool = ProcessPoolExecutor(clients, mp_context=multiprocessing.get_context("spawn"))
+    else:
+        pool = ThreadPoolExecutor(clients)
+    with pool:
+        futures = [
+            pool.submit(run_client, connection_kwargs, workload, requests, seed)
+            for seed, requests in enumerate(shares)
+        ]
+        results = [future.result() for future in futures]
+    return summarize(results, concurrency)
@@ -0,0 +1,196 @@
+"""Streaming bulk loader of the test data."""
+
+import csv
+import json
+import time
+from pathlib import Path
+from typing import (
+    IO,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    TypedDict,
+    Union,
+    cast,
+)
+
+import redis
+from redis.exceptions import ResponseError
+
+from pytest_redis.resp import CommandArgType, iter_resp, resp_command
+
+LoadFormatType = Literal["jsonl", "csv", "resp"]
+
+FORMAT_SUFFIXES: Dict[str, LoadFormatType] = {
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".csv": "csv",
+    ".resp": "resp",
+}
+"""
+File formats recognised by the file extension.
+"""
+
+MAX_BATCH_BYTES = 1024 * 1024
+"""
+Most bytes of commands sent before reading their replies, however many commands there are.
+
+Sending more, the socket's buffers could fill up in both directions,
+with the server waiting for the replies to be read, and the loader for the commands to be sent.
+"""
+
+
+class LoadStatsType(TypedDict):
+    """Bulk load statistics."""
+
+    commands: int
+    errors: int
+    seconds: float
+    commands_per_second: float
+
+
+def iter_jsonl(lines: Iterable[Union[str, bytes]]) -> Iterator[List[CommandArgType]]:
+    """Read commands stored as JSON arrays, one per line.
+
+    :param lines: lines of JSON, e.g. ``["SET", "key", "value"]``
+    """
+    for line in lines:
+        if line.strip():
+            command: List[Any] = json.loads(line)
+            yield command
+
+
+def iter_csv(lines: Iterable[str]) -> Iterator[List[CommandArgType]]:
+    """Read commands stored as CSV rows - command name in the first column, arguments in the rest.
+
+    :param lines: lines of CSV, e.g. ``SET,key,value``
+    """
+    for row in csv.reader(lines):
+        if row:
+            yield list(row)
+
+
+def iter_batches(
+    commands: Iterable[Sequence[CommandArgType]], batch: int
+) -> Iterator[Tuple[int, bytes]]:
+    """Encode commands in the redis protocol, grouped into pipelined batches.
+
+    Batch ends after the given number of commands, or once it reaches :data:`MAX_BATCH_BYTES`.
+
+    :param commands: iterable of commands, each a sequence of command name and its arguments
+    :param batch: most commands in a single batch
+    :returns: iterator over number of commands in the batch, and the encoded batch
+    """
+    encoded: List[bytes] = []
+    size = 0
+    for command in commands:
+        packed = resp_command(*command)
+        encoded.append(packed)
+        size += len(packed)
+        if len(encoded) >= batch or size >= MAX_BATCH_BYTES:
+            yield len(encoded), b"".join(encoded)
+            encoded, size = [], 0
+    if encoded:
+        yield len(encoded), b"".join(encoded)
+
+
+def load_commands(
+    client: redis.Redis,
+    commands: Iterable[Sequence[CommandArgType]],
+    batch: int = 10000,
+    raise_on_error: bool = True,
+) -> LoadStatsType:
+    """Stream commands to the server in pipelined batches, the way ``redis-cli --pipe`` does.
+
+    Commands are encoded as they're read from the iterable, so the whole dataset
+    never has to be kept in memory. Replies are read after each batch,
+    and batches are capped at :data:`MAX_BATCH_BYTES` too.
+
+    :param client: redis client, its connection pool (and database) is used
+    :param commands: iterable of commands, each a sequence of command name and its arguments
+    :param batch: how many commands to send before reading their replies
+    :param raise_on_error: whether to raise first error reply, once all commands are loaded
+    :returns: number of loaded commands, error replies and the throughput
+    """
+    connection = client.connection_pool.get_connection("BULK-LOAD")
+    started_at = time.monotonic()
+    loaded = errors = 0
+    first_error: Optional[ResponseError] = None
+    try:
+        for count, packed in iter_batches(commands, batch):
+            connection.send_packed_command([packed], check_health=False)
+            for index in range(count):
+                try:
+                    connection.read_response()
+                except ResponseError as error:
+                    errors += 1
+                    if first_error is None:
+                        first_error = ResponseError(f"Command #{loaded + index}: {error}")
+            loaded += count
+    except BaseException:
+        # replies still waiting to be read would get to the next command
+        connection.disconnect()
+        raise
+    finally:
+        client.connection_pool.release(connection)
+    seconds = time.monotonic() - started_at
+    if raise_on_error and first_error:
+        raise first_error
+    return LoadStatsType(
+        commands=loaded,
+        errors=errors,
+        seconds=seconds,
+        commands_per_second=loaded / seconds if seconds else 0.0,
+    )
+
+
+def bulk_load(
+    client: redis.Redis,
+    source: Union[str, Path, IO[Any], Iterable[Sequence[CommandArgType]]],
+    data_format: Optional[LoadFormatType] = None,
+    batch: int = 10000,
+    raise_on_error: bool = True,
+) -> LoadStatsType:
+    """Load test data into the client's database, streaming it in pipelined batches.
+
+    :param client: redis client, e.g. the one from ``redisdb`` fixture
+    :param source: path to the file, open file, or iterable of commands
+    :param data_format: file's format - jsonl, csv or resp.
+        Recognised by the file extension, if not given for the path.
+        Required for open files.
+    :param batch: how many commands to send before reading their replies
+    :param raise_on_error: whether to raise first error reply, once all commands are loaded
+    :returns: number of loaded commands, error replies and the throughput
+    """
+    if isinstance(source, (str, Path)):
+        path = Path(source)
+        data_format = data_format or FORMAT_SUFFIXES.get(path.suffix)
+        if data_format is None:
+            raise ValueError(
+                f"Can't recognise format of {path}. "
+                f"Pass data_format, one of: {', '.join(sorted(set(FORMAT_SUFFIXES.values())))}."
+            )
+        mode = "rb" if data_format == "resp" else "r"
+        with open(path, mode, newline="" if data_format == "csv" else None) as stream:
+            return bulk_load(client, stream, data_format, batch, raise_on_error)
+
+    commands: Iterable[Sequence[CommandArgType]]
+    if data_format == "jsonl":
+        commands = iter_jsonl(cast(IO[str], source))
+    elif data_format == "csv":
+        commands = iter_csv(cast(IO[str], source))
+    elif data_format == "resp":
+        commands = iter_resp(cast(IO[bytes], source))
+    elif data_format is None:
+        if hasattr(source, "read"):
+            raise ValueError("Pass data_format to load commands from the open file.")
+        commands = source
+    else:
+        raise ValueError(f"Unknown data format: {data_format}")
+    return load_commands(client, commands, batch, raise_on_error)
@@ -0,0 +1,152 @@
+"""Memory limits of the redis server, and memory budgets of the tests."""
+
+import re
+from typing import List, Literal, Optional, Tuple, Union
+
+import redis
+from pytest import Item, StashKey, TestReport
+
+MaxmemoryPolicyType = Literal[
+    "noeviction",
+    "allkeys-lru",
+    "allkeys-lfu",
+    "allkeys-random",
+    "volatile-lru",
+    "volatile-lfu",
+    "volatile-random",
+    "volatile-ttl",
+]
+
+MAXMEMORY_POLICIES: Tuple[MaxmemoryPolicyType, ...] = (
+    "noeviction",
+    "allkeys-lru",
+    "allkeys-lfu",
+    "allkeys-random",
+    "volatile-lru",
+    "volatile-lfu",
+    "volatile-random",
+    "volatile-ttl",
+)
+"""
+Eviction policies redis-server applies once maxmemory is reached.
+"""
+
+MEMORY_UNITS = {
+    "": 1,
+    "b": 1,
+    "k": 1000,
+    "kb": 1024,
+    "m": 1000**2,
+    "mb": 1024**2,
+    "g": 1000**3,
+    "gb": 1024**3,
+}
+"""
+Memory units, as redis.conf understands them: 1k = 1000 bytes, 1kb = 1024 bytes.
+"""
+
+MEMORY_REGEX = re.compile(r"^\s*(\d+)\s*([a-z]*)\s*$")
+
+MEMORY_PROPERTY = "redis_memory_delta"
+"""
+Name of the test's user property holding its used memory delta.
+"""
+
+
+def check_maxmemory_policy(policy: str) -> MaxmemoryPolicyType:
+    """Check if maxmemory policy is a known one.
+
+    :param policy: policy name
+    :returns: policy
+    """
+    for known_policy in MAXMEMORY_POLICIES:
+        if policy == known_policy:
+            return known_policy
+    raise ValueError(
+        f"Unknown redis maxmemory policy: {policy}. "
+        f"Choose one of: {', '.join(MAXMEMORY_POLICIES)}."
+    )
+
+
+def parse_memory(value: Union[str, int]) -> int:
+    """Return memory size in bytes.
+
+    :param value: number of bytes, or size with the redis.conf unit, e.g. 10MB or 100k
+    """
+    if isinstance(value, int):
+        return value
+    match = MEMORY_REGEX.match(value.lower())
+    if not match or match.group(2) not in MEMORY_UNITS:
+        raise ValueError(
+            f"Can't parse memory size: {value}. "
+            "Use number of bytes, optionally with the unit, e.g. 10mb or 100k."
+        )
+    return int(match.group(1)) * MEMORY_UNITS[match.group(2)]
+
+
+def used_memory(client: redis.Redis) -> int:
+    """Return memory used by the server, as reported by INFO memory."""
+    return int(client.info("memory")["used_memory"])
+
+
+class MemoryBudget:
+    """Server's used memory, measured before and after the test, checked against the budget."""
+
+    def __init__(self, client: redis.Redis, max_delta: Union[str, int]) -> None:
+        """Measure memory used before the test.
+
+        :param client: client connected to the server
+        :param max_delta: how much more memory server may use after the test
+        """
+        self.client = client
+        self.max_delta = parse_memory(max_delta)
+        self.before = used_memory(client)
+        self.delta: Optional[int] = None
+
+    def measure(self) -> int:
+        """Measure how much memory was consumed since the test started."""
+        self.delta = used_memory(self.client) - self.before
+        return self.delta
+
+    @property
+    def exceeded(self) -> bool:
+        """Check if test consumed more memory than its budget allows."""
+        return self.delta is not None and self.delta > self.max_delta
+
+    def __str__(self) -> str:
+        """Describe memory consumed by the test."""
+        return f"{self.delta} bytes of redis memory used, with the budget of {self.max_delta} bytes"
+
+
+memory_budgets_key = StashKey[List[MemoryBudget]]()
+"""
+Memory budgets of the test's client fixtures, measured once the test's call is done.
+"""
+
+
+def measure_memory_budgets(item: Item) -> List[MemoryBudget]:
+    """Measure memory the test consumed, before its fixtures clean up.
+
+    :param item: test item
+    :returns: budgets the test exceeded
+    """
+    exceeded = []
+    for budget in item.stash.get(memory_budgets_key, []):
+        item.user_properties.append((MEMORY_PROPERTY, budget.measure()))
+        if budget.exceeded:
+            exceeded.append(budget)
+    return exceeded
+
+
+def fail_over_budget(item: Item, report: TestReport, exceeded: List[MemoryBudget]) -> None:
+    """Fail the test's call report, if the otherwise passing test exceeded its memory budget.
+
+    :param item: test item
+    :param report: report of the test's call
+    :param exceeded: budgets the test exceeded
+    """
+    if exceeded and report.passed:
+        report.outcome = "failed"
+        report.longrepr = "\n".join(
+            f"{item.nodeid} exceeded its memory budget: {budget}" for budget in exceeded
+        )
@@ -16,13 +16,29 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with pytest-redis.  If not, see <http://www.gnu.org/licenses/>.
 """Plugin configuration module for pytest-redis."""
+
 from shutil import which
+from typing import Any, Generator
 
-from pytest import Parser
+from pytest import CallInfo, Config, Item, Parser, Session, TestReport, UsageError, hookimpl
 
 import pytest_redis.factories.client
+import pytest_redis.factories.inproc
+import pytest_redis.factories.load
 import pytest_redis.factories.noproc
 import pytest_redis.factories.proc
+import pytest_redis.factories.proxy
+from pytest_redis.config import WorkerConfigSender, load_config
+from pytest_redis.connection import disconnect_connection_pools
+from pytest_redis.memory import fail_over_budget, measure_memory_budgets
+from pytest_redis.pool import SERVER_POOL_PLUGIN, RedisServerPool
+from pytest_redis.profiling import register_profile_reporter
+from pytest_redis.server_stats import (
+    record_server_stats,
+    register_server_stats_reporter,
+    take_server_snapshots,
+)
+from pytest_redis.sharding import SharedRedisController, is_xdist_controller
 
 # pylint:disable=invalid-name
 _help_exec = "Redis server executable"
@@ -42,6 +58,38 @@ _help_decode = (
 )
 _help_datadir = "Directory where test Redis instance data files will be stored"
 _help_modules = "Comma separated list of paths to Redis extension modules to be loaded at startup"
+_help_xdist_shared = (
+    "Start one redis-server on xdist controller and give each worker its own databases on it"
+)
+_help_unixsocket_only = "Start redis-server listening on the unix socket only, without TCP port"
+_help_server_profile = (
+    "Redis server profile. One of: default, "
+    "ephemeral (no persistence, data files in /dev/shm if available)."
+)
+_help_profile = (
+    "Client: record commands, round trips and latencies of the redisdb clients, "
+    "and report them after the tests"
+)
+_help_profile_json = "Client: file to write recorded redisdb clients' profiles to"
+_help_server_stats = (
+    "Client: diff server's INFO commandstats, INFO stats and SLOWLOG around each test "
+    "using redisdb, and list the slowest tests by redis server time"
+)
+_help_maxmemory = "Redis memory limit, in bytes or with the unit, e.g. 100mb"
+_help_maxmemory_policy = (
+    "Redis eviction policy once the memory limit is reached, e.g. allkeys-lru or noeviction"
+)
+_help_reuse = (
+    "Leave redis-server running after the tests, and reuse it in the next run "
+    "if its configuration didn't change. Servers listening on the unix socket only, "
+    "or started with the rdb file, are not reused"
+)
+_help_reuse_idle_timeout = "Seconds after which the reused redis-server no one uses is shut down"
+
+_help_cleanup = (
+    "Client: how to clean the database after each test. One of: "
+    "flushall, flushdb, skip-empty, tracked."
+)
 
 
 def pytest_addoption(parser: Parser) -> None:
@@ -89,6 +137,19 @@ def pytest_addoption(parser: Parser) -> None:
     parser.addini(name="redis_decode", type="bool", help=_help_decode, default=False)
     parser.addini(name="redis_datadir", help=_help_datadir, default=None)
     parser.addini(name="redis_modules", help=_help_modules, default=None)
+    parser.addini(name="redis_xdist_shared", type="bool", help=_help_xdist_shared, default=False)
+    parser.addini(name="redis_cleanup", help=_help_cleanup, default="flushall")
+    parser.addini(
+        name="redis_unixsocket_only", type="bool", help=_help_unixsocket_only, default=False
+    )
+    parser.addini(name="redis_server_profile", help=_help_server_profile, default="default")
+    parser.addini(name="redis_profile", type="bool", help=_help_profile, default=False)
+    parser.addini(name="redis_profile_json", help=_help_profile_json, default="redis-profile.json")
+    parser.addini(name="redis_server_stats", type="bool", help=_help_server_stats, default=False)
+    parser.addini(name="redis_maxmemory", help=_help_maxmemory, default=None)
+    parser.addini(name="redis_maxmemory_policy", help=_help_maxmemory_policy, default=None)
+    parser.addini(name="redis_reuse", type="bool", help=_help_reuse, default=False)
+    parser.addini(name="redis_reuse_idle_timeout", help=_help_reuse_idle_timeout, default=900)
 
     parser.addoption(
         "--redis-exec",
@@ -121,9 +182,113 @@ def pytest_addoption(parser: Parser) -> None:
     )
     parser.addoption("--redis-datadir", action="store", dest="redis_datadir", help=_help_datadir)
     parser.addoption("--redis-modules", action="store", dest="redis_modules", help=_help_modules)
+    parser.addoption(
+        "--redis-xdist-shared",
+        action="store_true",
+        dest="redis_xdist_shared",
+        help=_help_xdist_shared,
+    )
+    parser.addoption("--redis-cleanup", action="store", dest="redis_cleanup", help=_help_cleanup)
+    parser.addoption(
+        "--redis-unixsocket-only",
+        action="store_true",
+        dest="redis_unixsocket_only",
+        help=_help_unixsocket_only,
+    )
+    parser.addoption(
+        "--redis-server-profile",
+        action="store",
+        dest="redis_server_profile",
+        help=_help_server_profile,
+    )
+    parser.addoption(
+        "--redis-profile", action="store_true", dest="redis_profile", help=_help_profile
+    )
+    parser.addoption(
+        "--redis-profile-json", action="store", dest="redis_profile_json", help=_help_profile_json
+    )
+    parser.addoption(
+        "--redis-server-stats",
+        action="store_true",
+        dest="redis_server_stats",
+        help=_help_server_stats,
+    )
+    parser.addoption(
+        "--redis-maxmemory", action="store", dest="redis_maxmemory", help=_help_maxmemory
+    )
+    parser.addoption(
+        "--redis-maxmemory-policy",
+        action="store",
+        dest="redis_maxmemory_policy",
+        help=_help_maxmemory_policy,
+    )
+    parser.addoption("--redis-reuse", action="store_true", dest="redis_reuse", help=_help_reuse)
+    parser.addoption(
+        "--redis-reuse-idle-timeout",
+        action="store",
+        dest="redis_reuse_idle_timeout",
+        help=_help_reuse_idle_timeout,
+    )
+
+
+def pytest_configure(config: Config) -> None:
+    """Resolve config, register markers, reporters, server pool and xdist controller's plugins."""
+    config.addinivalue_line(
+        "markers",
+        "redis_memory(max_delta): fail the test if redis server's used_memory grows by more "
+        "than max_delta (bytes, or with the unit, e.g. 10MB) during the test using redisdb",
+    )
+    config.addinivalue_line(
+        "markers",
+        "redis(**options): run the test's client fixtures against a pooled redis-server "
+        'started with the given options, e.g. maxmemory="64mb", io_threads=4. '
+        "Without options, it doesn't change the server",
+    )
+    try:
+        redis_config = load_config(config)
+    except ValueError as error:
+        raise UsageError(f"pytest-redis: {error}") from error
+    if is_xdist_controller(config):
+        config.pluginmanager.register(WorkerConfigSender(redis_config), "redis_config_sender")
+        if redis_config["xdist_shared"]:
+            config.pluginmanager.register(SharedRedisController(config), "redis_shared_controller")
+    else:
+        config.pluginmanager.register(RedisServerPool(config), SERVER_POOL_PLUGIN)
+    if redis_config["profile"]:
+        register_profile_reporter(config, redis_config["profile_json"])
+    if redis_config["server_stats"]:
+        register_server_stats_reporter(config)
+
+
+@hookimpl(hookwrapper=True)
+def pytest_runtest_call(item: Item) -> Generator[None, None, None]:
+    """Diff server stats around the test's call, leaving its fixtures' setup and teardown out."""
+    snapshots = take_server_snapshots(item)
+    yield
+    record_server_stats(item, snapshots)
+
+
+@hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: Item, call: CallInfo[None]) -> Generator[None, Any, None]:
+    """Fail the test's call, if the test exceeded its memory budget (see redis_memory marker)."""
+    if call.when != "call":
+        yield
+        return
+    exceeded = measure_memory_budgets(item)
+    outcome = yield
+    report: TestReport = outcome.get_result()
+    fail_over_budget(item, report, exceeded)
+
+
+def pytest_sessionfinish(session: Session) -> None:
+    """Close connections kept by the client fixtures' connection pools."""
+    disconnect_connection_pools()
 
 
 redis_proc = pytest_redis.factories.proc.redis_proc()
 redis_nooproc = pytest_redis.factories.noproc.redis_noproc()
+redis_inproc = pytest_redis.factories.inproc.redis_inproc()
 redisdb = pytest_redis.factories.client.redisdb("redis_proc")
+redis_load = pytest_redis.factories.load.redis_load("redis_proc")
+redis_proxy = pytest_redis.factories.proxy.redis_proxy("redis_proc")
 # pylint:enable=invalid-name
@@ -0,0 +1,203 @@
+"""Servers selected per test with the ``redis`` marker.
+
+Tests marked with ``@pytest.mark.redis(**options)`` run against the server
+started with these options, rather than against their process fixture's server.
+Servers are kept in a pool, keyed by the options, so all the tests
+with the same options share a single server.
+"""
+
+import hashlib
+import json
+import shutil
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import pytest
+from _pytest.tmpdir import TempPathFactory
+from pytest import Config, Item
+
+from pytest_redis.config import load_config
+from pytest_redis.connection import disconnect_connection_pool
+from pytest_redis.executor import RedisExecutor
+from pytest_redis.factories.proc import redis_datadir, redis_executor, redis_port
+
+REDIS_MARKER = "redis"
+
+SERVER_POOL_PLUGIN = "redis_server_pool"
+
+EXECUTOR_OPTIONS = (
+    "executable",
+    "timeout",
+    "host",
+    "username",
+    "password",
+    "db_count",
+    "save",
+    "compression",
+    "checksum",
+    "syslog",
+    "loglevel",
+    "modules",
+    "profile",
+    "maxmemory",
+    "maxmemory_policy",
+)
+"""
+Marker options passed to :func:`redis_executor`, all the others
+(except for ``datadir`` and ``unixsocket_only``) are passed to redis-server.
+"""
+
+RESERVED_SERVER_OPTIONS = (
+    "port",
+    "bind",
+    "unixsocket",
+    "dir",
+    "dbfilename",
+    "logfile",
+    "pidfile",
+    "daemonize",
+    "databases",
+    "requirepass",
+    "masterauth",
+    "replicaof",
+    "slaveof",
+)
+"""
+Redis-server options the executor sets itself, and relies on. Redis takes the last value given,
+so passing them again would make the executor's idea of the server differ from the server's own.
+"""
+
+
+def profile_key(options: Mapping[str, Any]) -> str:
+    """Return key identifying the server started with the given options.
+
+    :param options: ``redis`` marker's keyword arguments
+    :returns: hash of the options, regardless of their order
+    """
+    serialized = json.dumps(options, sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode()).hexdigest()[:16]
+
+
+def item_profile(item: Item) -> Optional[str]:
+    """Return key of the server the test is marked to run against.
+
+    Bare ``redis`` marker, without any options, is left as a plain tag.
+
+    :returns: key of the server, None if the test isn't marked with the server options
+    """
+    marker = item.get_closest_marker(REDIS_MARKER)
+    if marker is None:
+        return None
+    if marker.args:
+        raise pytest.UsageError(
+            f"{item.nodeid}: redis marker takes keyword arguments only, got {marker.args}"
+        )
+    if not marker.kwargs:
+        return None
+    if reserved := sorted(set(marker.kwargs) & set(RESERVED_SERVER_OPTIONS)):
+        raise pytest.UsageError(
+            f"{item.nodeid}: redis marker can't set {', '.join(reserved)}, "
+            "these redis-server options are set by pytest-redis itself"
+        )
+    return profile_key(marker.kwargs)
+
+
+class RedisServerPool:
+    """Pytest plugin keeping servers started for the ``redis`` marker's options.
+
+    Server is started the first time its options are requested,
+    and reused by all the later tests with the same options.
+    Tests with the same options are run one after another,
+    so that the server can be stopped once the last of them is done,
+    and there's only one pooled server running at a time.
+    """
+
+    def __init__(self, config: Config) -> None:
+        """Initialize server pool plugin."""
+        self.config = load_config(config)
+        self.cache = getattr(config, "cache", None)
+        self.servers: Dict[str, Tuple[RedisExecutor, Optional[Path]]] = {}
+
+    def get(self, options: Mapping[str, Any], tmp_path_factory: TempPathFactory) -> RedisExecutor:
+        """Return the server started with the given options, starting it if needed.
+
+        Server's data directory is selected the same way :func:`redis_proc` does.
+
+        :param options: ``redis`` marker's keyword arguments
+        :param tmp_path_factory: pytest's temporary directory factory
+        :returns: started executor
+        """
+        key = profile_key(options)
+        if key not in self.servers:
+            executor_options = {
+                name: value for name, value in options.items() if name in EXECUTOR_OPTIONS
+            }
+            server_options = {
+                name: value
+                for name, value in options.items()
+                if name not in EXECUTOR_OPTIONS and name not in ("datadir", "unixsocket_only")
+            }
+            datadir, shm_datadir = redis_datadir(
+                self.config,
+                tmp_path_factory,
+                f"pool-{key}",
+                options.get("datadir"),
+                options.get("profile"),
+            )
+            executor = redis_executor(
+                self.config,
+                datadir,
+                redis_port(self.config, unixsocket_only=options.get("unixsocket_only")),
+                version_cache=self.cache,
+                server_options=server_options,
+                **executor_options,
+            )
+            try:
+                executor.start()
+            except BaseException:
+                if shm_datadir:
+                    shutil.rmtree(shm_datadir, ignore_errors=True)
+                raise
+            self.servers[key] = (executor, shm_datadir)
+        return self.servers[key][0]
+
+    def stop(self, key: str) -> None:
+        """Stop the server, closing the client fixtures' connections to it.
+
+        :param key: key of the server, see :func:`profile_key`
+        """
+        if key not in self.servers:
+            return
+        executor, shm_datadir = self.servers.pop(key)
+        disconnect_connection_pool(executor)
+        executor.stop()
+        if shm_datadir:
+            shutil.rmtree(shm_datadir, ignore_errors=True)
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, items: List[Item]) -> None:
+        """Run tests marked with the same options one after another.
+
+        Marked tests are moved next to the first test with the same options,
+        otherwise the tests keep their order.
+        """
+        first_index: Dict[str, int] = {}
+        order: Dict[Item, Tuple[int, int]] = {}
+        for index, item in enumerate(items):
+            key = item_profile(item)
+            group_index = index if key is None else first_index.setdefault(key, index)
+            order[item] = (group_index, index)
+        items.sort(key=order.__getitem__)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_teardown(self, item: Item, nextitem: Optional[Item]) -> Any:
+        """Stop the test's server, unless the next test runs against it as well."""
+        yield
+        key = item_profile(item)
+        if key is not None and (nextitem is None or item_profile(nextitem) != key):
+            self.stop(key)
+
+    def pytest_unconfigure(self) -> None:
+        """Stop all the servers still running."""
+        for key in list(self.servers):
+            self.stop(key)
@@ -0,0 +1,166 @@
+"""Server-side generator of large key spaces."""
+
+import time
+from typing import Literal, Tuple, TypedDict
+
+import redis
+from redis.exceptions import ResponseError
+
+PopulateType = Literal["string", "hash", "set", "zset", "list", "stream"]
+
+POPULATE_TYPES: Tuple[PopulateType, ...] = ("string", "hash", "set", "zset", "list", "stream")
+"""
+Types of keys redis_populate can generate.
+"""
+
+PopulateMethodType = Literal["debug", "script"]
+
+POPULATE_SCRIPT = """
+local key_type, prefix = ARGV[1], ARGV[2]
+local first, last = tonumber(ARGV[3]), tonumber(ARGV[4])
+local size, cardinality, seed = tonumber(ARGV[5]), tonumber(ARGV[6]), tonumber(ARGV[7])
+local commands = {hash = "HSET", zset = "ZADD", set = "SADD", list = "RPUSH"}
+
+local function pad(text, truncate)
+    if size > #text then
+        return text .. string.rep("\\0", size - #text)
+    elseif truncate and size > 0 then
+        return string.sub(text, 1, size)
+    end
+    return text
+end
+
+local function flush(command, key, args)
+    if #args > 0 then
+        redis.call(command, key, unpack(args))
+    end
+    return {}
+end
+
+local created = 0
+for index = first, last do
+    local key = prefix .. ":" .. index
+    if redis.call("EXISTS", key) == 0 then
+        created = created + 1
+        if key_type == "string" then
+            local text = seed == 0 and "value:" .. index or "value:" .. seed .. ":" .. index
+            redis.call("SET", key, pad(text, true))
+        else
+            local args = {}
+            for element = 1, cardinality do
+                local value = pad(element .. ":" .. seed .. ":" .. index, false)
+                if key_type == "hash" then
+                    table.insert(args, "field:" .. element)
+                    table.insert(args, value)
+                elseif key_type == "zset" then
+                    table.insert(args, (element * 7919 + index * 104729 + seed) % 1000003)
+                    table.insert(args, value)
+                elseif key_type == "stream" then
+                    redis.call("XADD", key, element .. "-0", "field", value)
+                else
+                    table.insert(args, value)
+                end
+                if #args >= 1000 then
+                    args = flush(commands[key_type], key, args)
+                end
+            end
+            if key_type ~= "stream" then
+                flush(commands[key_type], key, args)
+            end
+        end
+    end
+end
+return created
+"""
+"""
+Lua script generating keys of the given type, skipping the existing ones.
+"""
+
+
+class PopulateStatsType(TypedDict):
+    """Key space generation statistics."""
+
+    keys: int
+    created: int
+    seconds: float
+    method: PopulateMethodType
+
+
+def check_populate_type(key_type: str) -> PopulateType:
+    """Check if type of the keys to generate is a known one.
+
+    :param key_type: type name
+    :returns: type
+    """
+    for known_type in POPULATE_TYPES:
+        if key_type == known_type:
+            return known_type
+    raise ValueError(
+        f"Unknown redis populate key type: {key_type}. Choose one of: {', '.join(POPULATE_TYPES)}."
+    )
+
+
+def redis_populate(
+    client: redis.Redis,
+    count: int,
+    key_type: str = "string",
+    prefix: str = "key",
+    value_size: int = 0,
+    cardinality: int = 10,
+    seed: int = 0,
+    batch: int = 10_000,
+) -> PopulateStatsType:
+    """Generate keys server-side, deterministically, skipping the keys that exist already.
+
+    Keys are named ``<prefix>:<index>``, with index from 0 to count - 1.
+    String values are ``value:<index>`` (``value:<seed>:<index>`` with the seed)
+    truncated or zero-padded to the value size. They're generated with
+    ``DEBUG POPULATE`` if it's enabled and there's no seed, and with Lua script otherwise.
+    Collections (hashes, sets, sorted sets, lists and streams) get cardinality elements each,
+    ``<element>:<seed>:<index>`` zero-padded to the value size,
+    generated with Lua script, in batches of about the given number of elements.
+
+    Since existing keys are skipped, calling it again only generates the keys that are missing,
+    e.g. removed by the test.
+
+    :param client: redis client, e.g. the one from ``redisdb`` fixture
+    :param count: number of keys
+    :param key_type: type of the keys: string, hash, set, zset, list or stream
+    :param prefix: prefix of the key names
+    :param value_size: size of the values (or collections' elements) in bytes
+    :param cardinality: number of each collection's elements
+    :param seed: seed changing the values generated
+    :param batch: how many elements to generate in a single script call,
+        so that the server doesn't stop serving other clients for too long
+    :returns: number of keys, number of keys actually created, time it took and the method used
+    """
+    populate_type = check_populate_type(key_type)
+    if count < 0 or value_size < 0 or cardinality < 1:
+        raise ValueError("Populate count and value size can't be negative, cardinality positive.")
+    started_at = time.monotonic()
+    if populate_type == "string" and not seed:
+        keys_before = client.dbsize()
+        try:
+            client.execute_command("DEBUG", "POPULATE", count, prefix, value_size)
+        except ResponseError:
+            # DEBUG command is disabled (redis 7+ default) or not there at all
+            pass
+        else:
+            return PopulateStatsType(
+                keys=count,
+                created=client.dbsize() - keys_before,
+                seconds=time.monotonic() - started_at,
+                method="debug",
+            )
+
+    script = client.register_script(POPULATE_SCRIPT)
+    keys_per_call = max(batch // (1 if populate_type == "string" else cardinality), 1)
+    created = 0
+    for first in range(0, count, keys_per_call):
+        last = min(first + keys_per_call, count) - 1
+        created += int(
+            script(args=[populate_type, prefix, first, last, value_size, cardinality, seed])
+        )
+    return PopulateStatsType(
+        keys=count, created=created, seconds=time.monotonic() - started_at, method="script"
+    )
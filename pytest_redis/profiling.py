@@ -0,0 +1,198 @@
+"""Client-side command profiling of the client fixtures."""
+
+import json
+import time
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, TypedDict, Union, cast
+
+import redis
+from _pytest.terminal import TerminalReporter
+from pytest import Config, TestReport
+from redis.client import Pipeline
+
+PROFILE_PROPERTY = "redis_profile"
+"""
+Name of the test's user property holding its profile.
+"""
+
+LATENCY_BUCKETS: Tuple[float, ...] = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.1)
+"""
+Upper bounds (in seconds) of the latency histogram buckets. Slower commands land in the last one.
+"""
+
+
+class CommandProfileType(TypedDict):
+    """Profile of the test's redis client commands."""
+
+    commands: int
+    round_trips: int
+    latency: Dict[str, Dict[str, int]]
+
+
+def bucket_label(index: int) -> str:
+    """Return latency histogram bucket label, e.g. ``<=1ms``."""
+    if index == len(LATENCY_BUCKETS):
+        return f">{LATENCY_BUCKETS[-1] * 1000:g}ms"
+    return f"<={LATENCY_BUCKETS[index] * 1000:g}ms"
+
+
+def command_name(args: Sequence[Any]) -> str:
+    """Return upper cased name of the command."""
+    name = args[0].decode() if isinstance(args[0], bytes) else str(args[0])
+    return name.upper()
+
+
+class CommandProfile:
+    """Command counts, round trips and latency histograms of a single test's client."""
+
+    def __init__(self) -> None:
+        """Initialize CommandProfile."""
+        self.commands = 0
+        self.round_trips = 0
+        self.latency: Dict[str, List[int]] = {}
+
+    def record(self, names: Sequence[str], seconds: float) -> None:
+        """Record commands sent in a single round trip.
+
+        :param names: names of the commands sent
+        :param seconds: how long it took to get their replies
+        """
+        self.commands += len(names)
+        self.round_trips += 1
+        bucket = bisect_left(LATENCY_BUCKETS, seconds)
+        for name in names:
+            histogram = self.latency.setdefault(name, [0] * (len(LATENCY_BUCKETS) + 1))
+            histogram[bucket] += 1
+
+    def as_dict(self) -> CommandProfileType:
+        """Return profile as a JSON serializable dictionary."""
+        return CommandProfileType(
+            commands=self.commands,
+            round_trips=self.round_trips,
+            latency={
+                name: {bucket_label(index): count for index, count in enumerate(histogram) if count}
+                for name, histogram in sorted(self.latency.items())
+            },
+        )
+
+
+class ProfiledPipeline(Pipeline):
+    """Pipeline recording its commands, sent in a single round trip, to the profile."""
+
+    profile: CommandProfile
+
+    def immediate_execute_command(self, *args: Any, **options: Any) -> Any:
+        """Execute command right away (after WATCH), recording it as a round trip."""
+        started_at = time.perf_counter()
+        try:
+            return super().immediate_execute_command(  # type: ignore[no-untyped-call]
+                *args, **options
+            )
+        finally:
+            self.profile.record([command_name(args)], time.perf_counter() - started_at)
+
+    def execute(self, raise_on_error: bool = True) -> List[Any]:
+        """Execute all the queued commands, recording them as a single round trip."""
+        names = [command_name(args) for args, _ in self.command_stack]
+        if not names:
+            return super().execute(raise_on_error)
+        started_at = time.perf_counter()
+        try:
+            return super().execute(raise_on_error)
+        finally:
+            self.profile.record(names, time.perf_counter() - started_at)
+
+
+class ProfiledRedis(redis.Redis):
+    """Redis client recording its commands to the profile."""
+
+    def __init__(self, *args: Any, profile: CommandProfile, **kwargs: Any) -> None:
+        """Initialize ProfiledRedis.
+
+        :param profile: profile to record commands to
+        """
+        super().__init__(*args, **kwargs)
+        self.profile = profile
+
+    def execute_command(self, *args: Any, **options: Any) -> Any:
+        """Execute command, recording it as a round trip."""
+        started_at = time.perf_counter()
+        try:
+            return super().execute_command(*args, **options)
+        finally:
+            self.profile.record([command_name(args)], time.perf_counter() - started_at)
+
+    def pipeline(self, transaction: bool = True, shard_hint: Optional[str] = None) -> Pipeline:
+        """Return pipeline recording its commands to the same profile."""
+        pipeline = ProfiledPipeline(
+            self.connection_pool, self.response_callbacks, transaction, shard_hint
+        )
+        pipeline.profile = self.profile
+        return pipeline
+
+
+class ProfileReporter:
+    """Collect tests' command profiles, and report them after the test session.
+
+    Profiles are read from the tests' reports, so with xdist, they are collected
+    on the controller from all the workers.
+    """
+
+    def __init__(self, json_path: Union[str, Path], top: int = 10) -> None:
+        """Initialize ProfileReporter.
+
+        :param json_path: path of the JSON file to write all the profiles to
+        :param top: number of tests with most round trips to list in the terminal summary
+        """
+        self.json_path = Path(json_path)
+        self.top = top
+        self.profiles: Dict[str, CommandProfileType] = {}
+
+    def pytest_runtest_logreport(self, report: TestReport) -> None:
+        """Collect profile recorded by the test's client fixtures."""
+        if report.when != "teardown":
+            return
+        for name, value in report.user_properties:
+            if name == PROFILE_PROPERTY:
+                self.add(report.nodeid, cast(CommandProfileType, value))
+
+    def add(self, nodeid: str, profile: CommandProfileType) -> None:
+        """Add client's profile to the test's one, test may use more than one client."""
+        if nodeid not in self.profiles:
+            self.profiles[nodeid] = CommandProfileType(commands=0, round_trips=0, latency={})
+        total = self.profiles[nodeid]
+        total["commands"] += profile["commands"]
+        total["round_trips"] += profile["round_trips"]
+        for command, histogram in profile["latency"].items():
+            total_histogram = total["latency"].setdefault(command, {})
+            for label, count in histogram.items():
+                total_histogram[label] = total_histogram.get(label, 0) + count
+
+    def pytest_terminal_summary(self, terminalreporter: TerminalReporter) -> None:
+        """List tests making the most round trips, and write all the profiles to JSON file."""
+        if not self.profiles:
+            return
+        terminalreporter.write_sep("=", "redis client profile")
+        ranking = sorted(
+            self.profiles.items(), key=lambda item: item[1]["round_trips"], reverse=True
+        )
+        for nodeid, profile in ranking[: self.top]:
+            top_command = max(
+                profile["latency"].items(),
+                key=lambda item: sum(item[1].values()),
+                default=("-", {}),
+            )[0]
+            terminalreporter.write_line(
+                f"{profile['round_trips']:>8} round trips {profile['commands']:>8} commands "
+                f"(mostly {top_command})  {nodeid}"
+            )
+        with open(self.json_path, "w", encoding="utf-8") as json_file:
+            json.dump(self.profiles, json_file, indent=2, sort_keys=True)
+        terminalreporter.write_line(f"redis client profile written to {self.json_path}")
+
+
+def register_profile_reporter(config: Config, json_path: Union[str, Path]) -> None:
+    """Register profile reporter, unless that's an xdist worker reporting to the controller."""
+    if not hasattr(config, "workerinput"):
+        config.pluginmanager.register(ProfileReporter(json_path), "redis_profile_reporter")
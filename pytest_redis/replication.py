@@ -0,0 +1,77 @@
+"""Helpers measuring replication lag between primary and replica servers."""
+
+import time
+from typing import Iterable, Union
+
+import redis
+
+from pytest_redis.executor import NoopRedis, RedisExecutor
+
+ExecutorType = Union[NoopRedis, RedisExecutor]
+
+
+def _client(executor: ExecutorType) -> redis.Redis:
+    """Return client connected to the executor's server."""
+    if executor.unixsocket:
+        return redis.Redis(
+            unix_socket_path=executor.unixsocket,
+            username=executor.username,
+            password=executor.password,
+            decode_responses=True,
+        )
+    return redis.Redis(
+        host=executor.host,
+        port=executor.port,
+        username=executor.username,
+        password=executor.password,
+        decode_responses=True,
+    )
+
+
+def replication_offset(executor: ExecutorType) -> int:
+    """Return server's replication offset.
+
+    For primary, that's the offset of the replication stream it produced,
+    for replica - the offset it has processed.
+
+    :param executor: primary's or replica's executor
+    """
+    with _client(executor) as client:
+        info = client.info("replication")
+    if info["role"] == "master":
+        return int(info["master_repl_offset"])
+    return int(info["slave_repl_offset"])
+
+
+def replication_lag(primary: ExecutorType, replica: ExecutorType) -> int:
+    """Return how many bytes of the replication stream replica has yet to process.
+
+    :param primary: primary's executor
+    :param replica: replica's executor
+    """
+    return max(replication_offset(primary) - replication_offset(replica), 0)
+
+
+def wait_for_replication(
+    primary: ExecutorType, replicas: Iterable[ExecutorType], timeout: float = 10
+) -> float:
+    """Wait until replicas catch up with the primary's current offset.
+
+    :param primary: primary's executor
+    :param replicas: replicas' executors
+    :param timeout: how long to wait, in seconds
+    :returns: how long it took replicas to catch up, in seconds
+    """
+    started_at = time.monotonic()
+    target = replication_offset(primary)
+    delay = 0.001
+    for replica in replicas:
+        while replication_offset(replica) < target:
+            if time.monotonic() - started_at > timeout:
+                raise TimeoutError(
+                    f"Replica {replica.unixsocket or replica.port} did not catch up "
+                    f"with the primary within {timeout} seconds."
+                )
+            time.sleep(delay)
+            delay = min(delay * 2, 0.1)
+    return time.monotonic() - started_at
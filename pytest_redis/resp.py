@@ -0,0 +1,136 @@
+"""Encoding and decoding commands in the redis protocol (RESP)."""
+
+import asyncio
+from typing import IO, Iterator, List, Optional, Sequence, Union
+
+from redis.exceptions import DataError
+
+CommandArgType = Union[bytes, str, int, float]
+
+
+class SimpleString(str):
+    """Status reply, e.g. OK, sent as RESP simple string rather than bulk string."""
+
+
+class ErrorReply(Exception):
+    """Error reply, e.g. ``WRONGTYPE Operation against a key holding the wrong kind of value``.
+
+    Raised by the commands, and sent to the client as RESP error.
+    """
+
+
+ReplyType = Union[None, int, float, bytes, str, SimpleString, ErrorReply, Sequence["ReplyType"]]
+
+MAX_BULK_LENGTH = 512 * 1024 * 1024
+"""
+Longest bulk string redis-server accepts (proto-max-bulk-len).
+"""
+
+
+def encode_arg(arg: CommandArgType) -> bytes:
+    """Encode command argument into bytes, the way redis clients do.
+
+    Booleans are rejected, as redis-py does, rather than sent as ``True`` or ``False``.
+
+    :param arg: command argument
+    """
+    if isinstance(arg, bool):
+        raise DataError(
+            f"Invalid input of type: {type(arg).__name__!r}. "
+            "Convert to a bytes, string, int or float first."
+        )
+    if isinstance(arg, bytes):
+        return arg
+    if isinstance(arg, float):
+        return repr(arg).encode()
+    return str(arg).encode()
+
+
+def resp_command(*args: CommandArgType) -> bytes:
+    """Encode command in the redis protocol.
+
+    :param args: command name and its arguments
+    """
+    encoded = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        arg_bytes = encode_arg(arg)
+        encoded.append(b"$%d\r\n%s\r\n" % (len(arg_bytes), arg_bytes))
+    return b"".join(encoded)
+
+
+def iter_resp(stream: IO[bytes]) -> Iterator[List[bytes]]:
+    """Read commands encoded in the redis protocol, as ``redis-cli --pipe`` takes them.
+
+    :param stream: binary stream of RESP arrays of bulk strings
+    :returns: iterator over commands, each a list of its name and arguments
+    """
+    while header := stream.readline():
+        if header in (b"\r\n", b"\n"):
+            continue
+        if not header.startswith(b"*"):
+            raise ValueError(f"Expected RESP array, got: {header!r}")
+        command: List[bytes] = []
+        for _ in range(int(header[1:])):
+            length_line = stream.readline()
+            if not length_line.startswith(b"$"):
+                raise ValueError(f"Expected RESP bulk string, got: {length_line!r}")
+            length = int(length_line[1:])
+            command.append(stream.read(length))
+            stream.read(2)  # \r\n
+        yield command
+
+
+def encode_reply(reply: ReplyType) -> bytes:
+    """Encode reply in the redis protocol.
+
+    None is sent as null bulk string, floats as bulk strings, the way redis sends them.
+
+    :param reply: command's reply
+    """
+    if reply is None:
+        return b"$-1\r\n"
+    if isinstance(reply, ErrorReply):
+        return b"-%s\r\n" % str(reply).encode()
+    if isinstance(reply, SimpleString):
+        return b"+%s\r\n" % reply.encode()
+    if isinstance(reply, int):
+        return b":%d\r\n" % reply
+    if isinstance(reply, (bytes, str, float)):
+        reply_bytes = encode_arg(reply)
+        return b"$%d\r\n%s\r\n" % (len(reply_bytes), reply_bytes)
+    return b"*%d\r\n" % len(reply) + b"".join(encode_reply(item) for item in reply)
+
+
+async def read_command(reader: asyncio.StreamReader) -> Optional[List[bytes]]:
+    """Read single command sent by the client, either as RESP array or inline.
+
+    :param reader: client connection's stream
+    :returns: command's name and arguments, or None once client disconnected
+    """
+    while header := await reader.readline():
+        if not header.endswith(b"\r\n"):
+            break
+        if not header.startswith(b"*"):
+            if inline := header.split():
+                return inline
+            continue
+        command: List[bytes] = []
+        for _ in range(_length(header)):
+            length_line = await reader.readline()
+            if not length_line.startswith(b"$"):
+                raise ErrorReply(f"ERR Protocol error: expected '$', got {length_line[:1]!r}")
+            command.append((await reader.readexactly(_length(length_line) + 2))[:-2])
+        if command:
+            return command
+    return None
+
+
+def _length(line: bytes) -> int:
+    """Return array or bulk string length, from its RESP header line."""
+    try:
+        length = int(line[1:])
+    except ValueError:
+        length = -1
+    if not 0 <= length <= MAX_BULK_LENGTH:
+        raise ErrorReply("ERR Protocol error: invalid length")
+    return length
@@ -0,0 +1,150 @@
+"""Seed dataset snapshot, restored between tests."""
+
+from typing import Any, Callable, Iterable, List, Optional, Union
+from weakref import WeakSet
+
+import redis
+
+from pytest_redis.exception import SeedLost
+
+SeedLoaderType = Callable[[redis.Redis], None]
+"""
+Callable loading the seed dataset with the given client.
+"""
+
+SEEDED_SERVERS: "WeakSet[Any]" = WeakSet()
+"""
+Process fixtures' executors of the servers keeping a seed's pristine copy,
+which the other client fixtures mustn't remove with FLUSHALL.
+"""
+
+UNTRACKED_COMMANDS = ("flushdb", "flushall", "swapdb")
+"""
+Commands changing the whole database without keyspace notifications about the keys.
+"""
+
+
+def untracked_calls(client: redis.Redis) -> int:
+    """Return how many times the server ran the commands keyspace notifications miss.
+
+    Counted from the server's command stats, so they're server-wide.
+
+    :param client: client connected to the server
+    """
+    stats = client.info("commandstats")
+    return sum(
+        stats.get(f"cmdstat_{command}", {}).get("calls", 0) for command in UNTRACKED_COMMANDS
+    )
+
+
+def copy_keys(
+    client: redis.Redis,
+    keys: Iterable[Union[bytes, str]],
+    target_db: int,
+    batch: int = 1000,
+) -> None:
+    """Copy keys from client's database to the target database, with pipelined COPY commands.
+
+    :param client: client connected to the source database
+    :param keys: keys to copy
+    :param target_db: number of the target database
+    :param batch: how many COPY commands to send in a single pipeline
+    """
+    pipeline = client.pipeline(transaction=False)
+    for key in keys:
+        pipeline.copy(key, key, destination_db=target_db, replace=True)
+        if len(pipeline) >= batch:
+            pipeline.execute()
+    pipeline.execute()
+
+
+def copy_database(client: redis.Redis, target_db: int, batch: int = 1000) -> None:
+    """Copy all keys of the client's database into the target database.
+
+    :param client: client connected to the source database
+    :param target_db: number of the target database
+    :param batch: how many keys to scan and copy at once
+    """
+    copy_keys(client, client.scan_iter(count=batch), target_db, batch)
+
+
+class SeedSnapshot:
+    """Seed dataset with its pristine copy kept in another database.
+
+    Seed gets loaded once into the working database and copied into the pristine one.
+    After each test only the keys touched by the test get restored
+    from the pristine copy, with COPY command (redis 6.2+).
+    Whole database gets restored instead, if the server flushed or swapped
+    any of its databases during the test, as these don't notify about the keys.
+    """
+
+    def __init__(
+        self,
+        client: redis.Redis,
+        dbnum: int,
+        pristine: redis.Redis,
+        pristine_dbnum: int,
+        loader: Optional[SeedLoaderType] = None,
+    ) -> None:
+        """Initialize SeedSnapshot.
+
+        :param client: client connected to the working database
+        :param dbnum: number of the working database
+        :param pristine: client connected to the pristine database
+        :param pristine_dbnum: number of the pristine database
+        :param loader: callable loading the seed with the given client,
+            if not given, working database's content (loaded from rdb file) becomes the seed
+        """
+        assert dbnum != pristine_dbnum, "pristine database has to differ from the working one"
+        self.client = client
+        self.dbnum = dbnum
+        self.pristine = pristine
+        self.pristine_dbnum = pristine_dbnum
+        self.loader = loader
+        self.size: Optional[int] = None
+        self.untracked_calls = 0
+
+    def seed(self) -> None:
+        """Load the seed dataset and take its pristine copy."""
+        if self.loader:
+            self.client.flushdb()
+            self.loader(self.client)
+        self.pristine.flushdb()
+        copy_database(self.client, self.pristine_dbnum)
+        self.size = self.pristine.dbsize()
+
+    def prepare(self) -> None:
+        """Make sure working database holds the seed, before the test.
+
+        Seed gets loaded on first use, or again if its pristine copy got lost.
+        """
+        if self.size is None:
+            self.seed()
+        elif self.pristine.dbsize() != self.size:
+            # pristine copy got lost, e.g. to FLUSHALL
+            if not self.loader:
+                raise SeedLost(
+                    f"Pristine copy of the seed in database {self.pristine_dbnum} got removed, "
+                    "and there's no loader to seed it again. "
+                    "Make sure other client fixtures don't use FLUSHALL on this server."
+                )
+            self.seed()
+        self.untracked_calls = untracked_calls(self.client)
+
+    def restore(self, keys: Iterable[Union[bytes, str]], batch: int = 1000) -> None:
+        """Bring the touched keys back to their seeded state.
+
+        If the server flushed or swapped databases since :meth:`prepare`,
+        the whole working database is restored instead.
+
+        :param keys: keys touched since the seed was loaded or restored last
+        :param batch: how many keys to remove with a single UNLINK command
+        """
+        if untracked_calls(self.client) != self.untracked_calls:
+            self.client.flushdb()
+            copy_database(self.pristine, self.dbnum, batch)
+            return
+        touched: List[Union[bytes, str]] = list(keys)
+        for index in range(0, len(touched), batch):
+            self.client.unlink(*touched[index : index + batch])
+        copy_keys(self.pristine, touched, self.dbnum, batch)
@@ -0,0 +1,209 @@
+"""Server-side per-test stats, diffed from INFO and SLOWLOG snapshots."""
+
+from typing import Any, Dict, List, Tuple, TypedDict, cast
+
+import redis
+from _pytest.terminal import TerminalReporter
+from pytest import Config, Item, StashKey, TestReport
+
+from pytest_redis.cleanup import server_address
+
+SERVER_STATS_PROPERTY = "redis_server_stats"
+"""
+Name of the test's user property holding its server stats.
+"""
+
+STATS_FIELDS: Tuple[str, ...] = (
+    "total_commands_processed",
+    "total_net_input_bytes",
+    "total_net_output_bytes",
+    "keyspace_hits",
+    "keyspace_misses",
+    "expired_keys",
+    "evicted_keys",
+    "total_error_replies",
+)
+"""
+Counters of ``INFO stats`` diffed for each test.
+"""
+
+SNAPSHOT_COMMANDS = ("info", "slowlog")
+"""
+Commands used to take the snapshot, left out of the test's stats.
+"""
+
+
+class CommandStatsType(TypedDict):
+    """Server time spent on the command."""
+
+    calls: int
+    usec: int
+
+
+class SlowlogEntryType(TypedDict):
+    """Slow log entry."""
+
+    id: int
+    duration: int
+    command: str
+
+
+class ServerStatsType(TypedDict):
+    """Server-side stats of the test."""
+
+    usec: int
+    commands: Dict[str, CommandStatsType]
+    stats: Dict[str, int]
+    slowlog: List[SlowlogEntryType]
+    shared: bool
+
+
+class ServerSnapshot:
+    """Server's command stats, counters and the slow log position, at the given moment."""
+
+    def __init__(self, client: redis.Redis, shared: bool = False) -> None:
+        """Take the snapshot.
+
+        :param client: client connected to the server
+        :param shared: whether other tests might use the server at the same time,
+            making the stats unreliable
+        """
+        self.client = client
+        self.shared = shared
+        self.commands: Dict[str, CommandStatsType] = {
+            name[len("cmdstat_") :]: CommandStatsType(calls=stats["calls"], usec=stats["usec"])
+            for name, stats in client.info("commandstats").items()
+        }
+        stats = client.info("stats")
+        self.stats: Dict[str, int] = {field: stats.get(field, 0) for field in STATS_FIELDS}
+        slowlog = client.slowlog_get(1)
+        self.slowlog_id: int = slowlog[0]["id"] if slowlog else -1
+
+    def diff(self) -> ServerStatsType:
+        """Return stats of what server did since the snapshot was taken."""
+        after = ServerSnapshot(self.client)
+        commands: Dict[str, CommandStatsType] = {}
+        for name, stats in after.commands.items():
+            if name.split("|")[0] in SNAPSHOT_COMMANDS:
+                continue
+            before = self.commands.get(name, CommandStatsType(calls=0, usec=0))
+            if stats["calls"] > before["calls"]:
+                commands[name] = CommandStatsType(
+                    calls=stats["calls"] - before["calls"], usec=stats["usec"] - before["usec"]
+                )
+        slowlog: List[SlowlogEntryType] = []
+        if after.slowlog_id > self.slowlog_id:
+            for entry in self.client.slowlog_get(after.slowlog_id - self.slowlog_id):
+                command = entry["command"]
+                if isinstance(command, bytes):
+                    command = command.decode(errors="replace")
+                if entry["id"] > self.slowlog_id and (
+                    command.split(" ")[0].lower() not in SNAPSHOT_COMMANDS
+                ):
+                    slowlog.append(
+                        SlowlogEntryType(
+                            id=entry["id"], duration=entry["duration"], command=command
+                        )
+                    )
+        return ServerStatsType(
+            usec=sum(stats["usec"] for stats in commands.values()),
+            commands=commands,
+            stats={field: after.stats[field] - self.stats[field] for field in STATS_FIELDS},
+            slowlog=slowlog,
+            shared=self.shared,
+        )
+
+
+server_stats_clients_key = StashKey[List[Tuple[redis.Redis, bool]]]()
+"""
+Clients of the test's client fixtures to take server stats with, and whether their server is shared.
+"""
+
+
+def take_server_snapshots(item: Item) -> List[ServerSnapshot]:
+    """Take server snapshots right before the test runs, one for each server it uses.
+
+    Clients connect first, so that setting up their connections is left out of the stats.
+    """
+    clients = item.stash.get(server_stats_clients_key, [])
+    for client, _ in clients:
+        client.ping()
+    snapshots: Dict[Tuple[Any, ...], ServerSnapshot] = {}
+    for client, shared in clients:
+        address = server_address(client.connection_pool.connection_kwargs)
+        if address not in snapshots:
+            snapshots[address] = ServerSnapshot(client, shared)
+    return list(snapshots.values())
+
+
+def record_server_stats(item: Item, snapshots: List[ServerSnapshot]) -> None:
+    """Attach server stats to the test's report, right after it runs.
+
+    Snapshots are taken around the test's call only, so the stats leave out
+    fixtures' setup and cleanup, including the cleanup of other client fixtures.
+    """
+    for snapshot in snapshots:
+        item.user_properties.append((SERVER_STATS_PROPERTY, snapshot.diff()))
+
+
+class ServerStatsReporter:
+    """Collect tests' server stats, and list the slowest tests by redis server time.
+
+    Stats are read from the tests' reports, so with xdist, they are collected
+    on the controller from all the workers.
+    """
+
+    def __init__(self, top: int = 10) -> None:
+        """Initialize ServerStatsReporter.
+
+        :param top: number of tests with most server time to list in the terminal summary
+        """
+        self.top = top
+        self.server_stats: Dict[str, ServerStatsType] = {}
+
+    def pytest_runtest_logreport(self, report: TestReport) -> None:
+        """Collect server stats recorded by the test's client fixtures."""
+        if report.when != "teardown":
+            return
+        for name, value in report.user_properties:
+            if name == SERVER_STATS_PROPERTY:
+                self.add(report.nodeid, cast(ServerStatsType, value))
+
+    def add(self, nodeid: str, server_stats: ServerStatsType) -> None:
+        """Add server stats to the test's ones, test may use more than one server."""
+        if nodeid not in self.server_stats:
+            self.server_stats[nodeid] = ServerStatsType(
+                usec=0, commands={}, stats={}, slowlog=[], shared=False
+            )
+        total = self.server_stats[nodeid]
+        total["usec"] += server_stats["usec"]
+        total["shared"] = total["shared"] or server_stats["shared"]
+        for name, stats in server_stats["commands"].items():
+            command = total["commands"].setdefault(name, CommandStatsType(calls=0, usec=0))
+            command["calls"] += stats["calls"]
+            command["usec"] += stats["usec"]
+        for field, value in server_stats["stats"].items():
+            total["stats"][field] = total["stats"].get(field, 0) + value
+        total["slowlog"].extend(server_stats["slowlog"])
+
+    def pytest_terminal_summary(self, terminalreporter: TerminalReporter) -> None:
+        """List tests with the most redis server time spent."""
+        if not self.server_stats:
+            return
+        terminalreporter.write_sep("=", "slowest tests by redis server time")
+        ranking = sorted(self.server_stats.items(), key=lambda item: item[1]["usec"], reverse=True)
+        for nodeid, stats in ranking[: self.top]:
+            top_command = max(
+                stats["commands"].items(), key=lambda item: item[1]["usec"], default=("-", {})
+            )[0]
+            shared = "  (shared server, unreliable)" if stats["shared"] else ""
+            terminalreporter.write_line(
+                f"{stats['usec']:>10}us {len(stats['slowlog']):>4} slow "
+                f"(mostly {top_command})  {nodeid}{shared}"
+            )
+
+
+def register_server_stats_reporter(config: Config) -> None:
+    """Register server stats reporter, unless that's an xdist worker reporting to the controller."""
+    if not hasattr(config, "workerinput"):
+        config.pluginmanager.register(ServerStatsReporter(), "redis_server_stats_reporter")
@@ -0,0 +1,92 @@
+"""Sharing one redis-server between pytest-xdist workers.
+
+The xdist controller starts a single redis-server with enough databases
+for every worker, and passes its address to the workers.
+Each worker then uses its own block of databases on that server,
+split between the worker's process fixtures.
+"""
+
+import shutil
+from pathlib import Path
+from tempfile import mkdtemp
+from typing import Any, Optional
+
+from pytest import Config
+
+from pytest_redis.config import load_config
+from pytest_redis.executor import RedisExecutor
+from pytest_redis.executor.shared import (
+    SHARED_FIXTURE_SLOTS,
+    SHARED_SERVER_KEY,
+    SharedServerType,
+)
+from pytest_redis.factories.proc import (
+    ephemeral_datadir,
+    redis_executor,
+    redis_port,
+    server_profile,
+)
+
+
+def is_xdist_controller(config: Config) -> bool:
+    """Check whether we're running on the xdist controller distributing tests to workers."""
+    if not config.pluginmanager.hasplugin("xdist"):
+        return False
+    return not hasattr(config, "workerinput") and config.getoption("dist", "no") != "no"
+
+
+class SharedRedisController:
+    """Pytest plugin running the shared redis-server on the xdist controller.
+
+    Server is started along with the first worker node
+    and stopped once pytest is done.
+    """
+
+    def __init__(self, config: Config) -> None:
+        """Initialize controller plugin."""
+        self.config = load_config(config)
+        self.cache = getattr(config, "cache", None)
+        self.executor: Optional[RedisExecutor] = None
+        self.tmpdir: Optional[Path] = None
+
+    def start(self, workers: int) -> RedisExecutor:
+        """Start shared redis-server with a block of databases for each worker."""
+        if self.config["datadir"]:
+            datadir = Path(self.config["datadir"])
+        elif server_profile(self.config) == "ephemeral" and (
+            shm_datadir := ephemeral_datadir("pytest-redis-shared-")
+        ):
+            self.tmpdir = datadir = shm_datadir
+        else:
+            self.tmpdir = datadir = Path(mkdtemp(prefix="pytest-redis-shared-"))
+        self.executor = redis_executor(
+            self.config,
+            datadir,
+            redis_port(self.config),
+            db_count=self.config["db_count"] * SHARED_FIXTURE_SLOTS * workers,
+            version_cache=self.cache,
+        )
+        self.executor.start()
+        return self.executor
+
+    def pytest_configure_node(self, node: Any) -> None:
+        """Pass shared redis-server details to the xdist worker."""
+        executor = self.executor or self.start(node.workerinput["workercount"])
+        node.workerinput[SHARED_SERVER_KEY] = SharedServerType(
+            host=executor.host,
+            port=executor.port,
+            unixsocket=executor.unixsocket,
+            username=executor.username,
+            password=executor.password,
+            databases=self.config["db_count"],
+            slots=SHARED_FIXTURE_SLOTS,
+        )
+
+    def pytest_unconfigure(self) -> None:
+        """Stop shared redis-server."""
+        if self.executor:
+            self.executor.stop()
+            self.executor = None
+        if self.tmpdir:
+            shutil.rmtree(self.tmpdir, ignore_errors=True)
+            self.tmpdir = None
@@ -2,13 +2,41 @@
 
 import warnings
 
+import pytest
+from pytest import Pytester
+from redis import Redis
+
 import pytest_redis.factories
 from pytest_redis.plugin import *  # noqa: F403
 
+pytest_plugins = ["pytester"]
+
 warnings.filterwarnings(
     "error", category=DeprecationWarning, module="(_pytest|pytest|redis|path|mirakuru).*"
 )
 
+
+@pytest.fixture
+def pytester(pytester: Pytester) -> Pytester:
+    """Pytester, with pytest-asyncio configured the same way as for this test suite.
+
+    Inner test runs don't read this project's configuration, and pytest-asyncio
+    warns about its unset loop scope, which the filter above turns into an error.
+    """
+    pytester.makeini("""
+        [pytest]
+        asyncio_mode = strict
+        asyncio_default_fixture_loop_scope = function
+        """)
+    return pytester
+
+
+def load_seed(client: Redis) -> None:
+    """Load seed dataset for the seeded client fixture."""
+    client.mset({f"seed:{number}": number for number in range(1000)})
+    client.hset("seed:hash", mapping={"field": "value"})
+
+
 # pylint:disable=invalid-name
 redis_proc2 = pytest_redis.factories.redis_proc(port=6381)
 redis_nooproc2 = pytest_redis.factories.redis_noproc(port=6381, startup_timeout=1)
@@ -19,4 +47,41 @@ redisdb2 = pytest_redis.factories.redisdb("redis_proc2")
 redisdb2_noop = pytest_redis.factories.redisdb("redis_nooproc2")
 redisdb3 = pytest_redis.factories.redisdb("redis_proc3")
 redisdb3_noop = pytest_redis.factories.redisdb("redis_nooproc3")
+redisdb_tracked = pytest_redis.factories.redisdb("redis_proc", dbnum=1, cleanup="tracked")
+async_redisdb = pytest_redis.factories.async_redisdb("redis_proc")
+async_redisdb_tracked = pytest_redis.factories.async_redisdb(
+    "redis_proc", dbnum=1, cleanup="tracked"
+)
+redis_proc_unixsocket = pytest_redis.factories.redis_proc(unixsocket_only=True)
+redisdb_unixsocket = pytest_redis.factories.redisdb("redis_proc_unixsocket")
+redis_isolated = pytest_redis.factories.redis_isolated_proc(pool_size=1)
+redis_isolated_recycled = pytest_redis.factories.redis_isolated_proc(pool_size=1, recycle=True)
+redisdb_isolated = pytest_redis.factories.redisdb("redis_isolated")
+redis_isolated_maxmemory = pytest_redis.factories.redis_isolated_proc(
+    profile="ephemeral",
+    maxmemory="32mb",
+    maxmemory_policy="allkeys-lru",
+)
+redis_proc_ephemeral = pytest_redis.factories.redis_proc(profile="ephemeral")
+redis_proc_seed = pytest_redis.factories.redis_proc()
+redisdb_seeded = pytest_redis.factories.seeded_redisdb("redis_proc_seed", loader=load_seed)
+redis_cluster = pytest_redis.factories.redis_cluster_proc(masters=3, replicas=1)
+redis_clusterdb = pytest_redis.factories.redis_clusterdb("redis_cluster", decode=True)
+redis_proc_primary = pytest_redis.factories.redis_proc()
+redis_replicas = pytest_redis.factories.redis_replica_proc("redis_proc_primary", count=2)
+redisdb_primary = pytest_redis.factories.redisdb("redis_proc_primary")
+redis_proc_maxmemory = pytest_redis.factories.redis_proc(
+    maxmemory="64mb", maxmemory_policy="allkeys-lru"
+)
+redisdb_inproc = pytest_redis.factories.redisdb("redis_inproc")
+async_redisdb_inproc = pytest_redis.factories.async_redisdb("redis_inproc")
+redis_inproc_password = pytest_redis.factories.redis_inproc(password="secretpassword")
+redisdb_inproc_password = pytest_redis.factories.redisdb("redis_inproc_password")
+redis_load_asyncio = pytest_redis.factories.redis_load(
+    "redis_proc", clients=8, concurrency="asyncio", dbnum=2
+)
+redisdb_proxy = pytest_redis.factories.redisdb("redis_proxy")
+redis_proxy_unix = pytest_redis.factories.redis_proxy("redis_proc3", latency=0.01, unixsocket=True)
+redisdb_proxy_unix = pytest_redis.factories.redisdb("redis_proxy_unix")
+redis_proxy_resets = pytest_redis.factories.redis_proxy("redis_proc", reset_rate=1.0)
 # pylint:enable=invalid-name
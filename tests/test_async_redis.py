@@ -0,0 +1,40 @@
+"""Tests for asyncio client fixture."""
+
+import pytest
+from redis.asyncio import Redis
+
+from pytest_redis.cleanup import AsyncKeyTracker
+
+
+@pytest.mark.asyncio
+async def test_async_redis(async_redisdb: Redis) -> None:
+    """Check that it's actually working on redis database."""
+    await async_redisdb.set("test1", "test")
+    assert await async_redisdb.get("test1") == b"test"
+
+
+@pytest.mark.asyncio
+async def test_async_redis_clean(async_redisdb: Redis) -> None:
+    """Check that database has been cleaned after previous tests."""
+    assert await async_redisdb.dbsize() == 0
+
+
+@pytest.mark.asyncio
+async def test_async_key_tracker(async_redisdb: Redis) -> None:
+    """Check that only touched keys get removed."""
+    await async_redisdb.set("untouched", "value")
+    tracker = AsyncKeyTracker(async_redisdb, 0)
+    await tracker.start()
+    await async_redisdb.set("created", "value")
+    await async_redisdb.hset("hash", "field", "value")
+
+    assert await tracker.collect() == {b"created", b"hash"}
+    await tracker.cleanup()
+    assert await async_redisdb.keys() == [b"untouched"]
+
+
+@pytest.mark.asyncio
+async def test_async_tracked_fixture(async_redisdb_tracked: Redis) -> None:
+    """Check that tracked cleanup works with asyncio client fixture."""
+    await async_redisdb_tracked.set("key", "value")
+    assert await async_redisdb_tracked.get("key") == b"value"
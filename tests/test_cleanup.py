@@ -0,0 +1,87 @@
+"""Tests for database cleanup strategies."""
+
+import pytest
+from redis.client import Redis
+
+from pytest_redis.cleanup import KeyTracker, check_cleanup, flush
+from pytest_redis.executor import RedisExecutor
+
+
+def test_check_cleanup_unknown() -> None:
+    """Check that unknown cleanup strategy gets rejected."""
+    with pytest.raises(ValueError):
+        check_cleanup("flushsome")
+
+
+@pytest.mark.parametrize("cleanup", ("flushdb", "skip-empty"))
+def test_flush_own_database(redisdb: Redis, cleanup: str) -> None:
+    """Check that flushdb based strategies leave other databases untouched."""
+    redisdb.set("key", "value")
+    redis_db1 = Redis(unix_socket_path=redisdb.connection_pool.connection_kwargs["path"], db=1)
+    redis_db1.set("other", "value")
+
+    flush(redis_db1, check_cleanup(cleanup))
+
+    assert redis_db1.dbsize() == 0
+    assert redisdb.get("key") == b"value"
+
+
+def test_key_tracker(redisdb: Redis) -> None:
+    """Check that only touched keys get removed."""
+    redisdb.set("untouched", "value")
+    redisdb.set("modified", "value")
+    tracker = KeyTracker(redisdb, 0)
+    tracker.start()
+    redisdb.set("created", "value")
+    redisdb.set("modified", "new value")
+    redisdb.hset("hash", "field", "value")
+    with redisdb.pipeline() as pipeline:
+        pipeline.sadd("set", "member").lpush("list", "element")
+        pipeline.execute()
+
+    assert tracker.collect() == {b"created", b"modified", b"hash", b"set", b"list"}
+    tracker.cleanup()
+    assert redisdb.keys() == [b"untouched"]
+
+
+def test_key_tracker_restores_events(redisdb: Redis) -> None:
+    """Check that keyspace notifications get turned off once the last tracker stops."""
+    redisdb.config_set("notify-keyspace-events", "")
+    first = KeyTracker(redisdb, 0)
+    second = KeyTracker(redisdb, 1)
+    first.start()
+    second.start()
+    first.stop()
+    assert redisdb.config_get("notify-keyspace-events") == {"notify-keyspace-events": "AK"}
+    second.stop()
+    assert redisdb.config_get("notify-keyspace-events") == {"notify-keyspace-events": ""}
+
+
+def test_tracked_fixture(redisdb_tracked: Redis) -> None:
+    """Check that tracked cleanup fixture turns keyspace notifications on."""
+    redisdb_tracked.set("key", "value")
+    events = redisdb_tracked.config_get("notify-keyspace-events")["notify-keyspace-events"]
+    assert "K" in events and "A" in events
+
+
+def test_tracked_fixture_restores_external_server(
+    pytester: pytest.Pytester, redis_proc: RedisExecutor
+) -> None:
+    """Check that tracked cleanup restores keyspace notifications of the server it didn't start."""
+    client = Redis(unix_socket_path=redis_proc.unixsocket)
+    client.config_set("notify-keyspace-events", "")
+    pytester.makeconftest(f"""
+        from pytest_redis import factories
+        from pytest_redis.plugin import *  # noqa: F403
+
+        redis_external = factories.redis_noproc(host="{redis_proc.host}", port={redis_proc.port})
+        redisdb_external = factories.redisdb("redis_external", cleanup="tracked")
+        """)
+    pytester.makepyfile("""
+        def test_tracked(redisdb_external):
+            redisdb_external.set("key", "value")
+        """)
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=1)
+    assert client.config_get("notify-keyspace-events") == {"notify-keyspace-events": ""}
+    assert client.exists("key") == 0
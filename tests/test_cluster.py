@@ -0,0 +1,53 @@
+"""Tests for Redis Cluster fixtures."""
+
+import pytest
+import redis
+from redis.cluster import RedisCluster
+from redis.exceptions import ResponseError
+
+from pytest_redis.executor.cluster import RedisClusterExecutor, slot_ranges
+
+
+def test_slot_ranges() -> None:
+    """Check that all the slots are assigned, each to one master."""
+    ranges = slot_ranges(3)
+    assert [(slots.start, slots.stop) for slots in ranges] == [
+        (0, 5461),
+        (5461, 10922),
+        (10922, 16384),
+    ]
+
+
+def test_cluster(redis_cluster: RedisClusterExecutor, redis_clusterdb: RedisCluster) -> None:
+    """Check that cluster is formed of all the nodes."""
+    assert redis_cluster.running()
+    assert len(redis_clusterdb.get_primaries()) == 3
+    assert len(redis_clusterdb.get_replicas()) == 1
+    assert redis_clusterdb.cluster_info()["cluster_state"] == "ok"
+
+
+@pytest.mark.parametrize("attempt", range(2))
+def test_cluster_keys(redis_clusterdb: RedisCluster, attempt: int) -> None:
+    """Check keys spread across slots, and that cluster gets flushed after each test."""
+    assert redis_clusterdb.dbsize(target_nodes=RedisCluster.PRIMARIES) == 0
+    keys = {f"key:{number}": str(number) for number in range(100)}
+    assert len({redis_clusterdb.keyslot(key) for key in keys}) > 1
+    pipeline = redis_clusterdb.pipeline()
+    for key, value in keys.items():
+        pipeline.set(key, value)
+    pipeline.execute()
+    pipeline = redis_clusterdb.pipeline()
+    for key in keys:
+        pipeline.get(key)
+    assert pipeline.execute() == list(keys.values())
+
+
+def test_cross_slot(redis_cluster: RedisClusterExecutor) -> None:
+    """Check that cluster node refuses commands on keys from different slots."""
+    # slots of {b} and {f} both belong to the first master
+    node = redis.Redis(unix_socket_path=redis_cluster.masters[0].unixsocket)
+    assert node.mset({"{b}:name": "name", "{b}:email": "email"})
+    with pytest.raises(ResponseError, match="same slot"):
+        node.mset({"{b}:name": "name", "{f}:name": "name"})
+    node.flushall()
+    node.close()
@@ -0,0 +1,45 @@
+"""Tests for config resolution."""
+
+import pytest
+from pytest import FixtureRequest, Pytester
+
+from pytest_redis.config import get_config
+
+
+def test_config_resolved_once(request: FixtureRequest) -> None:
+    """Check that config is resolved once, and kept for the session."""
+    assert get_config(request) is get_config(request)
+
+
+def test_invalid_config(pytester: Pytester) -> None:
+    """Check that invalid config value fails at the session start."""
+    pytester.makeconftest("from pytest_redis.plugin import *  # noqa: F403")
+    pytester.makepyfile("""
+        def test_never_run():
+            pass
+        """)
+    result = pytester.runpytest("--redis-cleanup=sometimes")
+    result.stderr.fnmatch_lines(["*pytest-redis: Unknown redis cleanup strategy: sometimes*"])
+    assert result.ret == pytest.ExitCode.USAGE_ERROR
+
+
+def test_config_passed_to_workers(request: FixtureRequest, pytester: Pytester) -> None:
+    """Check that xdist workers get config resolved on the controller."""
+    pytester.makeconftest("from pytest_redis.plugin import *  # noqa: F403")
+    pytester.makepyfile("""
+        import pytest
+
+        from pytest_redis.config import WORKER_CONFIG_KEY, get_config
+
+        @pytest.mark.parametrize("attempt", range(2))
+        def test_worker_config(request, attempt):
+            assert get_config(request) == request.config.workerinput[WORKER_CONFIG_KEY]
+            assert get_config(request)["db_count"] == 4
+        """)
+    result = pytester.runpytest(
+        "-n",
+        "2",
+        "--redis-db-count=4",
+        f"--redis-exec={get_config(request)['exec']}",
+    )
+    result.assert_outcomes(passed=2)
@@ -0,0 +1,29 @@
+"""Tests for client fixtures' connection pools."""
+
+from redis.client import Redis
+
+from pytest_redis.connection import get_connection_pool
+from pytest_redis.executor import RedisExecutor
+
+
+def test_connection_pool_shared(redis_proc: RedisExecutor, redisdb: Redis) -> None:
+    """Check that client fixture uses session-wide connection pool."""
+    assert redisdb.connection_pool is get_connection_pool(redis_proc, 0, False)
+    assert redisdb.connection_pool is not get_connection_pool(redis_proc, 1, False)
+    assert redisdb.connection_pool is not get_connection_pool(redis_proc, 0, True)
+
+
+def test_connection_pool_reset(redis_proc: RedisExecutor) -> None:
+    """Check that connection's state gets reset."""
+    pool = get_connection_pool(redis_proc, 1, False)
+    client = Redis(connection_pool=pool)
+    client.set("key", "db1")
+    client.client_setname("changed")
+    client.execute_command("SELECT", 2)
+    client.execute_command("MULTI")
+
+    pool.reset_connections()
+
+    assert client.get("key") == b"db1"
+    assert client.client_getname() is None
+    client.flushdb()
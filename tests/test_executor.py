@@ -18,7 +18,14 @@ from pytest_redis.executor import (
     NoopRedis,
     RedisExecutor,
 )
-from pytest_redis.executor.process import extract_version
+from pytest_redis.executor.process import (
+    REDIS_VERSIONS,
+    VERSION_CACHE_KEY,
+    extract_version,
+    redis_version,
+)
+from pytest_redis.executor.readiness import redis_ping
+from pytest_redis.resp import resp_command
 
 
 @pytest.mark.parametrize(
@@ -94,6 +101,34 @@ def test_redis_exec(
         assert redis_exec.running()
 
 
+def test_redis_exec_unixsocket_only(
+    request: FixtureRequest, tmp_path_factory: TempPathFactory
+) -> None:
+    """Check that servers without TCP port get distinct unix sockets."""
+    config = get_config(request)
+    tmpdir = tmp_path_factory.mktemp("pytest-redis-test-test_redis_exec_unixsocket_only")
+    executors = [
+        RedisExecutor(
+            executable=config["exec"],
+            databases=4,
+            redis_timeout=config["timeout"],
+            loglevel=config["loglevel"],
+            port=0,
+            host=config["host"],
+            startup_timeout=30,
+            datadir=tmpdir,
+        )
+        for _ in range(2)
+    ]
+    assert executors[0].unixsocket != executors[1].unixsocket
+    assert "--bind" not in executors[0].command_parts
+    with executors[0], executors[1]:
+        for executor in executors:
+            client = redis.Redis(unix_socket_path=executor.unixsocket, decode_responses=True)
+            assert client.config_get("port") == {"port": "0"}
+            client.close()
+
+
 @pytest.mark.parametrize(
     "value, redis_value",
     (
@@ -130,7 +165,7 @@ def test_old_redis_version(
     config = get_config(request)
     tmpdir = tmp_path_factory.mktemp("pytest-redis-test-test_old_redis_version")
     with mock.patch("os.popen", lambda *args: StringIO(version)):
-        with pytest.raises(RedisUnsupported):
+        with mock.patch.dict(REDIS_VERSIONS, clear=True), pytest.raises(RedisUnsupported):
             redis_port = get_port(None)
             assert redis_port
             RedisExecutor(
@@ -145,6 +180,35 @@ def test_old_redis_version(
             ).start()
 
 
+def test_redis_version_memoized(request: FixtureRequest) -> None:
+    """Check that redis-server --version is run only once per executable."""
+    config = get_config(request)
+    fake_popen = mock.Mock(side_effect=lambda *args: StringIO("v=7.2.4"))
+    with mock.patch("os.popen", fake_popen), mock.patch.dict(REDIS_VERSIONS, clear=True):
+        assert redis_version(config["exec"]) == parse("7.2.4")
+        assert redis_version(config["exec"]) == parse("7.2.4")
+    assert fake_popen.call_count == 1
+
+
+def test_redis_version_cached_on_disk(request: FixtureRequest) -> None:
+    """Check that redis-server version is reused from pytest's cache between runs."""
+    config = get_config(request)
+    cache = mock.Mock(spec=["get", "set"])
+    cache.get.return_value = {}
+    fake_popen = mock.Mock(side_effect=lambda *args: StringIO("v=7.2.4"))
+    with mock.patch("os.popen", fake_popen), mock.patch.dict(REDIS_VERSIONS, clear=True):
+        assert redis_version(config["exec"], cache) == parse("7.2.4")
+        cache.set.assert_called_once()
+        key, cached_versions = cache.set.call_args.args
+        assert key == VERSION_CACHE_KEY
+
+        # next run, with empty in-process cache
+        REDIS_VERSIONS.clear()
+        cache.get.return_value = cached_versions
+        assert redis_version(config["exec"], cache) == parse("7.2.4")
+    assert fake_popen.call_count == 1
+
+
 def test_not_existing_redis(request: FixtureRequest, tmp_path_factory: TempPathFactory) -> None:
     """Check handling of misconfigured redis executable path."""
     config = get_config(request)
@@ -207,7 +271,7 @@ def test_extract_version_notfound() -> None:
 
 def test_noopredis_handles_timeout_when_waiting() -> None:
     """Test handling timeuts by NoopRedis."""
-    with mock.patch("pytest_redis.executor.noop.socket", spec=socket) as patched_socket:
+    with mock.patch("pytest_redis.executor.readiness.socket", spec=socket) as patched_socket:
         foo = patched_socket.socket.return_value
         socket_mock = foo.__enter__.return_value
         socket_mock.connect.side_effect = TimeoutError()
@@ -220,6 +284,42 @@ def test_noopredis_handles_timeout_when_waiting() -> None:
         socket_mock.connect.assert_called()
 
 
+def test_resp_command() -> None:
+    """Check command encoding in the redis protocol."""
+    assert resp_command("AUTH", "user", "pass") == (
+        b"*3\r\n$4\r\nAUTH\r\n$4\r\nuser\r\n$4\r\npass\r\n"
+    )
+
+
+def test_readiness_timing(redis_proc: RedisExecutor) -> None:
+    """Check that readiness check timing is recorded."""
+    assert redis_proc.ready_time is not None
+    assert redis_proc.ready_probes >= 1
+
+
+def test_redis_ping(redis_proc: RedisExecutor, redis_proc3: RedisExecutor) -> None:
+    """Check PING readiness probe over unix socket and TCP, with and without password."""
+    assert redis_ping(redis_proc.unixsocket)
+    assert redis_ping((redis_proc.host, redis_proc.port))
+    assert redis_ping(redis_proc3.unixsocket, password="secretpassword")
+
+
+@pytest.mark.parametrize(
+    "reply, ready",
+    (
+        (b"+PONG\r\n", True),
+        (b"-LOADING Redis is loading the dataset in memory\r\n", False),
+        (b"+PO", False),
+    ),
+)
+def test_redis_ping_replies(reply: bytes, ready: bool) -> None:
+    """Check that server loading its dataset is not considered ready."""
+    with mock.patch("pytest_redis.executor.readiness.socket", spec=socket) as patched_socket:
+        socket_mock = patched_socket.socket.return_value.__enter__.return_value
+        socket_mock.recv.side_effect = [reply, b""]
+        assert redis_ping(("localhost", 12345)) is ready
+
+
 def test_redis_modules_option(request: FixtureRequest, tmp_path_factory: TempPathFactory) -> None:
     """Set 'module' keyword argument and check command line."""
     config = get_config(request)
@@ -254,3 +354,61 @@ def test_redis_modules_option(request: FixtureRequest, tmp_path_factory: TempPat
         # cannot check for nonexistent2.so because Redis stops at first invalid module
     finally:
         redis_exec.stop()
+
+
+@pytest.mark.parametrize("password", ("secretpassword", None))
+def test_stop_shutdown_nosave(
+    request: FixtureRequest, tmp_path_factory: TempPathFactory, password: str
+) -> None:
+    """Check that server is shut down without saving, and its files get removed."""
+    config = get_config(request)
+    tmpdir = tmp_path_factory.mktemp("pytest-redis-test-shutdown")
+    redis_port = get_port(None)
+    assert redis_port
+    redis_exec = RedisExecutor(
+        executable=config["exec"],
+        databases=4,
+        redis_timeout=config["timeout"],
+        loglevel=config["loglevel"],
+        port=redis_port,
+        host=config["host"],
+        password=password,
+        startup_timeout=30,
+        datadir=tmpdir,
+        save="900 1",
+    )
+    with redis_exec:
+        with redis.Redis(unix_socket_path=redis_exec.unixsocket, password=password) as client:
+            client.set("key", "value")
+        assert list(tmpdir.iterdir())
+        assert redis_exec.shutdown_nosave() is True
+        assert not redis_exec.running()
+    assert not (tmpdir / redis_exec.dbfilename).exists()
+    assert not list(tmpdir.iterdir())
+
+
+def test_stop_falls_back_to_signal(
+    request: FixtureRequest, tmp_path_factory: TempPathFactory
+) -> None:
+    """Check that server is stopped with the signal, if SHUTDOWN NOSAVE fails."""
+    config = get_config(request)
+    tmpdir = tmp_path_factory.mktemp("pytest-redis-test-shutdown-fallback")
+    redis_port = get_port(None)
+    assert redis_port
+    redis_exec = RedisExecutor(
+        executable=config["exec"],
+        databases=4,
+        redis_timeout=config["timeout"],
+        loglevel=config["loglevel"],
+        port=redis_port,
+        host=config["host"],
+        password="secretpassword",
+        startup_timeout=30,
+        datadir=tmpdir,
+    )
+    with redis_exec:
+        redis_exec.password = "wrongpassword"
+        assert redis_exec.shutdown_nosave() is False
+        assert redis_exec.running()
+    assert not redis_exec.running()
+    assert not list(tmpdir.iterdir())
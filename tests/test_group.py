@@ -0,0 +1,71 @@
+"""Process fixture groups tests."""
+
+from pathlib import Path
+
+import pytest
+
+from pytest_redis import factories
+from pytest_redis.executor import RedisExecutor
+
+redis_group = factories.redis_proc_group("servers")
+redis_proc_group_a = factories.redis_proc(group=redis_group)
+redis_proc_group_b = factories.redis_proc(group=redis_group)
+
+
+def test_group_starts_all_members(request: pytest.FixtureRequest) -> None:
+    """Check that requesting one group member starts the whole group."""
+    executor_a = request.getfixturevalue("redis_proc_group_a")
+    started = redis_group.started[request.config]
+    assert len(started) == 2
+    executors = [executor for executor, _ in started.values()]
+    assert executor_a in executors
+    assert all(executor.running() for executor in executors)
+    assert len({executor.port for executor in executors}) == 2
+    assert request.getfixturevalue("redis_proc_group_b") in executors
+
+
+def test_group_members_data_directories(
+    redis_proc_group_a: RedisExecutor, redis_proc_group_b: RedisExecutor
+) -> None:
+    """Check that group members are separate servers, with their own data directories."""
+    assert Path(redis_proc_group_a.unixsocket).parent.name.startswith("pytest-redis-servers0")
+    assert Path(redis_proc_group_b.unixsocket).parent.name.startswith("pytest-redis-servers1")
+
+
+def test_group_start_failure(pytester: pytest.Pytester, redis_proc: RedisExecutor) -> None:
+    """Check that members which did start get stopped and cleaned up, once any other fails."""
+    pytester.makeconftest("""
+        from pytest_redis import factories
+        from pytest_redis.executor import RedisExecutor
+        from pytest_redis.plugin import *  # noqa: F403
+
+        redis_group = factories.redis_proc_group("failing")
+        redis_ephemeral = factories.redis_proc(group=redis_group, profile="ephemeral")
+        redis_broken = factories.redis_proc(group=redis_group, modules=["/missing/module.so"])
+        started = []
+        original_start = RedisExecutor.start
+
+        def start(self):
+            original_start(self)
+            started.append(self)
+            return self
+
+        RedisExecutor.start = start
+        """)
+    pytester.makepyfile("""
+        from pathlib import Path
+
+        import pytest
+
+        from conftest import redis_group, started
+
+        def test_failed_group(request):
+            with pytest.raises(Exception):
+                request.getfixturevalue("redis_ephemeral")
+            assert not redis_group.started
+            [executor] = started
+            assert not executor.running()
+            assert not Path(executor.unixsocket).parent.exists()
+        """)
+    result = pytester.runpytest(f"--redis-exec={redis_proc.executable}")
+    result.assert_outcomes(passed=1)
@@ -0,0 +1,129 @@
+"""In-process redis server tests."""
+
+import time
+
+import pytest
+from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
+from redis.exceptions import AuthenticationError, ResponseError, WatchError
+
+from pytest_redis.backend import DictBackend
+from pytest_redis.executor import InProcessRedis
+from pytest_redis.resp import ErrorReply, ReplyType
+
+
+def test_strings_and_expiry(redisdb_inproc: Redis) -> None:
+    """Check string commands and keys' expiry."""
+    assert redisdb_inproc.set("key", "value")
+    assert redisdb_inproc.get("key") == b"value"
+    assert redisdb_inproc.set("key", "other", nx=True) is None
+    assert redisdb_inproc.incr("counter", 5) == 5
+    assert redisdb_inproc.incrbyfloat("counter", 0.5) == 5.5
+    assert redisdb_inproc.mget("key", "missing") == [b"value", None]
+    redisdb_inproc.set("short", "lived", px=10)
+    assert redisdb_inproc.pttl("short") > 0
+    time.sleep(0.02)
+    assert not redisdb_inproc.exists("short")
+    assert sorted(redisdb_inproc.keys("*")) == [b"counter", b"key"]
+    with pytest.raises(ResponseError, match="WRONGTYPE"):
+        redisdb_inproc.lpush("key", "element")
+
+
+def test_collections(redisdb_inproc: Redis) -> None:
+    """Check hash, list, set and sorted set commands."""
+    redisdb_inproc.hset("hash", mapping={"field": "value", "other": "1"})
+    assert redisdb_inproc.hgetall("hash") == {b"field": b"value", b"other": b"1"}
+    assert redisdb_inproc.hincrby("hash", "other", 2) == 3
+    redisdb_inproc.rpush("list", "a", "b", "c")
+    assert redisdb_inproc.lrange("list", 0, -1) == [b"a", b"b", b"c"]
+    assert redisdb_inproc.lpop("list") == b"a"
+    redisdb_inproc.sadd("set", "a", "b")
+    assert redisdb_inproc.smembers("set") == {b"a", b"b"}
+    redisdb_inproc.zadd("zset", {"a": 2, "b": 1})
+    assert redisdb_inproc.zrange("zset", 0, -1, withscores=True) == [(b"b", 1.0), (b"a", 2.0)]
+    assert redisdb_inproc.execute_command("TYPE", "zset") == b"zset"
+
+
+def test_cleaned_after_previous_test(redisdb_inproc: Redis) -> None:
+    """Check that client fixture flushed the data left by the previous tests."""
+    assert redisdb_inproc.dbsize() == 0
+
+
+def test_transactions(redisdb_inproc: Redis) -> None:
+    """Check MULTI/EXEC pipelines, and WATCH aborting the transaction."""
+    with redisdb_inproc.pipeline() as pipeline:
+        pipeline.set("key", "1").incr("key").get("key")
+        assert pipeline.execute() == [True, 2, b"2"]
+    with redisdb_inproc.pipeline() as pipeline:
+        pipeline.watch("key")
+        redisdb_inproc.set("key", "changed")
+        pipeline.multi()
+        pipeline.set("key", "transaction")
+        with pytest.raises(WatchError):
+            pipeline.execute()
+    assert redisdb_inproc.get("key") == b"changed"
+
+
+def test_authentication(
+    redis_inproc_password: InProcessRedis, redisdb_inproc_password: Redis
+) -> None:
+    """Check that clients have to authenticate with the configured password."""
+    assert redisdb_inproc_password.ping()
+    with pytest.raises(AuthenticationError):
+        Redis(port=redis_inproc_password.port, password="wrong").ping()
+
+
+@pytest.mark.asyncio
+async def test_async_client(async_redisdb_inproc: AsyncRedis) -> None:
+    """Check that asyncio client fixture works with the in-process server."""
+    await async_redisdb_inproc.set("key", "value")
+    assert await async_redisdb_inproc.get("key") == b"value"
+
+
+class EchoBackend(DictBackend):
+    """Backend with an extra command."""
+
+    def cmd_shout(self, db: int, message: bytes) -> ReplyType:
+        """SHOUT message."""
+        if not message:
+            raise ErrorReply("ERR nothing to shout")
+        return message.upper()
+
+
+def test_pluggable_backend() -> None:
+    """Check that backend can be extended with the custom commands."""
+    with InProcessRedis(backend=EchoBackend()) as server:
+        client = Redis(port=server.port)
+        assert client.execute_command("SHOUT", "hello") == b"HELLO"
+        with pytest.raises(ResponseError, match="nothing to shout"):
+            client.execute_command("SHOUT", "")
+        with pytest.raises(ResponseError, match="unknown command"):
+            client.execute_command("WHISPER", "hello")
+        client.close()
+    assert not server.running()
+
+
+def test_keyspace_events_rejected(pytester: pytest.Pytester) -> None:
+    """Check that fixtures tracking keys with keyspace notifications reject in-process server."""
+    pytester.makeconftest("""
+        from pytest_redis import factories
+        from pytest_redis.plugin import *  # noqa: F403
+
+        redisdb_tracked = factories.redisdb("redis_inproc", cleanup="tracked")
+        redisdb_seeded = factories.seeded_redisdb("redis_inproc", loader=lambda client: None)
+        """)
+    pytester.makepyfile("""
+        def test_tracked(redisdb_tracked):
+            pass
+
+        def test_seeded(redisdb_seeded):
+            pass
+        """)
+    result = pytester.runpytest()
+    result.assert_outcomes(errors=2)
+    result.stdout.fnmatch_lines(
+        [
+            "*UsageError: tracked cleanup relies on keyspace notifications*",
+            "*UsageError: seeded_redisdb relies on keyspace notifications*",
+        ]
+    )
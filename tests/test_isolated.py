@@ -0,0 +1,120 @@
+"""Tests for function scoped, isolated redis servers."""
+
+import shutil
+import threading
+from pathlib import Path
+from tempfile import mkdtemp
+from typing import List, Set
+from unittest.mock import MagicMock
+
+import pytest
+import redis
+
+from pytest_redis.executor import RedisExecutor
+from pytest_redis.executor.standby import StandbyPool
+
+SOCKETS: Set[str] = set()
+
+
+@pytest.mark.parametrize("attempt", range(3))
+def test_isolated_server_per_test(redis_isolated: RedisExecutor, attempt: int) -> None:
+    """Check that every test gets its own, fresh redis server."""
+    assert redis_isolated.running()
+    assert redis_isolated.unixsocket not in SOCKETS
+    SOCKETS.add(redis_isolated.unixsocket)
+    client = redis.Redis(unix_socket_path=redis_isolated.unixsocket, decode_responses=True)
+    assert client.config_get("maxmemory-policy")["maxmemory-policy"] == "noeviction"
+    client.config_set("maxmemory-policy", "allkeys-lru")
+    client.close()
+
+
+def test_isolated_client(redisdb_isolated: redis.Redis) -> None:
+    """Check client fixture working on the isolated server."""
+    assert redisdb_isolated.dbsize() == 0
+    redisdb_isolated.set("test", "isolated")
+    assert redisdb_isolated.get("test") == b"isolated"
+
+
+@pytest.mark.parametrize("attempt", range(3))
+def test_recycled_server(redis_isolated_recycled: RedisExecutor, attempt: int) -> None:
+    """Check that recycled server comes back to its initial state."""
+    client = redis.Redis(unix_socket_path=redis_isolated_recycled.unixsocket, decode_responses=True)
+    assert client.dbsize() == 0
+    assert client.config_get("maxmemory-policy")["maxmemory-policy"] == "noeviction"
+    assert client.info("stats")["total_commands_processed"] < 10
+    client.set("test", "recycled")
+    client.config_set("maxmemory-policy", "allkeys-lru")
+    client.close()
+
+
+@pytest.mark.parametrize("attempt", range(3))
+def test_isolated_server_options(redis_isolated_maxmemory: RedisExecutor, attempt: int) -> None:
+    """Check that standby servers get started with the fixture's options."""
+    client = redis.Redis(
+        unix_socket_path=redis_isolated_maxmemory.unixsocket, decode_responses=True
+    )
+    assert client.config_get("maxmemory")["maxmemory"] == str(32 * 1024 * 1024)
+    assert client.config_get("maxmemory-policy")["maxmemory-policy"] == "allkeys-lru"
+    assert client.config_get("save")["save"] == ""
+    client.close()
+
+
+def test_standby_ports_selected_up_front(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Check that executors are created on the calling thread, on ports not yet taken."""
+    excluded: List[Set[int]] = []
+
+    def executor_factory(exclude_ports: Set[int]) -> RedisExecutor:
+        assert threading.current_thread() is threading.main_thread()
+        excluded.append(exclude_ports)
+        return MagicMock(spec=RedisExecutor, port=7000 + len(excluded))
+
+    monkeypatch.setattr(StandbyPool, "_client", staticmethod(lambda executor: MagicMock()))
+
+    pool = StandbyPool(executor_factory, size=2)
+    pool.acquire()
+    pool.close()
+    assert excluded == [set(), {7001}, {7001, 7002}]
+
+
+def test_standby_start_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Check that server failing to start gets replaced, rather than leaving the pool empty."""
+    executors: List[MagicMock] = []
+
+    def executor_factory(exclude_ports: Set[int]) -> RedisExecutor:
+        executor = MagicMock(spec=RedisExecutor, port=7000 + len(executors))
+        executor.start.side_effect = RuntimeError("server failed to start")
+        executors.append(executor)
+        return executor
+
+    pool = StandbyPool(executor_factory, size=1)
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            pool.acquire()
+    pool.close()
+    assert len(executors) == 3
+    assert not pool.executors
+
+
+def test_datadirs_removed(pytester: pytest.Pytester, redis_proc: RedisExecutor) -> None:
+    """Check that standby servers' directories created in the configured datadir get removed."""
+    # pytester's directory is too deep for the servers' unix socket paths
+    datadir = Path(mkdtemp(prefix="pytest-redis-data-"))
+    pytester.makeconftest(f"""
+        from pytest_redis import factories
+        from pytest_redis.plugin import *  # noqa: F403
+
+        redis_isolated = factories.redis_isolated_proc(datadir="{datadir}", pool_size=1)
+        """)
+    pytester.makepyfile("""
+        import pytest
+
+        @pytest.mark.parametrize("attempt", range(3))
+        def test_isolated(redis_isolated, attempt):
+            assert redis_isolated.running()
+        """)
+    try:
+        result = pytester.runpytest(f"--redis-exec={redis_proc.executable}")
+        result.assert_outcomes(passed=3)
+        assert not list(datadir.iterdir())
+    finally:
+        shutil.rmtree(datadir)
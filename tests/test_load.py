@@ -0,0 +1,68 @@
+"""Load generator tests."""
+
+import pytest
+from redis import Redis
+
+from pytest_redis.factories.load import LoadGenerator
+from pytest_redis.load import Workload, percentile
+
+
+def test_percentile() -> None:
+    """Check nearest rank percentiles."""
+    values = [float(value) for value in range(1, 101)]
+    assert percentile(values, 0.5) == 50.0
+    assert percentile(values, 0.99) == 99.0
+    assert percentile(values, 0.999) == 100.0
+    assert percentile([], 0.5) == 0.0
+
+
+def test_workload_validation() -> None:
+    """Check that unknown commands and non-positive sizes are rejected."""
+    with pytest.raises(ValueError, match="Unknown load commands: flushall"):
+        Workload(commands={"get": 1, "flushall": 1})
+    with pytest.raises(ValueError, match="positive"):
+        Workload(pipeline=0)
+
+
+def test_load(request: pytest.FixtureRequest, redis_load: LoadGenerator, redisdb: Redis) -> None:
+    """Check that load is driven with the command mix, and results are reported."""
+    result = redis_load.run(
+        commands={"get": 3, "set": 1, "hset": 1},
+        keyspace=100,
+        value_size=(16, 128),
+        requests=2000,
+        pipeline=10,
+    )
+    assert result["commands"] == 2000
+    assert result["round_trips"] == 200
+    assert result["errors"] == 0
+    assert result["clients"] == 4
+    assert result["throughput"] > 0
+    assert 0 < result["latency"]["p50"] <= result["latency"]["p99"] <= result["latency"]["max"]
+    assert redisdb.dbsize() == 200
+
+
+def test_load_cleaned_up(redisdb: Redis) -> None:
+    """Check that keys created by the previous test's load are removed."""
+    assert not redisdb.keys("pytest-redis-load:*")
+
+
+def test_load_asyncio(redis_load_asyncio: LoadGenerator) -> None:
+    """Check load driven from the asyncio clients, for the given duration."""
+    result = redis_load_asyncio.run(commands={"incr": 1}, duration=0.2)
+    assert result["concurrency"] == "asyncio"
+    assert result["clients"] == 8
+    assert result["commands"] > 0
+    assert result["seconds"] >= 0.2
+
+
+def test_load_processes(redis_load: LoadGenerator) -> None:
+    """Check load driven from separate processes."""
+    result = redis_load.run(
+        Workload(commands={"sadd": 1, "sismember": 1}, requests=200),
+        clients=2,
+        concurrency="processes",
+    )
+    assert result["concurrency"] == "processes"
+    assert result["commands"] == 200
+    assert result["errors"] == 0
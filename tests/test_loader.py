@@ -0,0 +1,92 @@
+"""Tests for the streaming bulk loader."""
+
+import io
+from pathlib import Path
+from typing import Iterator, List
+
+import pytest
+from redis import Redis
+from redis.exceptions import DataError, ResponseError
+
+from pytest_redis.loader import MAX_BATCH_BYTES, bulk_load, iter_batches
+from pytest_redis.resp import iter_resp, resp_command
+
+
+def generate_commands(count: int) -> Iterator[List[str]]:
+    """Generate SET commands."""
+    for number in range(count):
+        yield ["SET", f"key:{number}", f"value:{number}"]
+
+
+def test_bulk_load_iterable(redisdb: Redis) -> None:
+    """Load commands from generator, in several batches."""
+    stats = bulk_load(redisdb, generate_commands(25000), batch=10000)
+    assert stats["commands"] == 25000
+    assert stats["errors"] == 0
+    assert stats["commands_per_second"] > 0
+    assert redisdb.dbsize() == 25000
+    assert redisdb.get("key:24999") == b"value:24999"
+
+
+@pytest.mark.parametrize(
+    "filename, content",
+    (
+        ("data.jsonl", '["SET", "key", "value"]\n["HSET", "hash", "field", 1]\n\n'),
+        ("data.csv", "SET,key,value\nHSET,hash,field,1\n"),
+        (
+            "data.resp",
+            "*3\r\n$3\r\nSET\r\n$3\r\nkey\r\n$5\r\nvalue\r\n"
+            "*4\r\n$4\r\nHSET\r\n$4\r\nhash\r\n$5\r\nfield\r\n$1\r\n1\r\n",
+        ),
+    ),
+)
+def test_bulk_load_file(redisdb: Redis, tmp_path: Path, filename: str, content: str) -> None:
+    """Load commands from files in all the supported formats."""
+    path = tmp_path / filename
+    path.write_bytes(content.encode())
+    stats = bulk_load(redisdb, path)
+    assert stats["commands"] == 2
+    assert redisdb.get("key") == b"value"
+    assert redisdb.hgetall("hash") == {b"field": b"1"}
+
+
+def test_bulk_load_error(redisdb: Redis) -> None:
+    """Check that error replies are counted, and the first one raised after loading."""
+    commands = [["SET", "key", "value"], ["LPUSH", "key", "element"], ["SET", "other", "value"]]
+    with pytest.raises(ResponseError, match="Command #1"):
+        bulk_load(redisdb, commands)
+    assert redisdb.get("other") == b"value"
+
+    stats = bulk_load(redisdb, commands, raise_on_error=False)
+    assert stats["errors"] == 1
+    assert stats["commands"] == 3
+
+
+def test_bulk_load_unknown_format(redisdb: Redis, tmp_path: Path) -> None:
+    """Check that file format has to be known."""
+    with pytest.raises(ValueError):
+        bulk_load(redisdb, tmp_path / "data.txt")
+    with pytest.raises(ValueError):
+        bulk_load(redisdb, io.StringIO("SET,key,value\n"))
+
+
+def test_iter_resp() -> None:
+    """Check reading back encoded commands."""
+    stream = io.BytesIO(resp_command("SET", "key", b"\r\nvalue") + resp_command("DEL", "key"))
+    assert list(iter_resp(stream)) == [[b"SET", b"key", b"\r\nvalue"], [b"DEL", b"key"]]
+
+
+def test_bulk_load_large_values(redisdb: Redis) -> None:
+    """Check that batches are cut short once they get large, reading replies in between."""
+    value = "x" * (MAX_BATCH_BYTES // 4)
+    commands = [["SET", f"key:{number}", value] for number in range(10)]
+    assert [count for count, _ in iter_batches(commands, 10000)] == [4, 4, 2]
+    stats = bulk_load(redisdb, commands)
+    assert stats["commands"] == 10
+    assert redisdb.get("key:9") == value.encode()
+
+
+def test_resp_command_rejects_bool() -> None:
+    """Check that booleans aren't sent as True or False strings."""
+    with pytest.raises(DataError):
+        resp_command("SET", "key", True)
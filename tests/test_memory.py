@@ -0,0 +1,63 @@
+"""Tests for memory limits and memory budgets."""
+
+import pytest
+import redis
+
+from pytest_redis.executor import RedisExecutor
+from pytest_redis.memory import parse_memory
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (1024, 1024),
+        ("100", 100),
+        ("10k", 10000),
+        ("10kb", 10240),
+        ("10MB", 10 * 1024 * 1024),
+        ("1g", 1000**3),
+    ],
+)
+def test_parse_memory(value: str, expected: int) -> None:
+    """Check that memory sizes are understood the way redis.conf does."""
+    assert parse_memory(value) == expected
+
+
+def test_parse_memory_unknown_unit() -> None:
+    """Check that unknown unit is refused."""
+    with pytest.raises(ValueError):
+        parse_memory("10 apples")
+
+
+def test_maxmemory(redis_proc_maxmemory: RedisExecutor) -> None:
+    """Check that memory limit and eviction policy get configured."""
+    client = redis.Redis(unix_socket_path=redis_proc_maxmemory.unixsocket, decode_responses=True)
+    assert client.config_get("maxmemory")["maxmemory"] == str(64 * 1024 * 1024)
+    assert client.config_get("maxmemory-policy")["maxmemory-policy"] == "allkeys-lru"
+
+
+def test_memory_marker(pytester: pytest.Pytester, redis_proc: RedisExecutor) -> None:
+    """Check that tests exceeding their memory budget fail, and get cleaned up all the same."""
+    pytester.makeconftest("""
+        from pytest_redis.plugin import *  # noqa: F403
+        """)
+    pytester.makepyfile("""
+        import pytest
+
+        @pytest.mark.redis_memory(max_delta="100kb")
+        def test_bloated(redisdb):
+            redisdb.set("bloated", "x" * 1024 * 1024)
+
+        @pytest.mark.redis_memory(max_delta="100kb")
+        def test_lean(redisdb):
+            assert redisdb.dbsize() == 0
+            redisdb.set("lean", "x")
+        """)
+    result = pytester.runpytest(f"--redis-exec={redis_proc.executable}")
+    result.assert_outcomes(passed=1, failed=1)
+    result.stdout.fnmatch_lines(
+        [
+            "*test_bloated exceeded its memory budget: * bytes of redis memory used*102400 bytes*",
+            "FAILED *::test_bloated*",
+        ]
+    )
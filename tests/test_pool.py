@@ -0,0 +1,95 @@
+"""Tests for the servers selected with the redis marker."""
+
+from pathlib import Path
+
+import pytest
+from pytest import FixtureRequest, Pytester
+from redis import Redis
+
+from pytest_redis.config import get_config
+from pytest_redis.executor import RedisExecutor
+from pytest_redis.pool import profile_key
+
+
+def test_profile_key() -> None:
+    """Check that servers are keyed by the options, regardless of their order."""
+    assert profile_key({"maxmemory": "64mb", "io_threads": 2}) == profile_key(
+        {"io_threads": 2, "maxmemory": "64mb"}
+    )
+    assert profile_key({"maxmemory": "64mb"}) != profile_key({"maxmemory": "32mb"})
+    assert profile_key({}) != profile_key({"maxmemory": "64mb"})
+
+
+@pytest.mark.redis(maxmemory="64mb", io_threads=2, lazyfree_lazy_user_del=True)
+def test_marker_server_options(
+    redisdb: Redis, redis_proc: RedisExecutor, tmp_path_factory: pytest.TempPathFactory
+) -> None:
+    """Check that marked test runs against the server started with the marker's options."""
+    assert redisdb.config_get("maxmemory") == {"maxmemory": str(64 * 1024 * 1024)}
+    assert redisdb.config_get("io-threads") == {"io-threads": "2"}
+    assert redisdb.config_get("lazyfree-lazy-user-del") == {"lazyfree-lazy-user-del": "yes"}
+    assert redisdb.connection_pool.connection_kwargs["path"] != redis_proc.unixsocket
+    datadir = Path(redisdb.connection_pool.connection_kwargs["path"]).parent
+    assert datadir.parent == tmp_path_factory.getbasetemp()
+    assert datadir.name.startswith("pytest-redis-pool-")
+
+
+@pytest.mark.redis
+def test_bare_marker(redisdb: Redis, redis_proc: RedisExecutor) -> None:
+    """Check that test with a bare marker runs against its process fixture's server."""
+    assert redisdb.connection_pool.connection_kwargs["path"] == redis_proc.unixsocket
+
+
+def test_marker_reserved_options(request: FixtureRequest, pytester: Pytester) -> None:
+    """Check that marker can't set redis-server options the executor relies on."""
+    pytester.makeconftest("from pytest_redis.plugin import *  # noqa: F403")
+    pytester.makepyfile("""
+        import pytest
+
+        @pytest.mark.redis(port=6390)
+        def test_port(redisdb):
+            pass
+        """)
+    result = pytester.runpytest(f"--redis-exec={get_config(request)['exec']}")
+    assert result.ret == pytest.ExitCode.USAGE_ERROR
+    result.stderr.fnmatch_lines(["*redis marker can't set port*"])
+
+
+def test_marker_server_pool(request: FixtureRequest, pytester: Pytester) -> None:
+    """Check that tests with the same options share the server, and run one after another."""
+    pytester.makeconftest("from pytest_redis.plugin import *  # noqa: F403")
+    pytester.makepyfile("""
+        import os
+
+        import pytest
+
+        sockets = []
+
+        @pytest.mark.redis
+        def test_tagged(redisdb):
+            assert redisdb.config_get("maxmemory") == {"maxmemory": "0"}
+
+        @pytest.mark.redis(maxmemory="32mb")
+        def test_first(redisdb):
+            sockets.append(redisdb.connection_pool.connection_kwargs["path"])
+            redisdb.set("key", "value")
+
+        def test_unmarked(redisdb):
+            assert redisdb.config_get("maxmemory") == {"maxmemory": "0"}
+            assert not os.path.exists(sockets[0])
+
+        @pytest.mark.redis(maxmemory="32mb")
+        def test_second(redisdb):
+            assert redisdb.connection_pool.connection_kwargs["path"] == sockets[0]
+            assert redisdb.get("key") is None
+        """)
+    result = pytester.runpytest("-v", f"--redis-exec={get_config(request)['exec']}")
+    result.assert_outcomes(passed=4)
+    result.stdout.fnmatch_lines(
+        [
+            "*test_tagged PASSED*",
+            "*test_first PASSED*",
+            "*test_second PASSED*",
+            "*test_unmarked*",
+        ]
+    )
@@ -0,0 +1,54 @@
+"""Server-side key space generator tests."""
+
+import pytest
+from packaging.version import parse
+from redis import Redis
+
+from pytest_redis.executor import RedisExecutor
+from pytest_redis.populate import POPULATE_SCRIPT, redis_populate
+
+
+def test_populate_strings(redis_proc: RedisExecutor, redisdb: Redis) -> None:
+    """Check that strings are generated with DEBUG POPULATE, and the script generates the same."""
+    stats = redis_populate(redisdb, 1000, value_size=10)
+    # DEBUG is disabled by default since redis 7
+    assert stats["method"] == ("debug" if redis_proc.version < parse("7") else "script")
+    assert stats["created"] == 1000
+    assert redisdb.get("key:7") == b"value:7\x00\x00\x00"
+    script = redisdb.register_script(POPULATE_SCRIPT)
+    assert script(args=["string", "copy", 0, 999, 10, 1, 0]) == 1000
+    assert redisdb.mget("key:0", "key:999") == redisdb.mget("copy:0", "copy:999")
+
+
+@pytest.mark.parametrize(
+    "key_type, length_command",
+    [("hash", "HLEN"), ("set", "SCARD"), ("zset", "ZCARD"), ("list", "LLEN"), ("stream", "XLEN")],
+)
+def test_populate_collections(redisdb: Redis, key_type: str, length_command: str) -> None:
+    """Check that collections get generated with the given cardinality, in batches."""
+    stats = redis_populate(
+        redisdb, 100, key_type, prefix=key_type, cardinality=1500, value_size=32, batch=3000
+    )
+    assert stats["method"] == "script"
+    assert stats["created"] == 100
+    assert redisdb.dbsize() == 100
+    assert redisdb.type(f"{key_type}:99") == key_type.encode()  # type: ignore[no-untyped-call]
+    assert redisdb.execute_command(length_command, f"{key_type}:42") == 1500
+
+
+def test_populate_seeded_and_idempotent(redisdb: Redis) -> None:
+    """Check that population is deterministic, and only missing keys get generated again."""
+    redis_populate(redisdb, 50, "zset", seed=7)
+    first_run = redisdb.zrange("key:3", 0, -1, withscores=True)
+    redisdb.delete("key:3", "key:4")
+    stats = redis_populate(redisdb, 50, "zset", seed=7)
+    assert stats["created"] == 2
+    assert redisdb.zrange("key:3", 0, -1, withscores=True) == first_run
+    redis_populate(redisdb, 1, "zset", prefix="other", seed=8)
+    assert redisdb.zrange("other:0", 0, -1) != redisdb.zrange("key:0", 0, -1)
+
+
+def test_populate_validation(redisdb: Redis) -> None:
+    """Check that unknown key types are rejected."""
+    with pytest.raises(ValueError, match="Unknown redis populate key type: json"):
+        redis_populate(redisdb, 10, "json")
@@ -0,0 +1,27 @@
+"""Tests for redis server profiles."""
+
+from pathlib import Path
+
+import pytest
+import redis
+
+from pytest_redis.executor import RedisExecutor
+from pytest_redis.factories import redis_proc
+from pytest_redis.factories.proc import SHM_DIR
+
+
+def test_ephemeral_profile(redis_proc_ephemeral: RedisExecutor) -> None:
+    """Check that ephemeral server has persistence disabled, and keeps its files in memory."""
+    if SHM_DIR.is_dir():
+        assert Path(redis_proc_ephemeral.unixsocket).parent.parent == SHM_DIR
+    client = redis.Redis(unix_socket_path=redis_proc_ephemeral.unixsocket, decode_responses=True)
+    assert client.config_get("save") == {"save": ""}
+    assert client.config_get("appendonly") == {"appendonly": "no"}
+    assert client.config_get("appendfsync") == {"appendfsync": "no"}
+    client.close()
+
+
+def test_unknown_profile() -> None:
+    """Check that unknown profile is refused."""
+    with pytest.raises(ValueError, match="Unknown redis server profile"):
+        redis_proc(profile="fast")
@@ -0,0 +1,64 @@
+"""Tests for client-side command profiling."""
+
+import json
+
+import pytest
+import redis
+
+from pytest_redis.executor import RedisExecutor
+from pytest_redis.profiling import CommandProfile, ProfiledRedis
+
+
+def test_profiled_client(redis_proc: RedisExecutor) -> None:
+    """Check that pipelines count as a single round trip."""
+    profile = CommandProfile()
+    client = ProfiledRedis(unix_socket_path=redis_proc.unixsocket, profile=profile)
+    client.set("key", "value")
+    client.get("key")
+    pipeline = client.pipeline()
+    for number in range(5):
+        pipeline.incr(f"counter:{number}")
+    pipeline.execute()
+    client.flushall()
+
+    result = profile.as_dict()
+    assert result["commands"] == 8
+    assert result["round_trips"] == 4
+    assert sum(result["latency"]["INCRBY"].values()) == 5
+    assert set(result["latency"]) == {"SET", "GET", "INCRBY", "FLUSHALL"}
+
+
+def test_profile_option(pytester: pytest.Pytester, redis_proc: RedisExecutor) -> None:
+    """Check that tests' profiles get reported in the terminal summary and JSON file."""
+    pytester.makeconftest("""
+        from pytest_redis.plugin import *  # noqa: F403
+        """)
+    pytester.makepyfile("""
+        def test_n_plus_one(redisdb):
+            for number in range(10):
+                redisdb.get(f"item:{number}")
+
+        def test_pipelined(redisdb):
+            pipeline = redisdb.pipeline()
+            for number in range(10):
+                pipeline.get(f"item:{number}")
+            pipeline.execute()
+        """)
+    result = pytester.runpytest(f"--redis-exec={redis_proc.executable}", "--redis-profile")
+    result.assert_outcomes(passed=2)
+    result.stdout.fnmatch_lines(
+        [
+            "*redis client profile*",
+            "*10 round trips*10 commands (mostly GET)*test_n_plus_one*",
+            "*1 round trips*10 commands (mostly GET)*test_pipelined*",
+        ]
+    )
+    with open(pytester.path / "redis-profile.json", encoding="utf-8") as json_file:
+        profiles = json.load(json_file)
+    assert profiles["test_profile_option.py::test_pipelined"]["round_trips"] == 1
+    assert profiles["test_profile_option.py::test_n_plus_one"]["commands"] == 10
+
+
+def test_profile_disabled(redisdb: redis.Redis) -> None:
+    """Check that client is not profiled by default."""
+    assert not isinstance(redisdb, ProfiledRedis)
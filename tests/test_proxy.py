@@ -0,0 +1,107 @@
+"""Latency-injecting proxy tests."""
+
+import time
+
+import pytest
+from redis import Redis
+from redis.exceptions import ConnectionError, TimeoutError
+
+from pytest_redis.executor import RedisExecutor, RedisProxy
+
+
+def test_proxy_stats(redisdb_proxy: Redis, redis_proxy: RedisProxy) -> None:
+    """Check that traffic passes through the proxy, and gets counted."""
+    redisdb_proxy.ping()
+    redis_proxy.reset_stats()
+    redisdb_proxy.set("key", "value")
+    assert redisdb_proxy.get("key") == b"value"
+    with redisdb_proxy.pipeline(transaction=False) as pipeline:
+        for number in range(100):
+            pipeline.incr(f"counter:{number}")
+        pipeline.execute()
+    stats = redis_proxy.stats()
+    assert stats["round_trips"] == 3
+    assert stats["bytes_sent"] > 100 * len(b"*2\r\n$4\r\nINCR\r\n")
+    assert stats["bytes_received"] >= len(b"+OK\r\n$5\r\nvalue\r\n") + 100 * len(b":1\r\n")
+    assert stats["resets"] == 0
+
+
+def test_proxy_latency(redis_proc: RedisExecutor) -> None:
+    """Check that each round trip pays the latency, and pipeline pays it once."""
+    with RedisProxy(redis_proc, latency=0.05, jitter=0.01, seed=1) as proxy:
+        client = Redis(host=proxy.host, port=proxy.port)
+        client.ping()
+        started_at = time.monotonic()
+        for _ in range(3):
+            client.ping()
+        assert time.monotonic() - started_at >= 3 * 2 * 0.04
+        started_at = time.monotonic()
+        with client.pipeline(transaction=False) as pipeline:
+            for _ in range(50):
+                pipeline.ping()
+            pipeline.execute()
+        assert time.monotonic() - started_at < 10 * 2 * 0.06
+        client.close()
+
+
+def test_proxy_bandwidth(redis_proc: RedisExecutor) -> None:
+    """Check that throughput gets limited to the bandwidth."""
+    with RedisProxy(redis_proc, bandwidth=100_000) as proxy:
+        client = Redis(host=proxy.host, port=proxy.port)
+        client.ping()
+        started_at = time.monotonic()
+        client.set("proxy:large", b"x" * 30_000)
+        assert time.monotonic() - started_at >= 0.25
+        client.delete("proxy:large")
+        client.close()
+
+
+def test_proxy_client_timeout(redis_proc: RedisExecutor) -> None:
+    """Check that client times out once latency exceeds its socket timeout."""
+    with RedisProxy(redis_proc) as proxy:
+        client = Redis(host=proxy.host, port=proxy.port, socket_timeout=0.1)
+        assert client.ping()
+        proxy.latency = 0.2
+        with pytest.raises(TimeoutError):
+            client.ping()
+        proxy.latency = 0.0
+        assert client.ping()
+        client.close()
+
+
+def test_proxy_reset_connections(redis_proc: RedisExecutor) -> None:
+    """Check that connections reset fail the commands in flight, and the client reconnects."""
+    with RedisProxy(redis_proc) as proxy:
+        client = Redis(host=proxy.host, port=proxy.port)
+        assert client.ping()
+        assert proxy.reset_connections() == 1
+        # connection pool notices the idle connection got reset, and reconnects
+        assert client.ping()
+        assert proxy.stats()["connections"] == 2
+        proxy.reset_rate = 1.0
+        with pytest.raises(ConnectionError):
+            client.ping()
+        assert proxy.stats()["resets"] == 2
+        assert proxy.stats()["connections"] == 2
+        client.close()
+
+
+def test_proxy_unixsocket(redisdb_proxy_unix: Redis, redis_proxy_unix: RedisProxy) -> None:
+    """Check proxy listening on the unix socket, in front of the server with password."""
+    assert redis_proxy_unix.unixsocket
+    assert redisdb_proxy_unix.connection_pool.connection_kwargs["path"] == (
+        redis_proxy_unix.unixsocket
+    )
+    redisdb_proxy_unix.set("key", "value")
+    assert redisdb_proxy_unix.get("key") == b"value"
+    assert redis_proxy_unix.stats()["round_trips"] >= 2
+
+
+def test_proxy_fixture_reset_rate(redis_proxy_resets: RedisProxy) -> None:
+    """Check that proxy fixture resets the connections at the rate given to the factory."""
+    assert redis_proxy_resets.reset_rate == 1.0
+    client = Redis(host=redis_proxy_resets.host, port=redis_proxy_resets.port)
+    with pytest.raises(ConnectionError):
+        client.ping()
+    assert redis_proxy_resets.stats()["resets"] == 1
+    client.close()
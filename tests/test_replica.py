@@ -0,0 +1,118 @@
+"""Tests for primary/replica fixtures."""
+
+from typing import List
+
+import pytest
+import redis
+from port_for import get_port
+from redis.exceptions import ReadOnlyError
+
+from pytest_redis.executor import RedisExecutor
+from pytest_redis.factories import proc
+from pytest_redis.replication import replication_lag, replication_offset, wait_for_replication
+
+
+def test_replicas(redis_proc_primary: RedisExecutor, redis_replicas: List[RedisExecutor]) -> None:
+    """Check that replicas are started, synchronised with the primary."""
+    assert len(redis_replicas) == 2
+    for replica in redis_replicas:
+        assert replica.running()
+        info = redis.Redis(unix_socket_path=replica.unixsocket).info("replication")
+        assert info["role"] == "slave"
+        assert info["master_port"] == redis_proc_primary.port
+        assert info["master_link_status"] == "up"
+
+
+def test_replicated_data(
+    redis_proc_primary: RedisExecutor,
+    redis_replicas: List[RedisExecutor],
+    redisdb_primary: redis.Redis,
+) -> None:
+    """Check that writes to the primary reach the replicas, which refuse writes."""
+    redisdb_primary.set("replicated", "value")
+    assert wait_for_replication(redis_proc_primary, redis_replicas) >= 0
+    for replica in redis_replicas:
+        assert replication_lag(redis_proc_primary, replica) == 0
+        assert replication_offset(replica) == replication_offset(redis_proc_primary)
+        client = redis.Redis(unix_socket_path=replica.unixsocket)
+        assert client.get("replicated") == b"value"
+        with pytest.raises(ReadOnlyError):
+            client.set("replicated", "other")
+
+
+def test_replicas_start_failure(
+    pytester: pytest.Pytester, redis_proc: RedisExecutor, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Check that replicas which did start get stopped, once any other fails to start."""
+    # restore the start method the in-process run's conftest replaces
+    monkeypatch.setattr(RedisExecutor, "start", RedisExecutor.start)
+    pytester.makeconftest("""
+        import threading
+
+        from pytest_redis import factories
+        from pytest_redis.executor import RedisExecutor
+        from pytest_redis.plugin import *  # noqa: F403
+
+        redis_primary = factories.redis_proc()
+        redis_replicas = factories.redis_replica_proc("redis_primary", count=2)
+        started = []
+        original_start = RedisExecutor.start
+        lock = threading.Lock()
+
+        def start(self):
+            with lock:
+                if self.replicaof and started:
+                    raise RuntimeError("replica failed to start")
+                original_start(self)
+                if self.replicaof:
+                    started.append(self)
+                return self
+
+        RedisExecutor.start = start
+        """)
+    pytester.makepyfile("""
+        import pytest
+
+        from conftest import started
+
+        def test_failed_replicas(request):
+            with pytest.raises(RuntimeError):
+                request.getfixturevalue("redis_replicas")
+            assert len(started) == 1
+            assert not started[0].running()
+        """)
+    result = pytester.runpytest(f"--redis-exec={redis_proc.executable}")
+    result.assert_outcomes(passed=1)
+
+
+def test_replicas_ports_distinct(
+    pytester: pytest.Pytester, redis_proc: RedisExecutor, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Check that replicas don't get the same port, even though none listens when it's selected."""
+    # restore the port selection the in-process run's conftest replaces
+    monkeypatch.setattr(proc, "get_port", get_port)
+    pytester.makeconftest("""
+        import port_for
+
+        from pytest_redis import factories
+        from pytest_redis.factories import proc
+        from pytest_redis.plugin import *  # noqa: F403
+
+        candidates = sorted(port_for.select_random() for _ in range(3))
+
+        def get_port(ports, exclude_ports=None):
+            # lowest free candidate, the same one for servers selecting it before either listens
+            available = set(filter(port_for.is_available, candidates))
+            return min(available - set(exclude_ports or ()))
+
+        proc.get_port = get_port
+        redis_primary = factories.redis_proc()
+        redis_replicas = factories.redis_replica_proc("redis_primary", count=2)
+        """)
+    pytester.makepyfile("""
+        def test_replicas(redis_replicas):
+            assert len({replica.port for replica in redis_replicas}) == 2
+            assert all(replica.running() for replica in redis_replicas)
+        """)
+    result = pytester.runpytest(f"--redis-exec={redis_proc.executable}")
+    result.assert_outcomes(passed=1)
@@ -0,0 +1,103 @@
+"""Tests for redis-server reused between test sessions."""
+
+import os
+import stat
+import time
+from pathlib import Path
+
+import pytest
+
+from pytest_redis.exception import RedisMisconfigured
+from pytest_redis.executor import RedisExecutor
+from pytest_redis.executor.reuse import pid_alive, reuse_datadir
+
+REUSED_TEST = """
+    from pathlib import Path
+
+    def test_reused(redis_proc, redisdb):
+        assert redisdb.dbsize() == 0
+        assert redisdb.config_get("maxmemory-policy") == {"maxmemory-policy": "noeviction"}
+        redisdb.set("left", "behind")
+        redisdb.config_set("maxmemory-policy", "allkeys-lru")
+        with open("pids.txt", "a") as pids:
+            pids.write(f"{redisdb.info()['process_id']}\\n")
+        with open("commands.txt", "a") as commands:
+            commands.write(f"{redisdb.info('stats')['total_commands_processed']}\\n")
+        assert Path(redis_proc.unixsocket).exists()
+    """
+
+
+def run_session(pytester: pytest.Pytester, executable: str, *args: str) -> None:
+    """Run test session with reused server."""
+    result = pytester.runpytest(f"--redis-exec={executable}", "--redis-reuse", *args)
+    result.assert_outcomes(passed=1)
+
+
+def test_reuse(pytester: pytest.Pytester, redis_proc: RedisExecutor) -> None:
+    """Check that server is reused while config holds, and shut down once idle."""
+    pytester.makeconftest("""
+        from pytest_redis.plugin import *  # noqa: F403
+        """)
+    pytester.makepyfile(REUSED_TEST)
+    run_session(pytester, redis_proc.executable)
+    run_session(pytester, redis_proc.executable)
+    # changed config starts a new server, which shuts down quickly once idle
+    run_session(
+        pytester, redis_proc.executable, "--redis-db-count=4", "--redis-reuse-idle-timeout=1"
+    )
+
+    first, second, third = [
+        int(pid) for pid in Path(pytester.path / "pids.txt").read_text().split()
+    ]
+    assert first == second
+    # stats are reset on reattaching
+    first_commands, second_commands, _ = [
+        int(count) for count in Path(pytester.path / "commands.txt").read_text().split()
+    ]
+    assert second_commands <= first_commands
+    assert third != first
+    assert not pid_alive(first)
+
+    deadline = time.monotonic() + 10
+    while pid_alive(third) and time.monotonic() < deadline:
+        time.sleep(0.1)
+    assert not pid_alive(third)
+
+
+def test_reuse_datadir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Check that reused servers' data is kept in the user's private directory."""
+    monkeypatch.setattr("pytest_redis.executor.reuse.gettempdir", lambda: str(tmp_path))
+    datadir = reuse_datadir(tmp_path / "project", "redis_proc")
+    assert datadir == reuse_datadir(tmp_path / "project", "redis_proc")
+    assert datadir != reuse_datadir(tmp_path / "other", "redis_proc")
+    user_dir = datadir.parent
+    assert user_dir.name == f"pytest-redis-of-{os.getuid()}"
+    assert stat.S_IMODE(user_dir.stat().st_mode) == 0o700
+
+    user_dir.chmod(0o777)
+    with pytest.raises(RedisMisconfigured):
+        reuse_datadir(tmp_path / "project", "redis_proc")
+
+
+def test_reuse_password_not_cached(pytester: pytest.Pytester, redis_proc: RedisExecutor) -> None:
+    """Check that server's password is kept out of pytest's cache, and it's still reattached to."""
+    pytester.makeconftest("""
+        from pytest_redis.plugin import *  # noqa: F403
+        """)
+    pytester.makepyfile(REUSED_TEST)
+    args = ("--redis-password=secretpassword", "--redis-reuse-idle-timeout=1")
+    run_session(pytester, redis_proc.executable, *args)
+    run_session(pytester, redis_proc.executable, *args)
+
+    first, second = [int(pid) for pid in Path(pytester.path / "pids.txt").read_text().split()]
+    assert first == second
+    cached = (
+        pytester.path / ".pytest_cache" / "v" / "pytest-redis" / "reuse" / "redis_proc"
+    ).read_text()
+    assert "requirepass" not in cached
+    assert "secretpassword" not in cached
+
+    deadline = time.monotonic() + 10
+    while pid_alive(first) and time.monotonic() < deadline:
+        time.sleep(0.1)
+    assert not pid_alive(first)
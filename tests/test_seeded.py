@@ -0,0 +1,105 @@
+"""Tests for the seeded client fixture."""
+
+from pathlib import Path
+
+import pytest
+from redis import ConnectionPool, Redis
+
+from pytest_redis.executor import RedisExecutor
+
+
+@pytest.mark.parametrize("attempt", range(3))
+def test_seed_restored(redisdb_seeded: Redis, attempt: int) -> None:
+    """Check that every test sees the same seed dataset, whatever previous one did."""
+    assert redisdb_seeded.dbsize() == 1001
+    assert redisdb_seeded.get("seed:1") == b"1"
+    assert redisdb_seeded.get("seed:2") == b"2"
+    assert redisdb_seeded.hgetall("seed:hash") == {b"field": b"value"}
+    assert not redisdb_seeded.exists("not-seeded")
+
+    redisdb_seeded.set("seed:1", "changed")
+    redisdb_seeded.delete("seed:2")
+    redisdb_seeded.hset("seed:hash", "other", "value")
+    redisdb_seeded.set("not-seeded", "test")
+
+
+@pytest.mark.parametrize("attempt", range(2))
+def test_seed_restored_after_flush(redisdb_seeded: Redis, attempt: int) -> None:
+    """Check that seed gets restored whole after database was flushed."""
+    assert redisdb_seeded.dbsize() == 1001
+    redisdb_seeded.flushdb()
+
+
+@pytest.mark.parametrize("attempt", range(2))
+def test_seed_restored_after_swap(redisdb_seeded: Redis, attempt: int) -> None:
+    """Check that seed gets restored after database was swapped with one of the same size."""
+    assert redisdb_seeded.dbsize() == 1001
+    assert redisdb_seeded.get("seed:1") == b"1"
+    pool = redisdb_seeded.connection_pool
+    other_pool = ConnectionPool(
+        connection_class=pool.connection_class, **{**pool.connection_kwargs, "db": 2}
+    )
+    with Redis(connection_pool=other_pool) as other:
+        other.mset({f"other:{number}": number for number in range(1001)})
+        redisdb_seeded.swapdb(pool.connection_kwargs["db"], 2)
+        other.unlink(*other.keys())
+
+
+def test_seed_from_rdb(
+    pytester: pytest.Pytester, redis_proc: RedisExecutor, redisdb: Redis
+) -> None:
+    """Check seeding with the data server started with, loaded from rdb file."""
+    redisdb.mset({"rdb:1": "1", "rdb:2": "2"})
+    redisdb.save()
+    rdb = Path(redis_proc.unixsocket).parent / redis_proc.dbfilename
+
+    pytester.makeconftest(f"""
+        from pytest_redis import factories
+        from pytest_redis.plugin import *  # noqa: F403
+
+        redis_rdb = factories.redis_proc(rdb={str(rdb)!r})
+        redisdb_rdb = factories.seeded_redisdb("redis_rdb")
+        """)
+    pytester.makepyfile("""
+        import pytest
+
+        @pytest.mark.parametrize("attempt", range(2))
+        def test_rdb_seed(redisdb_rdb, attempt):
+            assert redisdb_rdb.mget("rdb:1", "rdb:2") == [b"1", b"2"]
+            redisdb_rdb.set("rdb:1", "changed")
+            redisdb_rdb.delete("rdb:2")
+        """)
+    result = pytester.runpytest(f"--redis-exec={redis_proc.executable}")
+    result.assert_outcomes(passed=2)
+
+
+def test_seed_kept_from_flushall(pytester: pytest.Pytester, redis_proc: RedisExecutor) -> None:
+    """Check that other client fixtures don't remove the pristine copy with default cleanup."""
+    pytester.makeconftest("""
+        from pytest_redis import factories
+        from pytest_redis.plugin import *  # noqa: F403
+
+        loads = []
+
+        def load_seed(client):
+            loads.append(client)
+            client.set("seed", "value")
+
+        redis_seed = factories.redis_proc()
+        redisdb_seeded = factories.seeded_redisdb("redis_seed", loader=load_seed)
+        redisdb_plain = factories.redisdb("redis_seed", dbnum=1)
+        """)
+    pytester.makepyfile("""
+        import pytest
+
+        from conftest import loads
+
+        @pytest.mark.parametrize("attempt", range(3))
+        def test_seeded_and_plain(redisdb_seeded, redisdb_plain, attempt):
+            assert redisdb_seeded.get("seed") == b"value"
+            assert redisdb_plain.dbsize() == 0
+            redisdb_plain.set("plain", "value")
+            assert len(loads) == 1
+        """)
+    result = pytester.runpytest(f"--redis-exec={redis_proc.executable}")
+    result.assert_outcomes(passed=3)
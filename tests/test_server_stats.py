@@ -0,0 +1,102 @@
+"""Tests for server-side per-test stats."""
+
+import pytest
+import redis
+
+from pytest_redis.executor import RedisExecutor
+from pytest_redis.server_stats import ServerSnapshot
+
+
+def test_server_snapshot(redis_isolated: RedisExecutor) -> None:
+    """Check that snapshot diff holds only commands sent since the snapshot was taken."""
+    client = redis.Redis(unix_socket_path=redis_isolated.unixsocket)
+    client.config_set("slowlog-log-slower-than", 0)
+    client.set("before", "value")
+    snapshot = ServerSnapshot(client)
+    for number in range(3):
+        client.set(f"key:{number}", number)
+    client.get("key:0")
+    client.get("missing")
+
+    server_stats = snapshot.diff()
+    assert set(server_stats["commands"]) == {"set", "get"}
+    assert server_stats["commands"]["set"]["calls"] == 3
+    assert server_stats["usec"] == sum(stats["usec"] for stats in server_stats["commands"].values())
+    assert server_stats["stats"]["keyspace_hits"] == 1
+    assert server_stats["stats"]["keyspace_misses"] == 1
+    assert [entry["command"] for entry in server_stats["slowlog"]] == [
+        "GET missing",
+        "GET key:0",
+        "SET key:2 2",
+        "SET key:1 1",
+        "SET key:0 0",
+    ]
+
+
+def test_server_stats_option(pytester: pytest.Pytester, redis_proc: RedisExecutor) -> None:
+    """Check that slowest tests by redis server time are listed in the terminal summary."""
+    pytester.makeconftest("""
+        from pytest_redis.plugin import *  # noqa: F403
+        """)
+    pytester.makepyfile("""
+        def test_heavy(redisdb):
+            redisdb.set("key", "x" * 100000)
+            for _ in range(50):
+                redisdb.get("key")
+
+        def test_idle(redisdb):
+            pass
+        """)
+    result = pytester.runpytest(f"--redis-exec={redis_proc.executable}", "--redis-server-stats")
+    result.assert_outcomes(passed=2)
+    result.stdout.fnmatch_lines(
+        [
+            "*slowest tests by redis server time*",
+            "*us*slow (mostly *)  test_server_stats_option.py::test_heavy",
+            "*0us*0 slow (mostly -)  test_server_stats_option.py::test_idle",
+        ]
+    )
+
+
+def test_server_stats_recorded_before_cleanup(
+    pytester: pytest.Pytester, redis_proc: RedisExecutor
+) -> None:
+    """Check that stats leave out fixtures' setup and cleanup, and are marked on pooled servers."""
+    pytester.makeconftest("""
+        from pytest_redis import factories
+        from pytest_redis.plugin import *  # noqa: F403
+
+        redisdb_other = factories.redisdb("redis_proc", dbnum=1)
+        recorded = {}
+
+        def pytest_runtest_logreport(report):
+            if report.when == "teardown":
+                for name, value in report.user_properties:
+                    if name == "redis_server_stats":
+                        recorded.setdefault(report.nodeid.split("::")[-1], []).append(value)
+        """)
+    pytester.makepyfile("""
+        import pytest
+
+        from conftest import recorded
+
+        def test_two_clients(redisdb, redisdb_other):
+            redisdb.set("key", "value")
+            redisdb_other.set("key", "value")
+
+        @pytest.mark.redis(maxmemory="32mb")
+        def test_marked(redisdb):
+            redisdb.get("key")
+
+        def test_recorded():
+            [stats] = recorded["test_two_clients"]
+            assert set(stats["commands"]) == {"set"}
+            assert stats["commands"]["set"]["calls"] == 2
+            assert not stats["shared"]
+            assert [stats["shared"] for stats in recorded["test_marked"]] == [True]
+        """)
+    result = pytester.runpytest(f"--redis-exec={redis_proc.executable}", "--redis-server-stats")
+    result.assert_outcomes(passed=3)
+    result.stdout.fnmatch_lines(
+        ["*(mostly get)  test_server_stats_recorded_before_cleanup.py::test_marked  (shared*"]
+    )
@@ -0,0 +1,15 @@
+"""Tests for redis server listening on the unix socket only."""
+
+import redis
+
+from pytest_redis.executor import RedisExecutor
+
+
+def test_unixsocket_only(
+    redis_proc_unixsocket: RedisExecutor, redisdb_unixsocket: redis.Redis
+) -> None:
+    """Check that server listens on the unix socket only, and client uses it."""
+    assert redis_proc_unixsocket.port == 0
+    assert redisdb_unixsocket.config_get("port") == {"port": "0"}
+    redisdb_unixsocket.set("test", "unixsocket")
+    assert redisdb_unixsocket.get("test") == b"unixsocket"
@@ -0,0 +1,90 @@
+"""Tests for the redis-server shared between xdist workers."""
+
+import pytest
+from pytest import Config, FixtureRequest, Pytester, UsageError
+
+from pytest_redis.config import get_config
+from pytest_redis.executor import SharedRedis
+from pytest_redis.executor.shared import get_shared_slot
+from pytest_redis.factories import redis_proc
+
+
+@pytest.mark.parametrize("dbnum, db_index", ((0, 16), (3, 19), (7, 23)))
+def test_shared_redis_db_index(dbnum: int, db_index: int) -> None:
+    """Check that database numbers get translated into the worker's block of databases."""
+    shared_redis = SharedRedis(host="localhost", port=6379, db_offset=16, databases=8)
+    assert shared_redis.db_index(dbnum) == db_index
+
+
+def test_shared_redis_db_index_out_of_range() -> None:
+    """Check that worker can't reach the databases of the other workers."""
+    shared_redis = SharedRedis(host="localhost", port=6379, db_offset=16, databases=8)
+    with pytest.raises(ValueError):
+        shared_redis.db_index(8)
+
+
+def test_xdist_shared_server(request: FixtureRequest, pytester: Pytester) -> None:
+    """Check that xdist workers share one redis-server, each using its own databases."""
+    pytester.makeconftest("from pytest_redis.plugin import *  # noqa: F403")
+    pytester.makepyfile("""
+        import pytest
+
+        @pytest.mark.parametrize("value", range(4))
+        def test_shared(redis_proc, redisdb, value):
+            assert redisdb.config_get("databases") == {"databases": "64"}
+            assert redisdb.dbsize() == 0
+            redisdb.set("key", value)
+            db_index = redisdb.connection_pool.connection_kwargs["db"]
+            assert db_index == redis_proc.db_offset
+            assert db_index in (0, 32)
+        """)
+    result = pytester.runpytest(
+        "-n",
+        "2",
+        "--redis-xdist-shared",
+        f"--redis-exec={get_config(request)['exec']}",
+    )
+    result.assert_outcomes(passed=4)
+
+
+def test_shared_slot(pytestconfig: Config) -> None:
+    """Check that each process fixture gets its own slot, as long as there are any left."""
+    assert get_shared_slot(pytestconfig, "slot_a", 2) == 0
+    assert get_shared_slot(pytestconfig, "slot_b", 2) == 1
+    assert get_shared_slot(pytestconfig, "slot_a", 2) == 0
+    with pytest.raises(ValueError):
+        get_shared_slot(pytestconfig, "slot_c", 2)
+
+
+def test_xdist_shared_customised() -> None:
+    """Check that process fixture customising server options can't be shared explicitly."""
+    with pytest.raises(UsageError, match="password"):
+        redis_proc(xdist_shared=True, password="secret")
+
+
+def test_xdist_shared_fixtures(request: FixtureRequest, pytester: Pytester) -> None:
+    """Check that process fixtures get their own databases, unless they customise the server."""
+    pytester.makeconftest("""
+        from pytest_redis import factories
+        from pytest_redis.plugin import *  # noqa: F403
+
+        redis_proc2 = factories.redis_proc()
+        redisdb2 = factories.redisdb("redis_proc2")
+        redis_custom = factories.redis_proc(maxmemory="10mb")
+        """)
+    pytester.makepyfile("""
+        from pytest_redis.executor import SharedRedis
+
+        def test_shared(redis_proc, redis_proc2, redis_custom, redisdb, redisdb2):
+            assert redis_proc2.db_offset == redis_proc.db_offset + 8
+            redisdb.set("key", "value")
+            assert redisdb2.get("key") is None
+            assert not isinstance(redis_custom, SharedRedis)
+        """)
+    result = pytester.runpytest(
+        "-n",
+        "2",
+        "--redis-xdist-shared",
+        f"--redis-exec={get_config(request)['exec']}",
+    )
+    result.assert_outcomes(passed=1)